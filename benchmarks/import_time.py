@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Бенчмарк времени импорта точек входа (python -X importtime) с бюджетами.
+
+Для каждой точки входа из файла бюджетов (import_budgets.json) модуль импортируется в отдельном интерпретаторе,
+время импорта - минимум по нескольким запускам. Бюджет нарушен, если время превышает max_ms или при импорте
+загружен модуль из списка forbidden (тяжелые зависимости должны загружаться только при использовании функции).
+
+Использование:
+    python -m benchmarks.import_time [-n ЗАПУСКОВ] [--budgets ФАЙЛ] [модуль ...]
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+BUDGETS_FILE = Path(__file__).with_name('import_budgets.json')
+# Строка вывода -X importtime: "import time:   self [us] |   cumulative |   imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """
+    Время импорта одного модуля.
+    """
+
+    module: str
+    self_us: int  # собственное время импорта, мкс
+    cumulative_us: int  # время импорта с зависимостями, мкс
+    depth: int  # уровень вложенности импорта
+
+
+@dataclass
+class ImportMeasurement:
+    """
+    Результат измерения времени импорта точки входа.
+    """
+
+    module: str
+    total_ms: float  # время импорта (минимум по запускам), мс
+    loaded: List[str] = field(default_factory=list)  # загруженные модули
+    error: Optional[str] = None
+
+    def violations(self, max_ms: float, forbidden: Sequence[str]) -> List[str]:
+        """
+        Возвращает нарушения бюджета.
+
+        Args:
+            max_ms: Допустимое время импорта, мс
+            forbidden: Модули, которые не должны загружаться при импорте
+        """
+        if self.error:
+            return [self.error]
+        result = [f"загружен {name}" for name in forbidden if name in self.loaded]
+        if self.total_ms > max_ms:
+            result.append(f"{self.total_ms:.1f} мс > {max_ms} мс")
+        return result
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Разбирает вывод python -X importtime.
+
+    Args:
+        output: Поток ошибок интерпретатора
+
+    Returns:
+        List[ImportRecord]: Модули в порядке завершения импорта
+    """
+    records = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def measure(module: str, repeat: int = 5) -> ImportMeasurement:
+    """
+    Измеряет время импорта модуля в отдельном интерпретаторе.
+
+    Args:
+        module: Импортируемый модуль
+        repeat: Количество запусков
+
+    Returns:
+        ImportMeasurement: Результат измерения
+    """
+    totals = []
+    loaded: List[str] = []
+    for _ in range(max(1, repeat)):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True
+        )
+        records = parse_importtime(completed.stderr)
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'ошибка импорта'
+            return ImportMeasurement(module, 0.0, [record.module for record in records], error=error)
+        # время импорта точки входа - импорт верхнего пакета и модуля (без запуска интерпретатора)
+        top = module.split('.')[0]
+        totals.append(
+            sum(
+                record.cumulative_us
+                for record in records
+                if record.depth == 0 and (record.module == top or record.module.startswith(top + '.'))
+            )
+            / 1000
+        )
+        loaded = [record.module for record in records]
+    return ImportMeasurement(module, min(totals), loaded)
+
+
+def load_budgets(path: Path = BUDGETS_FILE) -> Dict[str, Dict]:
+    """
+    Загружает бюджеты времени импорта: {модуль: {"max_ms": ..., "forbidden": [...]}}.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа бенчмарка.
+
+    Returns:
+        int: Код возврата (0 - бюджеты соблюдены, 1 - есть нарушения)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time",
+        description="Бенчмарк времени импорта точек входа с бюджетами.",
+    )
+    parser.add_argument("modules", nargs="*", help="точки входа (по умолчанию - все из файла бюджетов)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="количество запусков")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE, help="файл бюджетов (JSON)")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets(args.budgets)
+    failed = 0
+    for module in args.modules or list(budgets):
+        budget = budgets.get(module, {})
+        measurement = measure(module, args.repeat)
+        violations = measurement.violations(budget.get('max_ms', float('inf')), budget.get('forbidden', []))
+        failed += bool(violations)
+        status = "OK" if not violations else "ПРЕВЫШЕН: " + "; ".join(violations)
+        print(f"{module:<50} {measurement.total_ms:8.1f} мс  (бюджет {budget.get('max_ms', '-')} мс)  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Бенчмарк памяти: байт на операцию для обычных (dataclass), компактных (__slots__) сущностей расчета
+и таблицы операций (ProcessTable, столбцовое хранение).
+
+Память измеряется через tracemalloc: учитываются операции, оборудование, процесс на одну деталь и процесс
+на производственную программу (со всеми Decimal-значениями расчета). Данные маршрута создаются до замера.
+
+Использование:
+    python -m benchmarks.memory --sizes 1000,100000
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.pipeline import synthetic_machine_catalog, synthetic_route
+from design_of_mechanical_production.core.entities import Operation, SlottedOperation
+from design_of_mechanical_production.core.factories import EQUIPMENT_REGISTRY, EquipmentFactory
+from design_of_mechanical_production.core.services import (
+    create_operations_from_data,
+    create_process_from_data,
+    create_process_table_from_data,
+)
+
+# Размеры синтетических маршрутов (количество операций)
+SIZES = (1_000, 100_000)
+
+
+@dataclass(frozen=True)
+class Variant:
+    """
+    Вариант представления сущностей расчета.
+    """
+
+    name: str
+    create: Callable[[List[Dict[str, Any]]], Any]  # создание операций по маршруту
+
+
+VARIANTS = (
+    Variant('dataclass', partial(create_operations_from_data, operation_type=Operation)),
+    Variant('slots', partial(create_operations_from_data, operation_type=SlottedOperation)),
+    Variant('table', create_process_table_from_data),
+)
+
+
+@dataclass(frozen=True)
+class MemoryResult:
+    """
+    Результат замера памяти.
+
+    Attributes:
+        variant: Вариант представления сущностей
+        size: Количество операций маршрута
+        operations_bytes: Байт на операцию (операции и оборудование)
+        route_bytes: Байт на операцию (процессы на одну деталь и на программу после расчета)
+    """
+
+    variant: str
+    size: int
+    operations_bytes: float
+    route_bytes: float
+
+
+def measure_memory(variant: Variant, route: List[Dict[str, Any]]) -> MemoryResult:
+    """
+    Измеряет память, занимаемую рассчитанным маршрутом (оборудование создается через подключенный каталог станков,
+    см. synthetic_machine_catalog).
+
+    Args:
+        variant: Вариант представления сущностей
+        route: Данные технологического процесса (см. synthetic_route)
+
+    Returns:
+        MemoryResult: Результат замера
+    """
+    EquipmentFactory.invalidate_cache()
+    EQUIPMENT_REGISTRY.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        operations = variant.create(route)
+        operations_bytes = tracemalloc.get_traced_memory()[0] - start
+        process = create_process_from_data(operations)
+        program = process.scale(Decimal("10000"))
+        program.calculate_required_machines()
+        route_bytes = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del operations, process, program
+    EquipmentFactory.invalidate_cache()
+    size = len(route)
+    return MemoryResult(variant.name, size, operations_bytes / size, route_bytes / size)
+
+
+def run_memory_benchmark(sizes: Sequence[int] = SIZES) -> List[MemoryResult]:
+    """
+    Измеряет память для всех вариантов на маршрутах заданных размеров.
+
+    Args:
+        sizes: Размеры маршрутов
+
+    Returns:
+        List[MemoryResult]: Результаты замеров
+    """
+    results = []
+    with synthetic_machine_catalog():
+        for size in sizes:
+            route = synthetic_route(size)
+            for variant in VARIANTS:
+                results.append(measure_memory(variant, route))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа бенчмарка.
+
+    Returns:
+        int: Код возврата
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Память на операцию для обычных и компактных сущностей и таблицы операций.",
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="размеры маршрутов через запятую")
+    args = parser.parse_args(argv)
+
+    print(f"{'вариант':<12}{'операций':>10}{'операции, байт/оп':>22}{'маршрут, байт/оп':>22}")
+    for result in run_memory_benchmark([int(size) for size in args.sizes.split(",")]):
+        print(f"{result.variant:<12}{result.size:>10}{result.operations_bytes:>22.0f}{result.route_bytes:>22.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
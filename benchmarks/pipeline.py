@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Бенчмарк расчетного конвейера: создание операций, техпроцесса, цеха и зон, запросы площадей, текстовый отчет.
+
+Расчет выполняется на синтетических маршрутах (по умолчанию 10, 1 000 и 100 000 операций), база станков заменена
+каталогом станков в памяти (synthetic_machine_catalog): оборудование создает EquipmentFactory через каталог.
+Результаты сохраняются как базовые (baselines/<имя>.json), при сравнении с базовыми результатами замедление больше
+порога считается регрессией.
+
+Использование:
+    python -m benchmarks.pipeline --save reference
+    python -m benchmarks.pipeline --compare reference --sizes 10,1000
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from design_of_mechanical_production.core.entities import MachineInfo
+from design_of_mechanical_production.core.factories import EquipmentFactory, WorkshopZoneFactory
+from design_of_mechanical_production.core.services import (
+    create_operations_from_data,
+    create_process_from_data,
+    create_workshop,
+)
+from design_of_mechanical_production.data.output import TextReportGenerator
+from design_of_mechanical_production.utils.machines.catalog import (
+    InMemoryMachineCatalog,
+    MachineRecord,
+    set_machine_catalog,
+)
+
+# Размеры синтетических маршрутов (количество операций)
+SIZES = (10, 1_000, 100_000)
+# Количество различных моделей станков в синтетическом маршруте
+MODELS_COUNT = 50
+# Каталог базовых результатов
+BASELINES_DIR = Path(__file__).with_name('baselines')
+# Допустимое замедление относительно базовых результатов
+REGRESSION_THRESHOLD = 1.25
+# Минимальная длительность одного замера, с (быстрые функции выполняются в цикле)
+MIN_SAMPLE_TIME = 0.02
+
+OPERATION_NAMES = ("Токарная с ЧПУ", "Расточная с ЧПУ", "Фрезерная с ЧПУ", "Сверлильная", "Шлифовальная")
+
+
+def synthetic_route(size: int, models_count: int = MODELS_COUNT, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Формирует синтетический маршрут в формате ExcelReader.read_process_data.
+
+    Args:
+        size: Количество операций
+        models_count: Количество различных моделей станков
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        List[Dict[str, Any]]: Данные технологического процесса
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            'number': f"{(index + 1) * 5:03d}",
+            'name': OPERATION_NAMES[index % len(OPERATION_NAMES)],
+            'time': round(rng.uniform(0.5, 30.0), 4),
+            'machine': f"МОДЕЛЬ-{rng.randrange(models_count):03d}",
+        }
+        for index in range(size)
+    ]
+
+
+def synthetic_catalog(models_count: int = MODELS_COUNT) -> InMemoryMachineCatalog:
+    """
+    Формирует каталог станков в памяти для моделей синтетического маршрута (габариты детерминированы моделью).
+
+    Args:
+        models_count: Количество различных моделей станков
+
+    Returns:
+        InMemoryMachineCatalog: Каталог станков
+    """
+    records = []
+    for index in range(models_count):
+        model = f"МОДЕЛЬ-{index:03d}"
+        size = Decimal(sum(map(ord, model)) % 7 + 1)
+        records.append(
+            MachineRecord(
+                name=model,
+                length=(Decimal("1.5") + size / 2) * 1000,
+                width=(Decimal("1.0") + size / 4) * 1000,
+                height=Decimal("1800"),
+                automation="ЧПУ",
+                weight=Decimal("1000") * size,
+                power=Decimal("5") * size,
+            )
+        )
+    return InMemoryMachineCatalog(records)
+
+
+@contextmanager
+def synthetic_machine_catalog(models_count: int = MODELS_COUNT) -> Iterator[InMemoryMachineCatalog]:
+    """
+    Подключает синтетический каталог станков на время блока: оборудование создает EquipmentFactory
+    через каталог (как при работе со снимком каталога), без базы данных. После блока подключается каталог
+    по умолчанию.
+
+    Args:
+        models_count: Количество различных моделей станков
+    """
+    catalog = synthetic_catalog(models_count)
+    set_machine_catalog(catalog)
+    try:
+        yield catalog
+    finally:
+        set_machine_catalog(None)
+
+
+def _operations(size: int) -> list:
+    EquipmentFactory.invalidate_cache()
+    return create_operations_from_data(synthetic_route(size))
+
+
+def _process(size: int):
+    return create_process_from_data(_operations(size))
+
+
+def _workshop(process):
+    return create_workshop(
+        process=process, name="Синтетический цех", production_volume=Decimal("10000"), mass_detail=Decimal("112.8")
+    )
+
+
+def _run_create_operations(route: List[Dict[str, Any]]) -> None:
+    EquipmentFactory.invalidate_cache()
+    create_operations_from_data(route)
+
+
+def _run_zone_factory(machines: Dict[str, MachineInfo]) -> None:
+    factory = WorkshopZoneFactory()
+    _, main_zone = factory.create_main_zone(machines)
+    total_machines_count = main_zone.accepted_machines_count
+    factory.create_tool_storage_zone(total_machines_count)
+    factory.create_equipment_warehouse_zone(total_machines_count)
+    factory.create_work_piece_storage_zone(main_zone.area)
+    factory.create_control_department_zone(total_machines_count)
+    factory.create_sanitary_zone()
+
+
+def _run_area_queries(workshop) -> None:
+    # Как при выводе отчета и окна результатов: многократные обращения к площадям после изменения данных
+    workshop.invalidate_cache()
+    for zone in workshop.zones.values():
+        zone.invalidate_cache()
+    for _ in range(20):
+        for zone in workshop.zones.values():
+            zone.area
+        workshop.total_area
+        workshop.required_area
+        workshop.required_area_main_zone
+        workshop.required_area_additional_zones
+
+
+def _run_write_report(workshop) -> None:
+    # Потоковая запись отчета с переносом строк (как при сохранении в файл)
+    with open(os.devnull, 'w', encoding='utf-8') as stream:
+        TextReportGenerator().write_report(workshop, stream)
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    Сценарий бенчмарка: подготовка данных (не измеряется) и измеряемое действие.
+    """
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+
+
+CASES = [
+    BenchmarkCase('create_operations', synthetic_route, _run_create_operations),
+    BenchmarkCase('create_process', _operations, create_process_from_data),
+    BenchmarkCase('create_workshop', _process, _workshop),
+    BenchmarkCase('zone_factory', lambda size: dict(_process(size).machines), _run_zone_factory),
+    BenchmarkCase('area_queries', lambda size: _workshop(_process(size)), _run_area_queries),
+    BenchmarkCase(
+        'generate_report', lambda size: _workshop(_process(size)), lambda w: TextReportGenerator().generate_report(w)
+    ),
+    BenchmarkCase('write_report', lambda size: _workshop(_process(size)), _run_write_report),
+]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Результат бенчмарка для одного сценария и размера маршрута (время одного выполнения, с).
+    """
+
+    case: str
+    size: int
+    best: float
+    median: float
+    number: int  # количество выполнений в одном замере
+    repeat: int  # количество замеров
+
+    @property
+    def key(self) -> str:
+        """Ключ результата в файле базовых результатов."""
+        return f"{self.case}[{self.size}]"
+
+
+def run_case(case: BenchmarkCase, size: int, repeat: int = 5) -> BenchmarkResult:
+    """
+    Выполняет сценарий бенчмарка.
+
+    Args:
+        case: Сценарий
+        size: Количество операций маршрута
+        repeat: Количество замеров
+
+    Returns:
+        BenchmarkResult: Время одного выполнения (лучшее и медианное по замерам)
+    """
+    state = case.setup(size)
+
+    def sample(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            case.run(state)
+        return time.perf_counter() - start
+
+    number = 1
+    while sample(number) < MIN_SAMPLE_TIME and number < 1_000_000:
+        number *= 10
+    timings = [sample(number) / number for _ in range(max(1, repeat))]
+    return BenchmarkResult(case.name, size, min(timings), statistics.median(timings), number, len(timings))
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = SIZES,
+    cases: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Выполняет сценарии бенчмарка для всех размеров маршрута.
+
+    Args:
+        sizes: Размеры маршрутов
+        cases: Названия сценариев (по умолчанию - все)
+        repeat: Количество замеров
+        on_result: Функция, вызываемая для каждого результата
+
+    Returns:
+        List[BenchmarkResult]: Результаты
+    """
+    results = []
+    with synthetic_machine_catalog():
+        for case in CASES:
+            if cases and case.name not in cases:
+                continue
+            for size in sizes:
+                result = run_case(case, size, repeat)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    return results
+
+
+def save_baseline(results: Sequence[BenchmarkResult], path: Path) -> None:
+    """
+    Сохраняет результаты как базовые.
+
+    Args:
+        results: Результаты
+        path: Файл базовых результатов (JSON)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {result.key: asdict(result) for result in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def compare_with_baseline(
+    results: Sequence[BenchmarkResult], path: Path, threshold: float = REGRESSION_THRESHOLD
+) -> Dict[str, float]:
+    """
+    Сравнивает результаты с базовыми.
+
+    Args:
+        results: Результаты
+        path: Файл базовых результатов (JSON)
+        threshold: Допустимое замедление (отношение лучших времен)
+
+    Returns:
+        Dict[str, float]: Регрессии {ключ результата: замедление}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    regressions = {}
+    for result in results:
+        if result.key in baseline and baseline[result.key]['best'] > 0:
+            ratio = result.best / baseline[result.key]['best']
+            if ratio > threshold:
+                regressions[result.key] = ratio
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    """Время в удобных единицах."""
+    for unit, scale in (("с", 1), ("мс", 1e-3), ("мкс", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} нс"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа бенчмарка.
+
+    Returns:
+        int: Код возврата (0 - регрессий нет, 1 - есть регрессии)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.pipeline", description="Бенчмарк расчетного конвейера на синтетических маршрутах."
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="размеры маршрутов через запятую")
+    parser.add_argument("--cases", default=None, help="сценарии через запятую: " + ", ".join(c.name for c in CASES))
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="количество замеров")
+    parser.add_argument("--save", metavar="ИМЯ", help="сохранить результаты как базовые (baselines/ИМЯ.json)")
+    parser.add_argument("--compare", metavar="ИМЯ", help="сравнить с базовыми результатами (baselines/ИМЯ.json)")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="допустимое замедление")
+    args = parser.parse_args(argv)
+
+    def print_result(result: BenchmarkResult) -> None:
+        print(f"{result.key:<32} лучшее {_format_time(result.best)}   медиана {_format_time(result.median)}")
+
+    results = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        cases=args.cases.split(",") if args.cases else None,
+        repeat=args.repeat,
+        on_result=print_result,
+    )
+    if args.save:
+        save_baseline(results, BASELINES_DIR / f"{args.save}.json")
+    if args.compare:
+        regressions = compare_with_baseline(results, BASELINES_DIR / f"{args.compare}.json", args.threshold)
+        for key, ratio in regressions.items():
+            print(f"РЕГРЕССИЯ {key}: медленнее базового результата в {ratio:.2f} раза")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
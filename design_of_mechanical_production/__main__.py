@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+import sys
+
 from design_of_mechanical_production.data.utils.file_system import (
     check_initial_data_file,
     create_initial_data_file,
@@ -14,7 +16,23 @@ def main():
     """
     Точка входа в приложение.
     Определяет режим запуска и запускает приложение в соответствующем режиме (с GUI или без).
+    Команда `batch` запускает пакетный расчет (см. design_of_mechanical_production.batch),
+    команда `sweep` - многовариантный расчет (см. design_of_mechanical_production.sweep),
+    команда `convert` - преобразование книг Excel в колоночный формат (см. design_of_mechanical_production.convert).
     """
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from design_of_mechanical_production.batch import main as batch_main
+
+        sys.exit(batch_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        from design_of_mechanical_production.sweep import main as sweep_main
+
+        sys.exit(sweep_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'convert':
+        from design_of_mechanical_production.convert import main as convert_main
+
+        sys.exit(convert_main(sys.argv[2:]))
+
     # Проверяем наличие необходимых директорий
     ensure_directories_exist()
     # Проверяем наличие файла с начальными данными
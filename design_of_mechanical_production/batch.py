@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Пакетный (неинтерактивный) расчет цехов по набору файлов начальных данных.
+
+Использование:
+    python -m design_of_mechanical_production.batch <каталог | шаблон | манифест> [-o КАТАЛОГ] [-j ПРОЦЕССОВ]
+        [--summary N]
+"""
+import argparse
+import csv
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from design_of_mechanical_production.core import create_workshop_from_data
+from design_of_mechanical_production.data.input import create_data_reader
+from design_of_mechanical_production.data.input.columnar_reader import is_columnar_dataset
+from design_of_mechanical_production.data.output import ReportSummary, TextReportGenerator
+
+# Расширения файлов начальных данных
+INPUT_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+# Расширения файлов-манифестов (по одному пути к файлу начальных данных в строке)
+MANIFEST_SUFFIXES = ('.txt', '.lst')
+# Имя файла сводной таблицы
+SUMMARY_FILE_NAME = 'summary.csv'
+
+
+@dataclass
+class BatchResult:
+    """
+    Результат расчета цеха по одному файлу начальных данных.
+    """
+
+    input_file: str
+    report_file: Optional[str] = None
+    name: Optional[str] = None
+    production_volume: Optional[Decimal] = None
+    total_machines_count: Optional[int] = None
+    required_area: Optional[Decimal] = None
+    total_area: Optional[Decimal] = None
+    length: Optional[Decimal] = None
+    width: Optional[Decimal] = None
+    elapsed: float = 0.0  # время расчета, с
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Расчет выполнен без ошибок."""
+        return self.error is None
+
+
+def collect_input_files(source: Union[str, Path]) -> List[Path]:
+    """
+    Формирует перечень файлов начальных данных.
+
+    Args:
+        source: Каталог (берутся все файлы Excel и вложенные наборы данных в колоночном формате),
+            шаблон пути (glob) или файл-манифест (.txt/.lst, по одному пути в строке; пустые строки и строки
+            с '#' пропускаются, относительные пути отсчитываются от каталога манифеста).
+            Путь к файлу Excel или к набору данных возвращается как есть.
+
+    Returns:
+        List[Path]: Отсортированный перечень файлов без повторов
+    """
+    path = Path(source)
+    if is_columnar_dataset(path):
+        files = [path]
+    elif path.is_dir():
+        files = [item for item in path.iterdir() if _is_input(item)]
+    elif path.is_file() and path.suffix.lower() in MANIFEST_SUFFIXES:
+        files = []
+        with open(path, 'r', encoding='utf-8') as manifest:
+            for line in manifest:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    item = Path(line)
+                    files.append(item if item.is_absolute() else path.parent / item)
+        return list(dict.fromkeys(files))
+    elif path.is_file():
+        files = [path]
+    else:
+        files = [Path(item) for item in glob.glob(str(source), recursive=True)]
+        files = [item for item in files if _is_input(item)]
+
+    # временные файлы Excel ('~$name.xlsx') не являются файлами данных
+    return sorted(dict.fromkeys(item for item in files if not item.name.startswith('~$')))
+
+
+def _is_input(path: Path) -> bool:
+    """Файл Excel или набор данных в колоночном формате."""
+    return (path.is_file() and path.suffix.lower() in INPUT_SUFFIXES) or is_columnar_dataset(path)
+
+
+def process_file(
+    input_file: Union[str, Path], report_file: Union[str, Path], summary: Optional[ReportSummary] = None
+) -> BatchResult:
+    """
+    Рассчитывает цех по одному файлу начальных данных и сохраняет отчет.
+    Исключения не пробрасываются, а фиксируются в результате.
+
+    Args:
+        input_file: Файл начальных данных
+        report_file: Файл отчета
+        summary: Параметры сводного отчета (None - полный отчет)
+
+    Returns:
+        BatchResult: Результат расчета
+    """
+    result = BatchResult(input_file=str(input_file))
+    start = time.perf_counter()
+    try:
+        reader = create_data_reader(input_file)
+        workshop = create_workshop_from_data(reader.read_parameters_data(), reader.read_process_data())
+
+        report_generator = TextReportGenerator(summary=summary)
+        if not report_generator.export_report(workshop, Path(report_file)):
+            raise OSError(f"Не удалось сохранить отчет {report_file}")
+
+        result.report_file = str(report_file)
+        result.name = workshop.name
+        result.production_volume = workshop.production_volume
+        result.total_machines_count = workshop.total_machines_count
+        result.required_area = workshop.required_area
+        result.total_area = workshop.total_area
+        result.length = workshop.length
+        result.width = workshop.width
+    except (Exception, SystemExit) as e:  # SystemExit: фабрика оборудования завершает работу, если станок не найден
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _report_files(input_files: Sequence[Path], output_dir: Path) -> List[Path]:
+    """Имена файлов отчетов (при совпадении имен входных файлов добавляется номер)."""
+    report_files = []
+    used: Dict[str, int] = {}
+    for input_file in input_files:
+        stem = input_file.stem
+        used[stem] = used.get(stem, 0) + 1
+        suffix = f"_{used[stem]}" if used[stem] > 1 else ""
+        report_files.append(output_dir / f"{stem}{suffix}_report.txt")
+    return report_files
+
+
+def write_summary(results: Iterable[BatchResult], filepath: Path) -> None:
+    """
+    Сохраняет сводную таблицу результатов в формате CSV.
+
+    Args:
+        results: Результаты расчета
+        filepath: Файл сводной таблицы
+    """
+    columns = [item.name for item in fields(BatchResult)]
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns + ['status'])
+        for result in results:
+            row = ['' if getattr(result, column) is None else getattr(result, column) for column in columns]
+            row[columns.index('elapsed')] = f"{result.elapsed:.3f}"
+            writer.writerow(row + ['ok' if result.ok else 'error'])
+
+
+def run_batch(
+    source: Union[str, Path, Sequence[Union[str, Path]]],
+    output_dir: Union[str, Path],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+    summary: Optional[ReportSummary] = None,
+) -> List[BatchResult]:
+    """
+    Рассчитывает цеха по набору файлов начальных данных в пуле процессов.
+    Ошибка в одном файле не прерывает расчет остальных.
+
+    Args:
+        source: Каталог, шаблон пути, манифест (см. collect_input_files) или перечень файлов
+        output_dir: Каталог для отчетов и сводной таблицы
+        workers: Количество процессов. None - по числу процессоров, 1 - расчет в текущем процессе
+        on_result: Функция, вызываемая по завершении расчета каждого файла
+        summary: Параметры сводного отчета (None - полный отчет)
+
+    Returns:
+        List[BatchResult]: Результаты в порядке входных файлов
+    """
+    if isinstance(source, (str, Path)):
+        input_files = collect_input_files(source)
+    else:
+        input_files = [Path(item) for item in source]
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_files = _report_files(input_files, output_dir)
+
+    workers = workers or os.cpu_count() or 1
+    results: List[Optional[BatchResult]] = [None] * len(input_files)
+    if workers == 1 or len(input_files) <= 1:
+        for index, (input_file, report_file) in enumerate(zip(input_files, report_files)):
+            results[index] = process_file(input_file, report_file, summary)
+            if on_result:
+                on_result(results[index])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(input_files))) as executor:
+            futures = {
+                executor.submit(process_file, input_file, report_file, summary): index
+                for index, (input_file, report_file) in enumerate(zip(input_files, report_files))
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:  # падение процесса-исполнителя
+                    results[index] = BatchResult(input_file=str(input_files[index]), error=f"{type(e).__name__}: {e}")
+                if on_result:
+                    on_result(results[index])
+
+    write_summary(results, output_dir / SUMMARY_FILE_NAME)
+    return results
+
+
+def _print_result(result: BatchResult) -> None:
+    """Выводит строку о результате расчета файла."""
+    status = "OK" if result.ok else f"ОШИБКА: {result.error}"
+    print(f"[{result.elapsed:8.2f} с] {result.input_file}: {status}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа пакетного режима.
+
+    Args:
+        argv: Аргументы командной строки (по умолчанию sys.argv[1:])
+
+    Returns:
+        int: Код возврата (0 - все файлы рассчитаны, 1 - есть ошибки)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m design_of_mechanical_production.batch",
+        description="Пакетный расчет цехов по набору файлов начальных данных.",
+    )
+    parser.add_argument(
+        "source", help="каталог с файлами Excel (наборами данных), шаблон пути (glob) или файл-манифест (.txt/.lst)"
+    )
+    parser.add_argument("-o", "--output", default="batch_reports", help="каталог для отчетов и сводной таблицы")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="количество процессов (по умолчанию - по числу ядер)"
+    )
+    parser.add_argument(
+        "--summary",
+        type=int,
+        default=None,
+        metavar="N",
+        help="сводный отчет: операции по видам и моделям станков, подробный расчет для N самых трудоемких операций, "
+        "расчет по каждой операции - в файле *_operations.csv рядом с отчетом",
+    )
+    args = parser.parse_args(argv)
+
+    summary = ReportSummary(top=args.summary) if args.summary is not None else None
+    start = time.perf_counter()
+    results = run_batch(args.source, args.output, workers=args.workers, on_result=_print_result, summary=summary)
+    failed = sum(1 for result in results if not result.ok)
+    print(
+        f"\nРассчитано файлов: {len(results) - failed} из {len(results)} за {time.perf_counter() - start:.2f} с."
+        f"\nСводная таблица: {Path(args.output) / SUMMARY_FILE_NAME}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Преобразование книг Excel начальных данных в наборы данных в колоночном формате (CSV, Parquet, Arrow IPC).
+
+Использование:
+    python -m design_of_mechanical_production.convert input/*.xlsx -f parquet
+"""
+import argparse
+from typing import Optional, Sequence
+
+from design_of_mechanical_production.data.input import convert_workbook
+from design_of_mechanical_production.data.input.columnar_reader import COLUMNAR_FORMATS
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа преобразования книг Excel.
+
+    Args:
+        argv: Аргументы командной строки (по умолчанию sys.argv[1:])
+
+    Returns:
+        int: Код возврата (0 - все книги преобразованы, 1 - есть ошибки)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m design_of_mechanical_production.convert",
+        description="Преобразование книг Excel начальных данных в колоночный формат. "
+        "Для каждой книги создается каталог (имя книги без расширения) с таблицами Parameters и Process.",
+    )
+    parser.add_argument("workbooks", nargs="+", help="файлы Excel")
+    parser.add_argument("-f", "--format", choices=list(COLUMNAR_FORMATS), default="parquet", help="формат таблиц")
+    parser.add_argument("-o", "--output", default=None, help="каталог набора данных (только для одной книги)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.workbooks) > 1:
+        parser.error("каталог набора данных (-o) задается только для одной книги")
+
+    failed = 0
+    for workbook in args.workbooks:
+        try:
+            print(f"{workbook} -> {convert_workbook(workbook, args.output, args.format)}")
+        except Exception as e:
+            failed += 1
+            print(f"{workbook}: ОШИБКА: {type(e).__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,10 +2,24 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from design_of_mechanical_production.core.entities.area_calculator import AreaCalculator, SpecificAreaCalculator
+from design_of_mechanical_production.core.entities.cache import CACHE_STATS, CacheStats, DerivedCache
+from design_of_mechanical_production.core.entities.compact import (
+    SlottedMachineInfo,
+    SlottedOperation,
+    SlottedScaledOperation,
+)
 from design_of_mechanical_production.core.entities.equipment import Equipment
 from design_of_mechanical_production.core.entities.machine_info import MachineInfo
-from design_of_mechanical_production.core.entities.operation import Operation
+from design_of_mechanical_production.core.entities.operation import Operation, ScaledOperation
 from design_of_mechanical_production.core.entities.process import Process
+from design_of_mechanical_production.core.entities.process_backend import (
+    DecimalProcessBackend,
+    ProcessBackend,
+    TableProcessBackend,
+    VectorizedProcessBackend,
+    select_backend,
+)
+from design_of_mechanical_production.core.entities.process_table import OperationView, ProcessTable
 from design_of_mechanical_production.core.entities.workshop import Workshop
 from design_of_mechanical_production.core.entities.workshop_zone import (
     BaseWorkshopZone,
@@ -16,10 +30,24 @@ from design_of_mechanical_production.core.entities.workshop_zone import (
 __all__ = [
     'AreaCalculator',
     'SpecificAreaCalculator',
+    'CACHE_STATS',
+    'CacheStats',
+    'DerivedCache',
     'Equipment',
     'MachineInfo',
     'Operation',
+    'ScaledOperation',
+    'SlottedMachineInfo',
+    'SlottedOperation',
+    'SlottedScaledOperation',
+    'OperationView',
+    'ProcessTable',
     'Process',
+    'ProcessBackend',
+    'DecimalProcessBackend',
+    'VectorizedProcessBackend',
+    'TableProcessBackend',
+    'select_backend',
     'Workshop',
     'BaseWorkshopZone',
     'SpecificWorkshopZone',
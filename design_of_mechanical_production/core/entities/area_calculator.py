@@ -6,7 +6,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Dict, Union
 
-from design_of_mechanical_production.core.interfaces import IAreaCalculator, IMachineInfo
+from design_of_mechanical_production.core.interfaces import IAreaCalculator, IEquipment, IMachineInfo
 
 
 class AreaCalculator(IAreaCalculator):
@@ -17,7 +17,7 @@ class AreaCalculator(IAreaCalculator):
     def __init__(self, passage_area: Decimal):
         self.passage_area = passage_area
 
-    def calculate_area(self, machines: Dict[str, IMachineInfo]) -> Decimal:
+    def calculate_area(self, machines: Dict[Union[IEquipment, str], IMachineInfo]) -> Decimal:
         area = Decimal('0')
         for machine in machines.values():
             if hasattr(machine.model, 'length') and hasattr(machine.model, 'width'):
@@ -39,5 +39,5 @@ class SpecificAreaCalculator(IAreaCalculator):
         self.specific_area = specific_area
         self.total_equipment_count = total_equipment_count
 
-    def calculate_area(self, machines: Dict[str, IMachineInfo]) -> Decimal:
+    def calculate_area(self, machines: Dict[Union[IEquipment, str], IMachineInfo]) -> Decimal:
         return self.specific_area * self.total_equipment_count
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class CacheStats:
+    """
+    Счетчики обращений к кэшу (для профилирования).
+    """
+
+    hits: int = 0  # значение взято из кэша
+    misses: int = 0  # значение рассчитано заново
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Доля обращений, обслуженных кэшем.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        """
+        Обнуляет счетчики.
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+# Суммарная статистика всех кэшей производных значений (цеха и зон)
+CACHE_STATS = CacheStats()
+
+
+class DerivedCache:
+    """
+    Кэш производных значений объекта.
+
+    Значение хранится вместе с отметкой состояния (stamp), при которой оно рассчитано. Если при обращении
+    отметка отличается, значение рассчитывается заново. Для значений, которые сбрасываются только явно (clear),
+    отметка не передается.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Tuple[Hashable, Any]] = {}
+        self.stats = CacheStats()
+
+    def get(self, key: str, calculate: Callable[[], T], stamp: Hashable = None) -> T:
+        """
+        Возвращает значение из кэша или рассчитывает его.
+
+        Args:
+            key: Название значения
+            calculate: Функция расчета значения
+            stamp: Отметка состояния, от которого зависит значение
+
+        Returns:
+            Значение
+        """
+        entry = self._values.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.stats.hits += 1
+            CACHE_STATS.hits += 1
+            return entry[1]
+
+        self.stats.misses += 1
+        CACHE_STATS.misses += 1
+        value = calculate()
+        self._values[key] = (stamp, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Сбрасывает все значения.
+        """
+        self._values.clear()
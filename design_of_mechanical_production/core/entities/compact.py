@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Компактные варианты сущностей расчета (без __dict__, поля хранятся в __slots__).
+
+Варианты сохраняют поля, расчет и интерфейсы исходных классов (IOperation, IMachineInfo),
+но занимают заметно меньше памяти: используются для длинных маршрутов и многократных расчетов (перебор параметров).
+Поля объявлены в __slots__, поэтому значения по умолчанию задаются в __init__ (dataclass(slots=True) доступен
+только с Python 3.10).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from math import ceil
+from typing import Optional, Union
+
+from design_of_mechanical_production.core.entities.operation import OperationCalculationMixin, ScaledOperationMixin
+from design_of_mechanical_production.core.interfaces import IEquipment, IMachineInfo, IOperation
+
+
+@dataclass(init=False)
+class SlottedOperation(OperationCalculationMixin, IOperation):
+    """
+    Операция технологического процесса без __dict__ (поля и расчет - как у Operation).
+    """
+
+    __slots__ = (
+        'number',
+        'name',
+        'time',
+        'equipment',
+        'calculated_equipment_count',
+        'fund_of_working',
+        'compliance_coefficient',
+        'progressivity_coefficient',
+        '_accepted_equipment_count',
+        '_load_factor',
+        '_percentage',
+    )
+
+    number: str
+    name: str
+    time: Decimal
+    equipment: IEquipment
+    calculated_equipment_count: Decimal  # Расчетное количество оборудования
+    fund_of_working: Decimal  # Действительный фонд времени работы одного станка, ч
+    compliance_coefficient: Decimal  # Коэффициент выполнения норм
+    progressivity_coefficient: Decimal  # Коэффициент прогрессивности технологии
+    _accepted_equipment_count: int  # Принятое количество станков (округленное вверх)
+    _load_factor: Decimal  # Коэффициент загрузки станков
+    _percentage: Optional[Decimal]  # Процентное соотношение операции
+
+    def __init__(
+        self,
+        number: str,
+        name: str,
+        time: Decimal,
+        equipment: IEquipment,
+        calculated_equipment_count: Decimal = Decimal('0'),
+        fund_of_working: Decimal = Decimal('4080'),
+        compliance_coefficient: Decimal = Decimal('1'),
+        progressivity_coefficient: Decimal = Decimal('1'),
+        _accepted_equipment_count: int = 0,
+        _load_factor: Decimal = Decimal('0'),
+        _percentage: Optional[Decimal] = None,
+    ) -> None:
+        if time <= 0:
+            raise ValueError("Время операции должно быть положительным")
+        self.number = number
+        self.name = name
+        self.time = time
+        self.equipment = equipment
+        self.calculated_equipment_count = calculated_equipment_count
+        self.fund_of_working = fund_of_working
+        self.compliance_coefficient = compliance_coefficient
+        self.progressivity_coefficient = progressivity_coefficient
+        self._accepted_equipment_count = _accepted_equipment_count
+        self._load_factor = _load_factor
+        self._percentage = _percentage
+
+    def scale(self, factor: Decimal) -> IOperation:
+        """
+        Создает компактную операцию на производственную программу (см. Operation.scale).
+
+        Args:
+            factor: Коэффициент масштабирования времени (объем производства)
+
+        Returns:
+            IOperation: Операция на производственную программу
+        """
+        return SlottedScaledOperation(base=self, time=self.time * factor, _percentage=self._percentage)
+
+
+@dataclass(init=False)
+class SlottedScaledOperation(ScaledOperationMixin, OperationCalculationMixin, IOperation):
+    """
+    Операция на производственную программу без __dict__ (поля и расчет - как у ScaledOperation).
+    """
+
+    __slots__ = (
+        'base',
+        'time',
+        'calculated_equipment_count',
+        'fund_of_working',
+        'compliance_coefficient',
+        'progressivity_coefficient',
+        '_accepted_equipment_count',
+        '_load_factor',
+        '_percentage',
+    )
+
+    base: IOperation  # Операция на одну деталь
+    time: Decimal
+    calculated_equipment_count: Decimal  # Расчетное количество оборудования
+    fund_of_working: Decimal  # Действительный фонд времени работы одного станка, ч
+    compliance_coefficient: Decimal  # Коэффициент выполнения норм
+    progressivity_coefficient: Decimal  # Коэффициент прогрессивности технологии
+    _accepted_equipment_count: int  # Принятое количество станков (округленное вверх)
+    _load_factor: Decimal  # Коэффициент загрузки станков
+    _percentage: Optional[Decimal]  # Процентное соотношение операции
+
+    def __init__(
+        self,
+        base: IOperation,
+        time: Decimal,
+        calculated_equipment_count: Decimal = Decimal('0'),
+        fund_of_working: Decimal = Decimal('4080'),
+        compliance_coefficient: Decimal = Decimal('1'),
+        progressivity_coefficient: Decimal = Decimal('1'),
+        _accepted_equipment_count: int = 0,
+        _load_factor: Decimal = Decimal('0'),
+        _percentage: Optional[Decimal] = None,
+    ) -> None:
+        self.base = base
+        self.time = time
+        self.calculated_equipment_count = calculated_equipment_count
+        self.fund_of_working = fund_of_working
+        self.compliance_coefficient = compliance_coefficient
+        self.progressivity_coefficient = progressivity_coefficient
+        self._accepted_equipment_count = _accepted_equipment_count
+        self._load_factor = _load_factor
+        self._percentage = _percentage
+
+
+@dataclass(init=False)
+class SlottedMachineInfo(IMachineInfo):
+    """
+    Информация о станке в зоне без __dict__ (поля - как у MachineInfo).
+    """
+
+    __slots__ = ('model', 'calculated_count')
+
+    model: Union[IEquipment, str]  # Название станка
+    calculated_count: Decimal  # Расчетное количество станков
+
+    def __init__(self, model: Union[IEquipment, str], calculated_count: Decimal) -> None:
+        if calculated_count < 0:
+            raise ValueError("Количество станков не может быть отрицательным")
+        self.model = model
+        self.calculated_count = calculated_count
+
+    @property
+    def accepted_count(self) -> int:
+        """
+        Возвращает принятое количество станков (округленное вверх).
+        """
+        return ceil(self.calculated_count)
@@ -10,10 +10,11 @@ from typing import Dict, Optional
 from design_of_mechanical_production.core.interfaces import IEquipment
 
 
-@dataclass
+@dataclass(frozen=True)
 class Equipment(IEquipment):
     """
     Класс, представляющий оборудование в цехе.
+    Оборудование неизменяемое и хешируемое: один объект модели используется всеми операциями (см. EquipmentRegistry).
     """
 
     name: Optional[str]
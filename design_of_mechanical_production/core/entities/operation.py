@@ -11,30 +11,20 @@ from typing import Optional
 from design_of_mechanical_production.core.interfaces import IEquipment, IOperation
 
 
-@dataclass
-class Operation(IOperation):
+class OperationCalculationMixin:
     """
-    Класс, представляющий операцию технологического процесса.
+    Расчет количества оборудования и доли трудоемкости операции.
+    Общий для операции на одну деталь и операции на производственную программу.
     """
 
-    number: str
-    name: str
-    time: Decimal
-    equipment: IEquipment
-    calculated_equipment_count: Decimal = Decimal('0')  # Расчетное количество оборудования
-    fund_of_working: Decimal = Decimal('4080')  # Действительный фонд времени работы одного станка, ч
-    compliance_coefficient: Decimal = Decimal('1')  # Коэффициент выполнения норм
-    progressivity_coefficient: Decimal = Decimal('1')  # Коэффициент прогрессивности технологии
-    _accepted_equipment_count: int = 0  # Принятое количество станков (округленное вверх)
-    _load_factor: Decimal = Decimal('0')  # Коэффициент загрузки станков
-    _percentage: Optional[Decimal] = None  # Процентное соотношение операции
+    # Без __dict__: поля хранятся в классах операций (в компактных вариантах - в __slots__)
+    __slots__ = ()
 
-    def __post_init__(self) -> None:
-        """
-        Инициализирует объект после создания.
-        """
-        if self.time <= 0:
-            raise ValueError("Время операции должно быть положительным")
+    calculated_equipment_count: Decimal
+    time: Decimal
+    _accepted_equipment_count: int
+    _load_factor: Decimal
+    _percentage: Optional[Decimal]
 
     @property
     def accepted_equipment_count(self) -> int:
@@ -43,8 +33,7 @@ class Operation(IOperation):
 
     @property
     def load_factor(self) -> Decimal:
-        """Возвращает коэффициент загрузки станков."""
-        self.calculate_load_factor()
+        """Возвращает коэффициент загрузки станков (пересчитывается при изменении количества оборудования)."""
         return self._load_factor
 
     @property
@@ -63,6 +52,21 @@ class Operation(IOperation):
         self._accepted_equipment_count = ceil(count)
         self.calculate_load_factor()
 
+    def assign_equipment_count(self, calculated: Decimal, accepted: int) -> None:
+        """
+        Устанавливает заранее рассчитанные количества оборудования (используется векторизованным расчетом).
+
+        Args:
+            calculated: Расчетное количество оборудования
+            accepted: Принятое количество оборудования
+        """
+        if accepted < 0:
+            raise ValueError("Принятое количество оборудования не может быть отрицательным")
+
+        self.calculated_equipment_count = calculated
+        self._accepted_equipment_count = accepted
+        self.calculate_load_factor()
+
     def calculate_load_factor(self) -> None:
         """
         Рассчитывает коэффициент загрузки станков по формуле:
@@ -87,3 +91,86 @@ class Operation(IOperation):
             self._percentage = (self.time / total_time) * Decimal('100')
         else:
             raise ValueError("Общее время не может быть отрицательным или нулевым")
+
+    def scale(self, factor: Decimal) -> IOperation:
+        """
+        Создает операцию на производственную программу: ссылается на эту операцию, время умножается на factor.
+
+        Args:
+            factor: Коэффициент масштабирования времени (объем производства)
+
+        Returns:
+            IOperation: Операция на производственную программу
+        """
+        return ScaledOperation(base=self, time=self.time * factor, _percentage=self._percentage)
+
+
+class ScaledOperationMixin:
+    """
+    Данные операции на производственную программу, которые берутся из операции на одну деталь.
+    """
+
+    __slots__ = ()
+
+    base: IOperation
+
+    @property
+    def number(self) -> str:
+        """Возвращает номер операции."""
+        return self.base.number
+
+    @property
+    def name(self) -> str:
+        """Возвращает наименование операции."""
+        return self.base.name
+
+    @property
+    def equipment(self) -> IEquipment:
+        """Возвращает оборудование операции."""
+        return self.base.equipment
+
+
+@dataclass
+class Operation(OperationCalculationMixin, IOperation):
+    """
+    Класс, представляющий операцию технологического процесса.
+    """
+
+    number: str
+    name: str
+    time: Decimal
+    equipment: IEquipment
+    calculated_equipment_count: Decimal = Decimal('0')  # Расчетное количество оборудования
+    fund_of_working: Decimal = Decimal('4080')  # Действительный фонд времени работы одного станка, ч
+    compliance_coefficient: Decimal = Decimal('1')  # Коэффициент выполнения норм
+    progressivity_coefficient: Decimal = Decimal('1')  # Коэффициент прогрессивности технологии
+    _accepted_equipment_count: int = 0  # Принятое количество станков (округленное вверх)
+    _load_factor: Decimal = Decimal('0')  # Коэффициент загрузки станков
+    _percentage: Optional[Decimal] = None  # Процентное соотношение операции
+
+    def __post_init__(self) -> None:
+        """
+        Инициализирует объект после создания.
+        """
+        if self.time <= 0:
+            raise ValueError("Время операции должно быть положительным")
+
+
+@dataclass
+class ScaledOperation(ScaledOperationMixin, OperationCalculationMixin, IOperation):
+    """
+    Операция технологического процесса на производственную программу.
+
+    Ссылается на операцию на одну деталь: номер, наименование и оборудование не копируются, а берутся из нее.
+    Хранит только масштабированное время и результаты расчета количества оборудования.
+    """
+
+    base: IOperation  # Операция на одну деталь
+    time: Decimal
+    calculated_equipment_count: Decimal = Decimal('0')  # Расчетное количество оборудования
+    fund_of_working: Decimal = Decimal('4080')  # Действительный фонд времени работы одного станка, ч
+    compliance_coefficient: Decimal = Decimal('1')  # Коэффициент выполнения норм
+    progressivity_coefficient: Decimal = Decimal('1')  # Коэффициент прогрессивности технологии
+    _accepted_equipment_count: int = 0  # Принятое количество станков (округленное вверх)
+    _load_factor: Decimal = Decimal('0')  # Коэффициент загрузки станков
+    _percentage: Optional[Decimal] = None  # Процентное соотношение операции
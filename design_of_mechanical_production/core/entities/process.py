@@ -3,12 +3,14 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
-from design_of_mechanical_production.core.entities import MachineInfo
-from design_of_mechanical_production.core.interfaces import IMachineInfo, IOperation, IProcess
+from design_of_mechanical_production.core.entities.process_backend import ProcessBackend, select_backend
+from design_of_mechanical_production.core.entities.process_table import ProcessTable
+from design_of_mechanical_production.core.interfaces import IEquipment, IMachineInfo, IOperation, IProcess
 from design_of_mechanical_production.settings import get_setting
 
 FUND_OF_WORKING = float(get_setting('fund_of_working'))
@@ -20,41 +22,57 @@ KP = Decimal(str(get_setting('kp')))
 class Process(IProcess):
     """
     Класс, представляющий технологический процесс.
+
+    Операции хранятся списком объектов или таблицей ProcessTable (столбцовое хранение для длинных маршрутов,
+    расчет во float64). Расчет и итоги процесса выполняет способ расчета, выбранный по хранению операций
+    (см. core.entities.process_backend).
     """
 
-    operations: List[IOperation] = field(default_factory=list)
+    operations: List[IOperation] = field(default_factory=list)  # список операций или ProcessTable
     _compliance_coefficient: Decimal = KV
     _progressivity_coefficient: Decimal = KP
     _fund_of_working: Decimal = FUND_OF_WORKING
-    _machines: Dict[str, IMachineInfo] = field(default_factory=dict)
+    _machines: Dict[IEquipment, IMachineInfo] = field(default_factory=dict)
+    vectorized: bool = False  # векторизованный расчет количества станков (numpy, float64)
+
+    # Служебные поля отслеживания изменений (не копируются при replace)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)  # номер актуального расчета
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)  # вложенность batch_update
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)  # отложенный пересчет
+    _listeners: List[Callable[[IProcess], None]] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    @property
+    def backend(self) -> ProcessBackend:
+        """
+        Способ расчета процесса (выбирается по хранению операций и флагу vectorized, см. select_backend).
+        """
+        return select_backend(self.operations, self.vectorized)
 
     def calculate_required_machines(self) -> None:
         """
         Рассчитывает необходимое количество станков по формуле:
         num_mach = operation.time/(fund_of_working * compliance_coefficient * progressivity_coefficient)
+        После расчета уведомляет подписчиков (см. subscribe).
+        """
+        self._calculate_required_machines()
+
+        self._dirty = False
+        self._revision += 1
+        for listener in list(self._listeners):
+            listener(self)
+
+    def _calculate_required_machines(self) -> None:
         """
-        machines: Dict[str, IMachineInfo] = {}
-        for operation in self.operations:
-            operation.fund_of_working = self.fund_of_working
-            operation.compliance_coefficient = self.compliance_coefficient
-            operation.progressivity_coefficient = self.progressivity_coefficient
-            time = Decimal(str(operation.time))
-            num_mach = time / (
-                Decimal(self.fund_of_working) * self.compliance_coefficient * self.progressivity_coefficient
-            )
-            operation.calculated_equipment_count = num_mach
-            operation.accept_count(num_mach)
-            if operation.equipment.model not in machines:
-                machines[operation.equipment.model] = MachineInfo(
-                    model=operation.equipment, calculated_count=Decimal('0')
-                )
-            machines[operation.equipment.model].calculated_count += num_mach
-        self._machines = machines
+        Рассчитывает необходимое количество станков выбранным способом расчета.
+        """
+        self._machines = self.backend.calculate_required_machines(
+            self.operations, self.fund_of_working, self.compliance_coefficient, self.progressivity_coefficient
+        )
 
     @property
-    def machines(self) -> Dict[str, IMachineInfo]:
+    def machines(self) -> Dict[IEquipment, IMachineInfo]:
         """
-        Количество станков по типам.
+        Количество станков по оборудованию.
         """
         return self._machines
 
@@ -63,35 +81,34 @@ class Process(IProcess):
         """
         Общее количество станков.
         """
-        return sum(op.accepted_equipment_count for op in self.operations)
+        return self.backend.accepted_machines_count(self.operations)
 
     @property
     def calculated_machines_count(self) -> Decimal:
         """
         Общее расчетное количество станков.
         """
-        return sum(op.calculated_equipment_count for op in self.operations)
+        return self.backend.calculated_machines_count(self.operations)
 
     @property
     def total_time(self) -> Decimal:
         """
         Общее время на выполнение всех операций.
         """
-        return sum(op.time for op in self.operations)
+        return self.backend.total_time(self.operations)
 
     @property
     def average_load_factor(self) -> Decimal:
         """
         Средний коэффициент загрузки станков.
         """
-        return sum(op.load_factor for op in self.operations) / len(self.operations) if self.operations else Decimal('0')
+        return self.backend.average_load_factor(self.operations)
 
     def calculate_percentage(self) -> None:
         """
         Рассчитывает долю от общей трудоемкости для каждой операции.
         """
-        for operation in self.operations:
-            operation.calculate_percentage(self.total_time)
+        self.backend.calculate_percentage(self.operations)
 
     def add_operation(self, operation: IOperation) -> None:
         """
@@ -103,6 +120,135 @@ class Process(IProcess):
         self.operations.append(operation)
         self.calculate_percentage()
 
+    def extend(self, operations: Iterable[IOperation]) -> None:
+        """
+        Добавляет операции в процесс. Доли операций пересчитываются один раз для всего набора
+        (в отличие от add_operation, который пересчитывает их после каждой операции).
+
+        Args:
+            operations: Операции для добавления
+        """
+        self.operations.extend(operations)
+        self.calculate_percentage()
+
+    @classmethod
+    def from_operations(cls, operations: Iterable[IOperation], **kwargs: Any) -> Process:
+        """
+        Создает технологический процесс из набора операций за один проход.
+
+        Args:
+            operations: Операции процесса
+            **kwargs: Остальные параметры процесса (коэффициенты, vectorized)
+
+        Returns:
+            Process: Технологический процесс
+        """
+        if isinstance(operations, ProcessTable):
+            # Таблица используется без копирования
+            process = cls(operations=operations, **kwargs)
+            process.calculate_percentage()
+            return process
+        process = cls(**kwargs)
+        process.extend(operations)
+        return process
+
+    def scale(self, factor: Decimal) -> Process:
+        """
+        Создает технологический процесс на производственную программу.
+        Операции нового процесса ссылаются на операции исходного (оборудование и данные операции не копируются),
+        время операций умножается на factor. Коэффициенты процесса сохраняются.
+        Операции на программу создает сама операция (см. Operation.scale, SlottedOperation.scale),
+        для таблицы операций создается таблица на программу (см. ProcessTable.scale).
+
+        Args:
+            factor: Коэффициент масштабирования времени (объем производства)
+
+        Returns:
+            Process: Технологический процесс на производственную программу
+        """
+        return replace(self, operations=self.backend.scale(self.operations, factor), _machines={})
+
+    @property
+    def revision(self) -> int:
+        """
+        Номер актуального расчета (увеличивается при каждом пересчете).
+        """
+        return self._revision
+
+    def subscribe(self, listener: Callable[[IProcess], None]) -> None:
+        """
+        Подписывает функцию на пересчет процесса.
+
+        Args:
+            listener: Функция, вызываемая с процессом после каждого пересчета
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[IProcess], None]) -> None:
+        """
+        Отписывает функцию от пересчета процесса.
+
+        Args:
+            listener: Функция, переданная в subscribe
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[Process]:
+        """
+        Откладывает пересчет до выхода из блока: изменение нескольких коэффициентов внутри блока
+        приводит к одному пересчету (и только если что-то изменилось).
+
+        Пример:
+            with process.batch_update():
+                process.compliance_coefficient = Decimal("1.1")
+                process.progressivity_coefficient = Decimal("1.3")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self.calculate_required_machines()
+
+    def update(
+        self,
+        fund_of_working: Optional[Decimal] = None,
+        compliance_coefficient: Optional[Decimal] = None,
+        progressivity_coefficient: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Изменяет коэффициенты процесса с одним пересчетом. Незаданные (None) коэффициенты не изменяются.
+
+        Args:
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+        """
+        with self.batch_update():
+            if fund_of_working is not None:
+                self.fund_of_working = fund_of_working
+            if compliance_coefficient is not None:
+                self.compliance_coefficient = compliance_coefficient
+            if progressivity_coefficient is not None:
+                self.progressivity_coefficient = progressivity_coefficient
+
+    def _set_coefficient(self, name: str, value: Decimal) -> None:
+        """
+        Устанавливает коэффициент и пересчитывает процесс (или откладывает пересчет внутри batch_update).
+        Если значение не изменилось и расчет актуален, пересчет не выполняется.
+        """
+        if getattr(self, name) == value and self._revision and not self._dirty:
+            return
+        setattr(self, name, value)
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.calculate_required_machines()
+
     @property
     def fund_of_working(self) -> Decimal:
         """
@@ -115,8 +261,7 @@ class Process(IProcess):
         """
         Устанавливает действительный фонд времени работы одного станка, ч
         """
-        self._fund_of_working = value
-        self.calculate_required_machines()
+        self._set_coefficient('_fund_of_working', value)
 
     @property
     def compliance_coefficient(self) -> Decimal:
@@ -130,8 +275,7 @@ class Process(IProcess):
         """
         Устанавливает коэффициент выполнения нормы.
         """
-        self._compliance_coefficient = value
-        self.calculate_required_machines()
+        self._set_coefficient('_compliance_coefficient', value)
 
     @property
     def progressivity_coefficient(self) -> Decimal:
@@ -145,5 +289,4 @@ class Process(IProcess):
         """
         Устанавливает коэффициент прогрессивности.
         """
-        self._progressivity_coefficient = value
-        self.calculate_required_machines()
+        self._set_coefficient('_progressivity_coefficient', value)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Способы расчета технологического процесса.
+
+Процесс (Process) не зависит от того, как хранятся операции: расчет количества станков, итоги процесса и
+масштабирование на программу выполняет способ расчета (ProcessBackend), выбранный по хранению операций:
+- DecimalProcessBackend - список операций, эталонный расчет в Decimal;
+- VectorizedProcessBackend - список операций, расчет количества станков через numpy (float64);
+- TableProcessBackend - таблица операций ProcessTable (столбцовое хранение, float64).
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Dict, List, Sequence, Tuple
+
+from design_of_mechanical_production.core.entities.machine_info import MachineInfo
+from design_of_mechanical_production.core.entities.process_table import ProcessTable
+from design_of_mechanical_production.core.interfaces import IEquipment, IMachineInfo, IOperation
+
+
+def group_by_equipment(operations: Sequence[IOperation]) -> Tuple[List[int], List[IEquipment]]:
+    """
+    Группирует операции по оборудованию (в порядке первого появления).
+    Группа определяется самим объектом оборудования: оборудование одной модели - один объект
+    (см. EquipmentRegistry), а неизменяемое Equipment сравнивается и хешируется по данным станка.
+
+    Args:
+        operations: Операции процесса
+
+    Returns:
+        Tuple[List[int], List[IEquipment]]: Номера групп операций и оборудование групп
+    """
+    groups: Dict[IEquipment, int] = {}  # {оборудование: номер группы}
+    model_ids: List[int] = []
+    for operation in operations:
+        model_ids.append(groups.setdefault(operation.equipment, len(groups)))
+    return model_ids, list(groups)
+
+
+def machines_by_equipment(
+    equipments: Sequence[IEquipment], counts: Sequence[Decimal]
+) -> Dict[IEquipment, IMachineInfo]:
+    """
+    Формирует количество станков по оборудованию.
+
+    Args:
+        equipments: Оборудование групп операций
+        counts: Расчетное количество станков групп
+
+    Returns:
+        Dict[IEquipment, IMachineInfo]: Информация о станках по оборудованию
+    """
+    return {
+        equipment: MachineInfo(model=equipment, calculated_count=count) for equipment, count in zip(equipments, counts)
+    }
+
+
+class ProcessBackend(ABC):
+    """
+    Способ расчета технологического процесса.
+    """
+
+    @abstractmethod
+    def calculate_required_machines(
+        self,
+        operations: Sequence[IOperation],
+        fund_of_working: Decimal,
+        compliance_coefficient: Decimal,
+        progressivity_coefficient: Decimal,
+    ) -> Dict[IEquipment, IMachineInfo]:
+        """
+        Рассчитывает количество станков по операциям по формуле:
+        num_mach = operation.time/(fund_of_working * compliance_coefficient * progressivity_coefficient)
+
+        Args:
+            operations: Операции процесса
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+
+        Returns:
+            Dict[IEquipment, IMachineInfo]: Информация о станках по оборудованию
+        """
+        ...
+
+    @abstractmethod
+    def total_time(self, operations: Sequence[IOperation]) -> Decimal:
+        """Общее время на выполнение всех операций."""
+        ...
+
+    @abstractmethod
+    def calculated_machines_count(self, operations: Sequence[IOperation]) -> Decimal:
+        """Общее расчетное количество станков."""
+        ...
+
+    @abstractmethod
+    def accepted_machines_count(self, operations: Sequence[IOperation]) -> int:
+        """Общее принятое количество станков."""
+        ...
+
+    @abstractmethod
+    def average_load_factor(self, operations: Sequence[IOperation]) -> Decimal:
+        """Средний коэффициент загрузки станков."""
+        ...
+
+    @abstractmethod
+    def calculate_percentage(self, operations: Sequence[IOperation]) -> None:
+        """Рассчитывает долю от общей трудоемкости для каждой операции."""
+        ...
+
+    @abstractmethod
+    def scale(self, operations: Sequence[IOperation], factor: Decimal) -> Sequence[IOperation]:
+        """
+        Создает операции на производственную программу (время умножается на factor).
+
+        Args:
+            operations: Операции процесса на одну деталь
+            factor: Коэффициент масштабирования времени (объем производства)
+
+        Returns:
+            Sequence[IOperation]: Операции на производственную программу
+        """
+        ...
+
+
+class DecimalProcessBackend(ProcessBackend):
+    """
+    Список операций, эталонный расчет в Decimal.
+    """
+
+    def calculate_required_machines(
+        self,
+        operations: Sequence[IOperation],
+        fund_of_working: Decimal,
+        compliance_coefficient: Decimal,
+        progressivity_coefficient: Decimal,
+    ) -> Dict[IEquipment, IMachineInfo]:
+        model_ids, equipments = group_by_equipment(operations)
+        model_counts = [Decimal('0')] * len(equipments)
+        for operation, model_id in zip(operations, model_ids):
+            operation.fund_of_working = fund_of_working
+            operation.compliance_coefficient = compliance_coefficient
+            operation.progressivity_coefficient = progressivity_coefficient
+            time = Decimal(str(operation.time))
+            num_mach = time / (Decimal(fund_of_working) * compliance_coefficient * progressivity_coefficient)
+            operation.calculated_equipment_count = num_mach
+            operation.accept_count(num_mach)
+            model_counts[model_id] += num_mach
+        return machines_by_equipment(equipments, model_counts)
+
+    def total_time(self, operations: Sequence[IOperation]) -> Decimal:
+        return sum(op.time for op in operations)
+
+    def calculated_machines_count(self, operations: Sequence[IOperation]) -> Decimal:
+        return sum(op.calculated_equipment_count for op in operations)
+
+    def accepted_machines_count(self, operations: Sequence[IOperation]) -> int:
+        return sum(op.accepted_equipment_count for op in operations)
+
+    def average_load_factor(self, operations: Sequence[IOperation]) -> Decimal:
+        return sum(op.load_factor for op in operations) / len(operations) if operations else Decimal('0')
+
+    def calculate_percentage(self, operations: Sequence[IOperation]) -> None:
+        total_time = self.total_time(operations)
+        for operation in operations:
+            operation.calculate_percentage(total_time)
+
+    def scale(self, operations: Sequence[IOperation], factor: Decimal) -> List[IOperation]:
+        return [operation.scale(factor) for operation in operations]
+
+
+class VectorizedProcessBackend(DecimalProcessBackend):
+    """
+    Список операций, расчет количества станков за один векторизованный проход (см. core.entities.vectorized).
+    Результаты совпадают с расчетом в Decimal с точностью float64.
+    """
+
+    def calculate_required_machines(
+        self,
+        operations: Sequence[IOperation],
+        fund_of_working: Decimal,
+        compliance_coefficient: Decimal,
+        progressivity_coefficient: Decimal,
+    ) -> Dict[IEquipment, IMachineInfo]:
+        # numpy импортируется только при включенном векторизованном расчете
+        from design_of_mechanical_production.core.entities.vectorized import calculate_required_machines_vectorized
+
+        model_ids, equipments = group_by_equipment(operations)
+        result = calculate_required_machines_vectorized(
+            times=[float(operation.time) for operation in operations],
+            model_ids=model_ids,
+            fund_of_working=float(fund_of_working),
+            compliance_coefficient=float(compliance_coefficient),
+            progressivity_coefficient=float(progressivity_coefficient),
+            models_count=len(equipments),
+        )
+
+        counts = zip(operations, result.calculated.tolist(), result.accepted.tolist())
+        for operation, calculated, accepted in counts:
+            operation.fund_of_working = fund_of_working
+            operation.compliance_coefficient = compliance_coefficient
+            operation.progressivity_coefficient = progressivity_coefficient
+            operation.assign_equipment_count(Decimal(repr(calculated)), accepted)
+
+        return machines_by_equipment(equipments, [Decimal(repr(count)) for count in result.model_calculated.tolist()])
+
+
+class TableProcessBackend(ProcessBackend):
+    """
+    Таблица операций ProcessTable: расчет и итоги процесса - свертки столбцов таблицы (float64).
+    """
+
+    def __init__(self, vectorized: bool = False):
+        """
+        Args:
+            vectorized: Выполнять расчет количества станков через numpy
+        """
+        self.vectorized = vectorized
+
+    def calculate_required_machines(
+        self,
+        operations: ProcessTable,
+        fund_of_working: Decimal,
+        compliance_coefficient: Decimal,
+        progressivity_coefficient: Decimal,
+    ) -> Dict[IEquipment, IMachineInfo]:
+        model_calculated = operations.calculate_required_machines(
+            fund_of_working, compliance_coefficient, progressivity_coefficient, self.vectorized
+        )
+        return machines_by_equipment(operations.equipments, model_calculated)
+
+    def total_time(self, operations: ProcessTable) -> Decimal:
+        return operations.total_time
+
+    def calculated_machines_count(self, operations: ProcessTable) -> Decimal:
+        return operations.calculated_machines_count
+
+    def accepted_machines_count(self, operations: ProcessTable) -> int:
+        return operations.accepted_machines_count
+
+    def average_load_factor(self, operations: ProcessTable) -> Decimal:
+        return operations.average_load_factor
+
+    def calculate_percentage(self, operations: ProcessTable) -> None:
+        operations.calculate_percentage()
+
+    def scale(self, operations: ProcessTable, factor: Decimal) -> ProcessTable:
+        return operations.scale(factor)
+
+
+DECIMAL_BACKEND = DecimalProcessBackend()
+VECTORIZED_BACKEND = VectorizedProcessBackend()
+TABLE_BACKEND = TableProcessBackend()
+VECTORIZED_TABLE_BACKEND = TableProcessBackend(vectorized=True)
+
+
+def select_backend(operations: Sequence[IOperation], vectorized: bool = False) -> ProcessBackend:
+    """
+    Выбирает способ расчета по хранению операций.
+
+    Args:
+        operations: Операции процесса (список или ProcessTable)
+        vectorized: Векторизованный расчет количества станков (numpy, float64)
+
+    Returns:
+        ProcessBackend: Способ расчета
+    """
+    if isinstance(operations, ProcessTable):
+        return VECTORIZED_TABLE_BACKEND if vectorized else TABLE_BACKEND
+    return VECTORIZED_BACKEND if vectorized else DECIMAL_BACKEND
@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Столбцовое хранение операций технологического процесса (для маршрутов из миллионов операций).
+
+Операции хранятся не объектами, а столбцами (array, float64 и целые): время, идентификатор наименования,
+идентификатор модели станка, расчетное и принятое количество станков, коэффициент загрузки и доля операции.
+Объекты операций (OperationView) создаются только при обращении и читают (изменяют) строку таблицы.
+Итоги процесса считаются одной сверткой столбца.
+
+Как и векторизованный расчет (см. core.entities.vectorized), расчет по таблице выполняется во float64:
+результаты совпадают с эталонным расчетом в Decimal с точностью float64.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal
+from math import ceil, fsum, isnan
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from design_of_mechanical_production.core.entities.operation import ScaledOperation
+from design_of_mechanical_production.core.interfaces import IEquipment, IOperation
+
+# Количество знаков, до которого округляется расчетное количество станков перед округлением вверх
+# (то же значение, что и в векторизованном расчете)
+CEIL_DECIMALS = 9
+# Доля операции не рассчитана
+NO_PERCENTAGE = float('nan')
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Значение столбца в Decimal (кратчайшее десятичное представление float)."""
+    return Decimal(repr(value))
+
+
+class OperationView(IOperation):
+    """
+    Операция - строка таблицы процесса. Данные не копируются: чтение и изменение выполняются в столбцах таблицы.
+    Коэффициенты расчета (фонд времени, коэффициенты выполнения норм и прогрессивности) общие для всей таблицы:
+    их изменение через операцию изменяет их для всех операций таблицы.
+    """
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: ProcessTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"OperationView(number={self.number!r}, name={self.name!r}, time={self.time!r})"
+
+    @property
+    def number(self) -> str:
+        """Номер операции."""
+        return self.table.numbers[self.index]
+
+    @property
+    def name(self) -> str:
+        """Наименование операции."""
+        return self.table.names[self.table.name_ids[self.index]]
+
+    @property
+    def time(self) -> Decimal:
+        """Время операции."""
+        return _to_decimal(self.table.times[self.index])
+
+    @property
+    def equipment(self) -> IEquipment:
+        """Оборудование операции."""
+        return self.table.equipments[self.table.model_ids[self.index]]
+
+    @property
+    def calculated_equipment_count(self) -> Decimal:
+        """Расчетное количество оборудования."""
+        return _to_decimal(self.table.calculated[self.index])
+
+    @calculated_equipment_count.setter
+    def calculated_equipment_count(self, value: Decimal) -> None:
+        self.table.calculated[self.index] = float(value)
+
+    @property
+    def fund_of_working(self) -> Decimal:
+        """Действительный фонд времени работы одного станка, ч (общий для таблицы)."""
+        return self.table.fund_of_working
+
+    @fund_of_working.setter
+    def fund_of_working(self, value: Decimal) -> None:
+        self.table.fund_of_working = value
+
+    @property
+    def compliance_coefficient(self) -> Decimal:
+        """Коэффициент выполнения норм (общий для таблицы)."""
+        return self.table.compliance_coefficient
+
+    @compliance_coefficient.setter
+    def compliance_coefficient(self, value: Decimal) -> None:
+        self.table.compliance_coefficient = value
+
+    @property
+    def progressivity_coefficient(self) -> Decimal:
+        """Коэффициент прогрессивности технологии (общий для таблицы)."""
+        return self.table.progressivity_coefficient
+
+    @progressivity_coefficient.setter
+    def progressivity_coefficient(self, value: Decimal) -> None:
+        self.table.progressivity_coefficient = value
+
+    @property
+    def accepted_equipment_count(self) -> int:
+        """Принятое количество станков."""
+        return self.table.accepted[self.index]
+
+    @property
+    def load_factor(self) -> Decimal:
+        """Коэффициент загрузки станков."""
+        return _to_decimal(self.table.load_factor[self.index])
+
+    @property
+    def percentage(self) -> Optional[Decimal]:
+        """Процентное соотношение операции."""
+        value = self.table.percentage[self.index]
+        return None if isnan(value) else _to_decimal(value)
+
+    def accept_count(self, count: Optional[Decimal]) -> None:
+        """Принимает количество оборудования (округляется вверх)."""
+        if count < 0:
+            raise ValueError("Принятое количество оборудования не может быть отрицательным")
+
+        # Сравнение с точностью столбца (расчетное количество хранится во float64)
+        if float(count) < self.table.calculated[self.index]:
+            raise ValueError("Принятое количество оборудования не может быть меньше расчетного")
+
+        self.table.accepted[self.index] = ceil(count)
+        self.calculate_load_factor()
+
+    def assign_equipment_count(self, calculated: Decimal, accepted: int) -> None:
+        """Устанавливает заранее рассчитанные количества оборудования."""
+        if accepted < 0:
+            raise ValueError("Принятое количество оборудования не может быть отрицательным")
+
+        self.table.calculated[self.index] = float(calculated)
+        self.table.accepted[self.index] = accepted
+        self.calculate_load_factor()
+
+    def calculate_load_factor(self) -> None:
+        """Рассчитывает коэффициент загрузки станков: К_З = С_Р / С_ПР."""
+        accepted = self.table.accepted[self.index]
+        self.table.load_factor[self.index] = self.table.calculated[self.index] / accepted if accepted > 0 else 0.0
+
+    def calculate_percentage(self, total_time: Decimal) -> None:
+        """Рассчитывает процентное соотношение операции."""
+        if total_time > 0:
+            self.table.percentage[self.index] = self.table.times[self.index] / float(total_time) * 100.0
+        else:
+            raise ValueError("Общее время не может быть отрицательным или нулевым")
+
+    def scale(self, factor: Decimal) -> IOperation:
+        """Создает операцию на производственную программу (для процесса целиком - см. ProcessTable.scale)."""
+        return ScaledOperation(base=self, time=self.time * factor, _percentage=self.percentage)
+
+
+@dataclass(eq=False)
+class ProcessTable(Sequence[IOperation]):
+    """
+    Таблица операций технологического процесса (столбцовое хранение).
+
+    Наименования операций и оборудование хранятся один раз (справочники names и equipments),
+    в строках - только их идентификаторы.
+    """
+
+    numbers: List[str] = field(default_factory=list)  # номера операций
+    name_ids: array = field(default_factory=lambda: array('i'))  # идентификаторы наименований операций
+    times: array = field(default_factory=lambda: array('d'))  # время операций
+    model_ids: array = field(default_factory=lambda: array('i'))  # идентификаторы моделей станков
+    calculated: array = field(default_factory=lambda: array('d'))  # расчетное количество станков
+    accepted: array = field(default_factory=lambda: array('q'))  # принятое количество станков
+    load_factor: array = field(default_factory=lambda: array('d'))  # коэффициент загрузки станков
+    percentage: array = field(default_factory=lambda: array('d'))  # доля операции, % (nan - не рассчитана)
+    names: List[str] = field(default_factory=list)  # справочник наименований операций
+    equipments: List[IEquipment] = field(default_factory=list)  # справочник оборудования
+    # Коэффициенты последнего расчета (общие для всех операций)
+    fund_of_working: Decimal = Decimal('4080')
+    compliance_coefficient: Decimal = Decimal('1')
+    progressivity_coefficient: Decimal = Decimal('1')
+    # Индексы справочников: {наименование: идентификатор}, {оборудование: идентификатор}
+    _name_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    _model_index: Dict[IEquipment, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    @overload
+    def __getitem__(self, index: int) -> IOperation: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[IOperation]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[IOperation, List[IOperation]]:
+        if isinstance(index, slice):
+            return [OperationView(self, position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Номер строки вне таблицы")
+        return OperationView(self, index)
+
+    def __iter__(self) -> Iterator[IOperation]:
+        for index in range(len(self)):
+            yield OperationView(self, index)
+
+    def append_row(self, number: str, name: str, time: Union[Decimal, float], equipment: IEquipment) -> None:
+        """
+        Добавляет строку (операцию) в таблицу.
+
+        Args:
+            number: Номер операции
+            name: Наименование операции
+            time: Время операции
+            equipment: Оборудование операции
+        """
+        if time <= 0:
+            raise ValueError("Время операции должно быть положительным")
+
+        name_id = self._name_index.get(name)
+        if name_id is None:
+            name_id = self._name_index[name] = len(self.names)
+            self.names.append(name)
+        model_id = self._model_index.get(equipment)
+        if model_id is None:
+            model_id = self._model_index[equipment] = len(self.equipments)
+            self.equipments.append(equipment)
+
+        self.numbers.append(number)
+        self.name_ids.append(name_id)
+        self.times.append(float(time))
+        self.model_ids.append(model_id)
+        self.calculated.append(0.0)
+        self.accepted.append(0)
+        self.load_factor.append(0.0)
+        self.percentage.append(NO_PERCENTAGE)
+
+    def append(self, operation: IOperation) -> None:
+        """
+        Добавляет операцию в таблицу (данные операции копируются в строку).
+
+        Args:
+            operation: Операция
+        """
+        self.append_row(operation.number, operation.name, operation.time, operation.equipment)
+
+    def extend(self, operations: Iterable[IOperation]) -> None:
+        """
+        Добавляет операции в таблицу.
+
+        Args:
+            operations: Операции
+        """
+        for operation in operations:
+            self.append(operation)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> ProcessTable:
+        """
+        Создает таблицу из строк (номер, наименование, время, оборудование) без создания объектов операций.
+
+        Args:
+            rows: Строки таблицы
+
+        Returns:
+            ProcessTable: Таблица операций
+        """
+        table = cls()
+        for number, name, time, equipment in rows:
+            table.append_row(number, name, time, equipment)
+        return table
+
+    @property
+    def total_time(self) -> Decimal:
+        """Общее время операций."""
+        return _to_decimal(fsum(self.times))
+
+    @property
+    def calculated_machines_count(self) -> Decimal:
+        """Общее расчетное количество станков."""
+        return _to_decimal(fsum(self.calculated))
+
+    @property
+    def accepted_machines_count(self) -> int:
+        """Общее принятое количество станков."""
+        return sum(self.accepted)
+
+    @property
+    def average_load_factor(self) -> Decimal:
+        """Средний коэффициент загрузки станков."""
+        return _to_decimal(fsum(self.load_factor) / len(self)) if len(self) else Decimal('0')
+
+    def calculate_percentage(self) -> None:
+        """
+        Рассчитывает долю от общей трудоемкости для каждой операции.
+        """
+        total_time = fsum(self.times)
+        if len(self) and total_time <= 0:
+            raise ValueError("Общее время не может быть отрицательным или нулевым")
+        if len(self):
+            scale = 100.0 / total_time
+            self.percentage = array('d', [time * scale for time in self.times])
+
+    def calculate_required_machines(
+        self,
+        fund_of_working: Decimal,
+        compliance_coefficient: Decimal,
+        progressivity_coefficient: Decimal,
+        vectorized: bool = False,
+    ) -> List[Decimal]:
+        """
+        Рассчитывает количество станков по формуле:
+        num_mach = time/(fund_of_working * compliance_coefficient * progressivity_coefficient)
+
+        Args:
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+            vectorized: Выполнить расчет через numpy (см. core.entities.vectorized)
+
+        Returns:
+            List[Decimal]: Расчетное количество станков по оборудованию (в порядке справочника equipments)
+        """
+        self.fund_of_working = fund_of_working
+        self.compliance_coefficient = compliance_coefficient
+        self.progressivity_coefficient = progressivity_coefficient
+        if vectorized:
+            model_calculated = self._calculate_vectorized()
+        else:
+            model_calculated = self._calculate()
+        return [_to_decimal(count) for count in model_calculated]
+
+    def _calculate(self) -> List[float]:
+        """
+        Расчет количества станков без numpy (один проход по столбцу времени).
+        """
+        denominator = (
+            float(self.fund_of_working) * float(self.compliance_coefficient) * float(self.progressivity_coefficient)
+        )
+        calculated = array('d', [time / denominator for time in self.times])
+        accepted = array('q', [ceil(round(count, CEIL_DECIMALS)) for count in calculated])
+        self.calculated = calculated
+        self.accepted = accepted
+        self.load_factor = array('d', [c / a if a > 0 else 0.0 for c, a in zip(calculated, accepted)])
+
+        model_calculated = [0.0] * len(self.equipments)
+        for model_id, count in zip(self.model_ids, calculated):
+            model_calculated[model_id] += count
+        return model_calculated
+
+    def _calculate_vectorized(self) -> List[float]:
+        """
+        Расчет количества станков через numpy (столбцы передаются в numpy без копирования).
+        """
+        import numpy as np
+
+        from design_of_mechanical_production.core.entities.vectorized import calculate_required_machines_vectorized
+
+        result = calculate_required_machines_vectorized(
+            times=np.frombuffer(self.times, dtype=np.float64),
+            model_ids=np.frombuffer(self.model_ids, dtype=np.intc),
+            fund_of_working=float(self.fund_of_working),
+            compliance_coefficient=float(self.compliance_coefficient),
+            progressivity_coefficient=float(self.progressivity_coefficient),
+            models_count=len(self.equipments),
+        )
+        self.calculated = array('d', result.calculated.tobytes())
+        self.accepted = array('q', result.accepted.astype(np.int64).tobytes())
+        self.load_factor = array('d', result.load_factor.tobytes())
+        return result.model_calculated.tolist()
+
+    def scale(self, factor: Decimal) -> ProcessTable:
+        """
+        Создает таблицу операций на производственную программу: время умножается на factor.
+        Столбцы и справочники копируются: добавление операций в новую таблицу не изменяет исходную.
+
+        Args:
+            factor: Коэффициент масштабирования времени (объем производства)
+
+        Returns:
+            ProcessTable: Таблица операций на производственную программу
+        """
+        factor = float(factor)
+        size = len(self)
+        return ProcessTable(
+            numbers=list(self.numbers),
+            name_ids=array('i', self.name_ids),
+            times=array('d', [time * factor for time in self.times]),
+            model_ids=array('i', self.model_ids),
+            calculated=array('d', bytes(8 * size)),
+            accepted=array('q', bytes(8 * size)),
+            load_factor=array('d', bytes(8 * size)),
+            percentage=array('d', self.percentage),
+            names=list(self.names),
+            equipments=list(self.equipments),
+            fund_of_working=self.fund_of_working,
+            compliance_coefficient=self.compliance_coefficient,
+            progressivity_coefficient=self.progressivity_coefficient,
+            _name_index=dict(self._name_index),
+            _model_index=dict(self._model_index),
+        )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Векторизованный (numpy, float64) расчет количества станков по технологическому процессу.
+
+Эталоном остается расчет в Decimal (Process.calculate_required_machines). Векторизованный расчет включается
+флагом Process.vectorized и предназначен для длинных техпроцессов и многовариантных расчетов.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Количество знаков, до которого округляется расчетное количество станков перед округлением вверх.
+# Убирает погрешность float (например, 2.0000000000000004 -> 2), чтобы принятое количество совпадало с Decimal.
+CEIL_DECIMALS = 9
+
+
+@dataclass(frozen=True)
+class RequiredMachinesArrays:
+    """
+    Результат векторизованного расчета количества станков.
+
+    Attributes:
+        calculated: Расчетное количество станков по операциям
+        accepted: Принятое количество станков по операциям (округленное вверх)
+        load_factor: Коэффициент загрузки станков по операциям
+        model_calculated: Расчетное количество станков по моделям (индекс - идентификатор модели)
+    """
+
+    calculated: np.ndarray
+    accepted: np.ndarray
+    load_factor: np.ndarray
+    model_calculated: np.ndarray
+
+
+def calculate_required_machines_vectorized(
+    times: Sequence[float],
+    model_ids: Sequence[int],
+    fund_of_working: float,
+    compliance_coefficient: float,
+    progressivity_coefficient: float,
+    models_count: Optional[int] = None,
+) -> RequiredMachinesArrays:
+    """
+    Рассчитывает количество станков за один проход по столбцам времени операций и идентификаторов моделей:
+    num_mach = time/(fund_of_working * compliance_coefficient * progressivity_coefficient)
+
+    Args:
+        times: Время операций
+        model_ids: Идентификаторы моделей станков (целые числа от 0)
+        fund_of_working: Действительный фонд времени работы одного станка, ч
+        compliance_coefficient: Коэффициент выполнения нормы
+        progressivity_coefficient: Коэффициент прогрессивности
+        models_count: Количество моделей (по умолчанию - максимальный идентификатор + 1)
+
+    Returns:
+        RequiredMachinesArrays: Результат расчета
+    """
+    times = np.asarray(times, dtype=np.float64)
+    model_ids = np.asarray(model_ids, dtype=np.intp)
+
+    calculated = times / (float(fund_of_working) * float(compliance_coefficient) * float(progressivity_coefficient))
+    accepted = np.ceil(np.round(calculated, CEIL_DECIMALS)).astype(np.int64)
+    load_factor = np.divide(calculated, accepted, out=np.zeros_like(calculated), where=accepted > 0)
+    model_calculated = np.bincount(model_ids, weights=calculated, minlength=models_count or 0)
+
+    return RequiredMachinesArrays(
+        calculated=calculated,
+        accepted=accepted,
+        load_factor=load_factor,
+        model_calculated=model_calculated,
+    )
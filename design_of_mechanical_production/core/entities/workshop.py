@@ -3,18 +3,18 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Callable, Dict, Hashable, Optional
 
+from design_of_mechanical_production.core.entities import CacheStats, DerivedCache
 from design_of_mechanical_production.core.interfaces import (
     IProcess,
     ISpecificWorkshopZone,
     IWorkshop,
     IWorkshopZone,
 )
-from design_of_mechanical_production.settings import get_setting
+from design_of_mechanical_production.settings import SettingsSnapshot, settings_snapshot
 
 
 @dataclass
@@ -32,28 +32,101 @@ class Workshop(IWorkshop):
     process_for_one_detail: IProcess  # процесс на одну деталь
     process_for_program: Optional[IProcess] = None  # процесс на производственную программу
     zones: Dict[str, IWorkshopZone] = field(default_factory=dict)
-    span_width: Decimal = Decimal(str(get_setting('workshop_span')))  # ширина пролетов
-    span_number: Decimal = Decimal(str(get_setting('workshop_nam')))  # количество пролетов
+    span_width: Optional[Decimal] = None  # ширина пролетов (по умолчанию - из настроек)
+    span_number: Optional[Decimal] = None  # количество пролетов (по умолчанию - из настроек)
     length: Decimal = Decimal("0")  # длина пролетов
+    # Снимок настроек, по которым рассчитывается цех (по умолчанию - текущие настройки)
+    settings: Optional[SettingsSnapshot] = field(default=None, repr=False, compare=False)
 
     _total_area: Decimal = Decimal("0")
     _required_area: Decimal = Decimal("0")
     _calculated_length: Decimal = Decimal("0")
 
+    # Функции пересчета зон, зависящих от процесса (в порядке добавления зон): {название зоны: функция}
+    _zone_updaters: Dict[str, Callable[[IWorkshop], None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Длина, рассчитанная по умолчанию (если длина не менялась вручную, она пересчитывается вместе с зонами)
+    _default_length: Optional[Decimal] = field(default=None, init=False, repr=False, compare=False)
+    # Кэш площадей цеха (значения проверяются по состоянию зон, длине и настройкам)
+    _cache: DerivedCache = field(default_factory=DerivedCache, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """
         После инициализации цеха, расчитывается технологический процесс на производственную программу.
         """
+        if self.settings is None:
+            self.settings = settings_snapshot()
+        if self.span_width is None:
+            self.span_width = self.settings.workshop_span
+        if self.span_number is None:
+            self.span_number = self.settings.workshop_nam
         self.recalculate_process_for_program()
 
     def recalculate_process_for_program(self) -> None:
         """
         Пересчитывает технологический процесс на производственную программу.
+        Процесс на программу ссылается на операции и оборудование процесса на одну деталь (без копирования).
         """
-        self.process_for_program = copy.deepcopy(self.process_for_one_detail)
-        for operation in self.process_for_program.operations:
-            operation.time = operation.time * Decimal(str(self.production_volume))
+        if self.process_for_program is not None:
+            self.process_for_program.unsubscribe(self._on_process_changed)
+        self.process_for_program = self.process_for_one_detail.scale(Decimal(str(self.production_volume)))
         self.process.calculate_required_machines()
+        self.process.subscribe(self._on_process_changed)
+        self.refresh_zones()
+
+    def update(
+        self,
+        production_volume: Optional[Decimal] = None,
+        fund_of_working: Optional[Decimal] = None,
+        compliance_coefficient: Optional[Decimal] = None,
+        progressivity_coefficient: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Изменяет объем производства и (или) коэффициенты процесса.
+        Процесс, зависимые зоны и длина цеха пересчитываются один раз. Незаданные (None) параметры не изменяются.
+
+        Args:
+            production_volume: Годовой объем производства
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+        """
+        coefficients = {
+            name: value
+            for name, value in (
+                ('fund_of_working', fund_of_working),
+                ('compliance_coefficient', compliance_coefficient),
+                ('progressivity_coefficient', progressivity_coefficient),
+            )
+            if value is not None
+        }
+        if coefficients:
+            self.process_for_one_detail.update(**coefficients)
+
+        if production_volume is not None and Decimal(str(production_volume)) != Decimal(str(self.production_volume)):
+            self.production_volume = production_volume
+            self.recalculate_process_for_program()
+        elif coefficients:
+            self.process.update(**coefficients)
+
+    def refresh_zones(self) -> None:
+        """
+        Пересчитывает зоны, зависящие от процесса (в порядке добавления), и длину цеха по умолчанию.
+        """
+        if not self._zone_updaters:
+            return
+        for name, updater in self._zone_updaters.items():
+            updater(self)
+            self.zones[name].invalidate_cache()
+        if self._default_length is not None and self.length == self._default_length:
+            self.default_calculate_length()
+
+    def _on_process_changed(self, process: IProcess) -> None:
+        """
+        Обработчик пересчета процесса на программу.
+        """
+        self.refresh_zones()
 
     @property
     def total_machines_count(self) -> int:
@@ -71,36 +144,60 @@ class Workshop(IWorkshop):
         """
         Общая площадь цеха.
         """
-        self._calculate_total_area()
-        return self._total_area
+        return self._cache.get('total_area', self._calculate_total_area, (self.settings, self.length))
 
     @property
     def required_area(self) -> Decimal:
         """
         Общая площадь цеха.
         """
-        self._calculate_required_area()
-        return self._required_area
+        return self._cache.get('required_area', self._calculate_required_area, self._zones_stamp())
 
     @property
     def required_area_main_zone(self) -> Decimal:
         """
         Общая площадь основных зон цеха.
         """
-        total_area = Decimal("0")
-        for zone in self.zones.values():
-            if zone.tokens["group"] == "main":
-                total_area += zone.area
-        return total_area
+        return self._cache.get('required_area_main_zone', lambda: self._sum_zones_area("main"), self._zones_stamp())
 
     @property
     def required_area_additional_zones(self) -> Decimal:
         """
         Общая площадь дополнительных зон цеха.
         """
+        return self._cache.get(
+            'required_area_additional_zones', lambda: self._sum_zones_area("additional"), self._zones_stamp()
+        )
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """
+        Счетчики обращений к кэшу площадей цеха.
+        """
+        return self._cache.stats
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированные площади цеха.
+        """
+        self._cache.clear()
+
+    def _zones_stamp(self) -> Hashable:
+        """
+        Отметка состояния зон: состав зон и номера их состояний.
+        """
+        return tuple((name, id(zone), zone.revision) for name, zone in self.zones.items())
+
+    def _sum_zones_area(self, group: str) -> Decimal:
+        """
+        Суммирует площади зон группы.
+
+        Args:
+            group: Группа зон ("main" или "additional")
+        """
         total_area = Decimal("0")
         for zone in self.zones.values():
-            if zone.tokens["group"] == "additional":
+            if zone.tokens["group"] == group:
                 total_area += zone.area
         return total_area
 
@@ -125,19 +222,19 @@ class Workshop(IWorkshop):
         """
         return self.span_width * self.span_number
 
-    def _calculate_total_area(self) -> None:
+    def _calculate_total_area(self) -> Decimal:
         """
         Рассчитывает общую площадь цеха.
         Итоговая площадь рассчитывается как (ширина пролета * количество пролетов) * длину пролета
         Длина пролета рассчитывается как required_area / (ширина пролета * количество пролетов)
         Общая площадь округляется в большую сторону до числа, кратного 6
         """
-        # Получаем настройки из конфигурации
-        width_span = Decimal(str(get_setting('workshop_span')))
-        number_spans = Decimal(str(get_setting('workshop_nam')))
+        width_span = self.settings.workshop_span
+        number_spans = self.settings.workshop_nam
         self._total_area = (width_span * number_spans) * self.length
+        return self._total_area
 
-    def _calculate_required_area(self) -> None:
+    def _calculate_required_area(self) -> Decimal:
         """
         Рассчитывает общую площадь, занимаемую оборудованием.
         """
@@ -146,29 +243,41 @@ class Workshop(IWorkshop):
             # Суммируем площади с учетом количества станков
             total_required_area += zone.area
         self._required_area = total_required_area
+        return self._required_area
 
-    def add_zone(self, name: str, zone: IWorkshopZone | ISpecificWorkshopZone) -> None:
+    def add_zone(
+        self,
+        name: str,
+        zone: IWorkshopZone | ISpecificWorkshopZone,
+        updater: Optional[Callable[[IWorkshop], None]] = None,
+    ) -> None:
         """
         Добавляет зону в цех.
 
         Args:
             name: Название зоны
             zone: Объект зоны
+            updater: Функция пересчета зоны при изменении процесса (для зон, зависящих от процесса)
         """
         self.zones[name] = zone
+        self.invalidate_cache()
+        if updater is not None:
+            self._zone_updaters[name] = updater
+        else:
+            self._zone_updaters.pop(name, None)
 
     def default_calculate_length(self) -> None:
         """
         Рассчитывает длину цеха по умолчанию.
         """
-        # Получаем настройки из конфигурации
-        width_span = Decimal(str(get_setting('workshop_span')))
-        number_spans = Decimal(str(get_setting('workshop_nam')))
+        width_span = self.settings.workshop_span
+        number_spans = self.settings.workshop_nam
 
         self.calculated_length = self.required_area / (width_span * number_spans)
         remainder = self.calculated_length % 6
         if self.calculated_length != 0:
             self.length = self.calculated_length + (6 - remainder)
+        self._default_length = self.length
 
     @property
     def process(self) -> IProcess:
@@ -8,9 +8,15 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Dict, Optional, Union
 
-from design_of_mechanical_production.core.entities import AreaCalculator, SpecificAreaCalculator
+from design_of_mechanical_production.core.entities import (
+    AreaCalculator,
+    CacheStats,
+    DerivedCache,
+    SpecificAreaCalculator,
+)
 from design_of_mechanical_production.core.interfaces import (
     IAreaCalculator,
+    IEquipment,
     IMachineInfo,
     ISpecificWorkshopZone,
     IWorkshopZone,
@@ -58,10 +64,14 @@ class WorkshopZone(IWorkshopZone, BaseWorkshopZone):
     """
 
     name: str
-    machines: Dict[str, IMachineInfo] = field(default_factory=dict)
+    # Станки зоны: {оборудование (или название станка, если оборудование не загружено): информация о станке}
+    machines: Dict[Union[IEquipment, str], IMachineInfo] = field(default_factory=dict)
     _area_calculator: Optional[IAreaCalculator] = None
     # __tokens - Признаки сортировки, поле задается фабрикой
     __tokens: Dict[str, str] = field(default_factory=lambda: {"group": "main"})
+    # Кэш площади (сбрасывается при изменении состава зоны, см. invalidate_cache)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _cache: DerivedCache = field(default_factory=DerivedCache, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -75,17 +85,18 @@ class WorkshopZone(IWorkshopZone, BaseWorkshopZone):
         """
         Возвращает площадь зоны.
         """
-        return self._area_calculator.calculate_area(self.machines)
+        return self._cache.get('area', lambda: self._area_calculator.calculate_area(self.machines))
 
-    def add_machine(self, name: str, machine: IMachineInfo) -> None:
+    def add_machine(self, name: Union[IEquipment, str], machine: IMachineInfo) -> None:
         """
         Добавляет станок в зону.
 
         Args:
-            name: Название станка
+            name: Оборудование (или название станка, если оборудование не загружено)
             machine: Информация о станке
         """
         self.machines[name] = machine
+        self.invalidate_cache()
 
     @property
     def calculated_machines_count(self) -> Decimal:
@@ -106,6 +117,7 @@ class WorkshopZone(IWorkshopZone, BaseWorkshopZone):
         Устанавливает признаки сортировки.
         """
         self.__tokens = tokens
+        self.invalidate_cache()
 
     @property
     def tokens(self) -> Dict[str, str]:
@@ -114,6 +126,28 @@ class WorkshopZone(IWorkshopZone, BaseWorkshopZone):
         """
         return self.__tokens
 
+    @property
+    def revision(self) -> int:
+        """
+        Номер состояния зоны (увеличивается при каждом сбросе кэша).
+        """
+        return self._revision
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """
+        Счетчики обращений к кэшу площади зоны.
+        """
+        return self._cache.stats
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированную площадь зоны.
+        Вызывается при изменении состава зоны, а также после изменения данных станков зоны извне.
+        """
+        self._revision += 1
+        self._cache.clear()
+
 
 @dataclass
 class SpecificWorkshopZone(ISpecificWorkshopZone, BaseWorkshopZone):
@@ -128,6 +162,9 @@ class SpecificWorkshopZone(ISpecificWorkshopZone, BaseWorkshopZone):
     _area_calculator: IAreaCalculator = None  # Калькулятор площади
     # __tokens - Признаки сортировки, поле задается фабрикой
     __tokens: Dict[str, str] = field(default_factory=lambda: {"group": "additional"})
+    # Кэш площади (сбрасывается при изменении состава зоны, см. invalidate_cache)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _cache: DerivedCache = field(default_factory=DerivedCache, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -141,13 +178,26 @@ class SpecificWorkshopZone(ISpecificWorkshopZone, BaseWorkshopZone):
         """
         Возвращает площадь зоны.
         """
-        return self._area_calculator.calculate_area({})
+        return self._cache.get('area', lambda: self._area_calculator.calculate_area({}))
+
+    def set_unit_of_calculation(self, value: Union[int, Decimal, float]) -> None:
+        """
+        Устанавливает количество элементов для расчета площади.
+
+        Args:
+            value: Количество элементов
+        """
+        self.unit_of_calculation = value
+        if isinstance(self._area_calculator, SpecificAreaCalculator):
+            self._area_calculator.total_equipment_count = value
+        self.invalidate_cache()
 
     def set_tokens(self, tokens: Dict[str, str]) -> None:
         """
         Устанавливает признаки сортировки.
         """
         self.__tokens = tokens
+        self.invalidate_cache()
 
     @property
     def tokens(self) -> Dict[str, str]:
@@ -155,3 +205,25 @@ class SpecificWorkshopZone(ISpecificWorkshopZone, BaseWorkshopZone):
         Возвращает признаки сортировки.
         """
         return self.__tokens
+
+    @property
+    def revision(self) -> int:
+        """
+        Номер состояния зоны (увеличивается при каждом сбросе кэша).
+        """
+        return self._revision
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """
+        Счетчики обращений к кэшу площади зоны.
+        """
+        return self._cache.stats
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированную площадь зоны.
+        Вызывается при изменении состава зоны, а также после изменения данных станков зоны извне.
+        """
+        self._revision += 1
+        self._cache.clear()
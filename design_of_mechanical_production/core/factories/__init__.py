@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from design_of_mechanical_production.core.factories.equipment_factory import EquipmentFactory
+from design_of_mechanical_production.core.factories.equipment_registry import EQUIPMENT_REGISTRY, EquipmentRegistry
 from design_of_mechanical_production.core.factories.workshop_zone_factory import WorkshopZoneFactory
 
-__all__ = ['EquipmentFactory', 'WorkshopZoneFactory']
+__all__ = ['EQUIPMENT_REGISTRY', 'EquipmentRegistry', 'EquipmentFactory', 'WorkshopZoneFactory']
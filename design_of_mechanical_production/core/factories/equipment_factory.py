@@ -5,18 +5,33 @@ from __future__ import annotations
 
 from decimal import Decimal
 from sys import exit
-
-from machine_tools import Finder, ListMachineInfoFormatter, ListNameFormatter, MachineInfo
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from design_of_mechanical_production.core.entities import Equipment
-from design_of_mechanical_production.core.interfaces import IEquipment, IEquipmentFactory
+from design_of_mechanical_production.core.factories.equipment_registry import EQUIPMENT_REGISTRY
+from design_of_mechanical_production.core.interfaces import (
+    IEquipment,
+    IEquipmentFactory,
+    IMachineCatalog,
+    IMachineRecord,
+)
+
+if TYPE_CHECKING:
+    from machine_tools import MachineInfo
 
 
 class EquipmentFactory(IEquipmentFactory):
     """
     Фабрика для создания оборудования.
+
+    Созданное оборудование кэшируется на уровне процесса (индекс по модели станка),
+    поэтому повторные запросы одной и той же модели не обращаются к базе данных.
+    Загруженное оборудование регистрируется в реестре (EQUIPMENT_REGISTRY): на каждую модель - один объект.
     """
 
+    # Кэш оборудования, общий для всех экземпляров фабрики: {модель: оборудование}
+    _cache: Dict[str, IEquipment] = {}
+
     def create_equipment(self, model: str) -> IEquipment:
         """
         Создает оборудование по модели.
@@ -27,23 +42,131 @@ class EquipmentFactory(IEquipmentFactory):
         Returns:
             IEquipment: Созданное оборудование
         """
+        return self.create_equipments([model])[model]
+
+    def create_equipments(self, models: Iterable[str]) -> Dict[str, IEquipment]:
+        """
+        Создает оборудование для набора моделей.
+        Модели, отсутствующие в кэше, загружаются из базы данных за одну сессию.
+
+        Args:
+            models: Модели оборудования (могут повторяться)
+
+        Returns:
+            Dict[str, IEquipment]: Словарь {модель: оборудование} для всех различных моделей
+        """
+        required = list(dict.fromkeys(models))
+        missing = [model for model in required if model not in self._cache]
+        if missing:
+            for model, equipment in self._load_equipments(missing).items():
+                # Оборудование с неполными данными (None) не регистрируется
+                self._cache[model] = EQUIPMENT_REGISTRY.intern(equipment) if equipment is not None else None
+        return {model: self._cache[model] for model in required}
+
+    @classmethod
+    def invalidate_cache(cls, models: Optional[Iterable[str]] = None) -> None:
+        """
+        Сбрасывает кэш оборудования.
+
+        Args:
+            models: Модели, которые нужно удалить из кэша. Если не указаны, кэш очищается полностью.
+        """
+        if models is None:
+            cls._cache.clear()
+            return
+        for model in models:
+            cls._cache.pop(model, None)
+
+    def _load_equipments(self, models: List[str]) -> Dict[str, IEquipment]:
+        """
+        Загружает данные станков из базы данных в рамках одной сессии.
+        Полный перечень станков запрашивается только если какая-то модель не найдена.
+
+        Args:
+            models: Различные модели оборудования
+
+        Returns:
+            Dict[str, IEquipment]: Словарь {модель: оборудование}
+        """
+        from design_of_mechanical_production.utils.machines.catalog import get_machine_catalog
+
+        catalog = get_machine_catalog()
+        if catalog is not None:
+            return self._load_equipments_from_catalog(catalog, models)
+
+        # ORM базы станков загружается только при обращении к базе
+        from machine_tools import Finder, ListMachineInfoFormatter, ListNameFormatter
+
+        machine_tools: Dict[str, MachineInfo] = {}
+        not_found: List[str] = []
         with Finder(limit=None) as finder:
-            all_machine_tool = finder.find_all()
-            finder._builder.reset_builder()
             finder.set_formatter(ListMachineInfoFormatter())
-            machine_tool: MachineInfo = finder.find_by_name(model, exact_match=True)[0]
-
-        if not machine_tool:
-            print(
-                f"\nСтанок {model} не найден в базе данных."
-                f"\nВнесите данные по станку в базу и повторите расчет."
-                f"\nИли выберите станок, данные которого содержатся в базе."
-                f"\n"
-                f"\nДоступные станки:"
-                f"\n{chr(10).join(', '.join(all_machine_tool[i:i+50]) for i in range(0, len(all_machine_tool), 200))}"
-            )
-            exit(1)
+            for model in models:
+                finder._builder.reset_builder()
+                found = finder.find_by_name(model, exact_match=True)
+                if found and found[0]:
+                    machine_tools[model] = found[0]
+                else:
+                    not_found.append(model)
+
+            if not_found:
+                finder._builder.reset_builder()
+                finder.set_formatter(ListNameFormatter())
+                all_machine_tool = finder.find_all()
+
+        if not_found:
+            self._report_not_found(not_found, all_machine_tool)
+
+        return {model: self._build_equipment(model, machine_tool) for model, machine_tool in machine_tools.items()}
 
+    def _load_equipments_from_catalog(self, catalog: IMachineCatalog, models: List[str]) -> Dict[str, IEquipment]:
+        """
+        Загружает данные станков из подключенного каталога станков (см. utils.machines.catalog).
+
+        Args:
+            catalog: Каталог станков
+            models: Различные модели оборудования
+
+        Returns:
+            Dict[str, IEquipment]: Словарь {модель: оборудование}
+        """
+        records = catalog.find_machines(models)
+        not_found = [model for model in models if model not in records]
+        if not_found:
+            self._report_not_found(not_found, catalog.names())
+        return {model: self._build_equipment_from_record(model, record) for model, record in records.items()}
+
+    @staticmethod
+    def _report_not_found(not_found: List[str], all_machine_tool: List[str]) -> None:
+        """
+        Сообщает о станках, которых нет в базе данных, и завершает программу.
+
+        Args:
+            not_found: Ненайденные модели
+            all_machine_tool: Все модели базы данных
+        """
+        print(
+            f"\nСтанок {', '.join(not_found)} не найден в базе данных."
+            f"\nВнесите данные по станку в базу и повторите расчет."
+            f"\nИли выберите станок, данные которого содержатся в базе."
+            f"\n"
+            f"\nДоступные станки:"
+            f"\n{chr(10).join(', '.join(all_machine_tool[i:i+50]) for i in range(0, len(all_machine_tool), 200))}"
+        )
+        exit(1)
+
+    @staticmethod
+    def _build_equipment(model: str, machine_tool: MachineInfo) -> Optional[IEquipment]:
+        """
+        Создает оборудование по данным станка из базы данных.
+
+        Args:
+            model: Модель оборудования
+            machine_tool: Данные станка из базы данных
+
+        Returns:
+            IEquipment: Созданное оборудование
+        """
         equipment = None
         try:
             equipment = Equipment(
@@ -60,3 +183,26 @@ class EquipmentFactory(IEquipmentFactory):
             print(machine_tool)
 
         return equipment
+
+    @staticmethod
+    def _build_equipment_from_record(model: str, record: IMachineRecord) -> IEquipment:
+        """
+        Создает оборудование по записи каталога станков.
+
+        Args:
+            model: Модель оборудования
+            record: Запись каталога станков (габариты в мм)
+
+        Returns:
+            IEquipment: Созданное оборудование
+        """
+        return Equipment(
+            name=None,
+            model=model,
+            length=record.length / 1000,
+            width=record.width / 1000,
+            height=record.height / 1000,
+            automation=record.automation,
+            weight=record.weight,
+            power_consumption=record.power,
+        )
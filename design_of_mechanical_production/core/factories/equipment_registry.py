@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from design_of_mechanical_production.core.interfaces import IEquipment
+
+
+class EquipmentRegistry:
+    """
+    Реестр оборудования: одна модель станка - один неизменяемый объект оборудования.
+
+    Все операции и зоны, использующие модель, ссылаются на один объект, поэтому группировка по оборудованию
+    сводится к сравнению ссылок. При повторной загрузке (например, после сброса кэша фабрики) с теми же данными
+    возвращается прежний объект, с измененными данными - объект заменяется.
+    """
+
+    def __init__(self) -> None:
+        self._equipments: Dict[str, IEquipment] = {}
+
+    def __len__(self) -> int:
+        return len(self._equipments)
+
+    def intern(self, equipment: IEquipment) -> IEquipment:
+        """
+        Возвращает единственный объект оборудования для модели.
+
+        Args:
+            equipment: Оборудование (неизменяемое)
+
+        Returns:
+            IEquipment: Зарегистрированное оборудование модели
+        """
+        registered = self._equipments.get(equipment.model)
+        if registered is not None and (registered is equipment or registered == equipment):
+            return registered
+        self._equipments[equipment.model] = equipment
+        return equipment
+
+    def get(self, model: str) -> Optional[IEquipment]:
+        """
+        Возвращает зарегистрированное оборудование модели.
+
+        Args:
+            model: Модель оборудования
+
+        Returns:
+            Optional[IEquipment]: Оборудование или None, если модель не зарегистрирована
+        """
+        return self._equipments.get(model)
+
+    def clear(self) -> None:
+        """
+        Очищает реестр.
+        """
+        self._equipments.clear()
+
+
+# Реестр оборудования, общий для всех фабрик оборудования
+EQUIPMENT_REGISTRY = EquipmentRegistry()
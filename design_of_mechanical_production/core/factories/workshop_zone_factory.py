@@ -2,45 +2,56 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
 from design_of_mechanical_production.core.entities import (
+    AreaCalculator,
     SpecificWorkshopZone,
     WorkshopZone,
 )
 from design_of_mechanical_production.core.factories import EquipmentFactory
-from design_of_mechanical_production.core.interfaces import IMachineInfo, ISpecificWorkshopZone, IWorkshopZone
-from design_of_mechanical_production.settings import get_setting
+from design_of_mechanical_production.core.interfaces import (
+    IEquipment,
+    IMachineInfo,
+    ISpecificWorkshopZone,
+    IWorkshopZone,
+)
+from design_of_mechanical_production.settings import SettingsSnapshot, settings_snapshot
 
 
 class WorkshopZoneFactory:
     """
     Фабрика для создания различных типов зон цеха.
+    Площади зон рассчитываются по снимку настроек фабрики.
     """
 
-    def __init__(self):
-        """Инициализация фабрики."""
+    def __init__(self, settings: Optional[SettingsSnapshot] = None):
+        """
+        Инициализация фабрики.
+
+        Args:
+            settings: Снимок настроек расчета. Если не задан, используются текущие настройки
+        """
         self.equipment_factory = EquipmentFactory()
+        self.settings = settings or settings_snapshot()
 
-    @staticmethod
-    def create_main_zone(machines: Dict[str, IMachineInfo]) -> tuple[str, IWorkshopZone]:
+    def create_main_zone(self, machines: Dict[IEquipment, IMachineInfo]) -> tuple[str, IWorkshopZone]:
         """
         Создает основную зону цеха.
         Основная зона не знает про состав и количество станков, определим это во внешнем скрипте
 
         Args:
-            machines: Словарь со станками и их количеством
+            machines: Словарь со станками и их количеством по оборудованию (см. Process.machines)
 
         Returns:
             WorkshopZone: Созданная основная зона
         """
-        workshop_zone = WorkshopZone(name='Основная зона')
+        workshop_zone = WorkshopZone(name='Основная зона', _area_calculator=AreaCalculator(self.settings.passage_area))
         for machine_name, machine_info in machines.items():
             workshop_zone.add_machine(machine_name, machine_info)
         return 'main_zone', workshop_zone
 
-    @staticmethod
-    def create_grinding_zone(machines: Dict[str, IMachineInfo]) -> tuple[str, IWorkshopZone]:
+    def create_grinding_zone(self, machines: Dict[str, IMachineInfo]) -> tuple[str, IWorkshopZone]:
         """
         Создает зону заточного отделения.
         Зона не знает про состав и количество станков, определим это во внешнем скрипте
@@ -51,14 +62,15 @@ class WorkshopZoneFactory:
         Returns:
             WorkshopZone: Созданная зона заточного отделения
         """
-        workshop_zone = WorkshopZone(name='Заточное отделение')
+        workshop_zone = WorkshopZone(
+            name='Заточное отделение', _area_calculator=AreaCalculator(self.settings.passage_area)
+        )
         workshop_zone.set_tokens({"group": "additional"})
         for machine_name, machine_info in machines.items():
             workshop_zone.add_machine(machine_name, machine_info)
         return 'grinding_zone', workshop_zone
 
-    @staticmethod
-    def create_repair_zone(machines: Dict[str, IMachineInfo]) -> tuple[str, IWorkshopZone]:
+    def create_repair_zone(self, machines: Dict[str, IMachineInfo]) -> tuple[str, IWorkshopZone]:
         """
         Создает зону ремонтного отделения.
         Зона не знает про состав и количество станков, определим это во внешнем скрипте
@@ -69,14 +81,15 @@ class WorkshopZoneFactory:
         Returns:
             WorkshopZone: Созданная зона ремонтного отделения
         """
-        workshop_zone = WorkshopZone(name='Ремонтное отделение')
+        workshop_zone = WorkshopZone(
+            name='Ремонтное отделение', _area_calculator=AreaCalculator(self.settings.passage_area)
+        )
         workshop_zone.set_tokens({"group": "additional"})
         for machine_name, machine_info in machines.items():
             workshop_zone.add_machine(machine_name, machine_info)
         return 'repair_zone', workshop_zone
 
-    @staticmethod
-    def create_tool_storage_zone(total_machines_count: int) -> tuple[str, ISpecificWorkshopZone]:
+    def create_tool_storage_zone(self, total_machines_count: int) -> tuple[str, ISpecificWorkshopZone]:
         """
         Создает зону склада инструмента.
         Зона определяется по правилу: 0.3м2 * total_machines_count
@@ -90,14 +103,13 @@ class WorkshopZoneFactory:
         """
         workshop_zone = SpecificWorkshopZone(
             name='Склад инструмента',
-            specific_area=Decimal(str(get_setting('specific_areas.tool_storage'))),
+            specific_area=self.settings.tool_storage,
             unit_of_calculation=total_machines_count,
         )
         workshop_zone.set_tokens({"group": "additional"})
         return 'tool_storage_zone', workshop_zone
 
-    @staticmethod
-    def create_equipment_warehouse_zone(total_machines_count: int) -> tuple[str, ISpecificWorkshopZone]:
+    def create_equipment_warehouse_zone(self, total_machines_count: int) -> tuple[str, ISpecificWorkshopZone]:
         """
         Создает зону склада приспособлений.
         Зона определяется по правилу: 0.2м2 * total_machines_count
@@ -111,14 +123,13 @@ class WorkshopZoneFactory:
         """
         workshop_zone = SpecificWorkshopZone(
             name='Склад приспособлений',
-            specific_area=Decimal(str(get_setting('specific_areas.equipment_warehouse'))),
+            specific_area=self.settings.equipment_warehouse,
             unit_of_calculation=total_machines_count,
         )
         workshop_zone.set_tokens({"group": "additional"})
         return 'equipment_warehouse_zone', workshop_zone
 
-    @staticmethod
-    def create_work_piece_storage_zone(main_zone_area: Decimal) -> tuple[str, ISpecificWorkshopZone]:
+    def create_work_piece_storage_zone(self, main_zone_area: Decimal) -> tuple[str, ISpecificWorkshopZone]:
         """
         Создает зону склада заготовок.
         Зона определяется по правилу: 30%* от общей площади основной зоны
@@ -132,14 +143,13 @@ class WorkshopZoneFactory:
         """
         workshop_zone = SpecificWorkshopZone(
             name='Склад заготовок',
-            specific_area=Decimal(str(get_setting('specific_areas.work_piece_storage'))),
+            specific_area=self.settings.work_piece_storage,
             unit_of_calculation=main_zone_area,
         )
         workshop_zone.set_tokens({"group": "additional"})
         return 'work_piece_storage_zone', workshop_zone
 
-    @staticmethod
-    def create_control_department_zone(main_zone_area: int) -> tuple[str, ISpecificWorkshopZone]:
+    def create_control_department_zone(self, main_zone_area: int) -> tuple[str, ISpecificWorkshopZone]:
         """
         Создает зону отделения контроля.
         Зона определяется по правилу: 0.05 * total_machines_count
@@ -153,14 +163,13 @@ class WorkshopZoneFactory:
         """
         workshop_zone = SpecificWorkshopZone(
             name='Отделение контроля',
-            specific_area=Decimal(str(get_setting('specific_areas.control_department'))),
+            specific_area=self.settings.control_department,
             unit_of_calculation=main_zone_area,
         )
         workshop_zone.set_tokens({"group": "additional"})
         return 'control_department_zone', workshop_zone
 
-    @staticmethod
-    def create_sanitary_zone() -> tuple[str, ISpecificWorkshopZone]:
+    def create_sanitary_zone(self) -> tuple[str, ISpecificWorkshopZone]:
         """
         Создает санитарную зону.
         Зона определяется по правилу: 8м2 на каждый санузел (м/ж - 2 санузла)
@@ -171,7 +180,7 @@ class WorkshopZoneFactory:
         """
         workshop_zone = SpecificWorkshopZone(
             name='Санитарная зона',
-            specific_area=Decimal(str(get_setting('specific_areas.sanitary_zone'))),
+            specific_area=self.settings.sanitary_zone,
             unit_of_calculation=2,
         )
         workshop_zone.set_tokens({"group": "additional"})
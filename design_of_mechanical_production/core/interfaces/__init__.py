@@ -6,6 +6,7 @@ from design_of_mechanical_production.core.interfaces.i_data_reader import IDataR
 from design_of_mechanical_production.core.interfaces.i_equipment import IEquipment
 from design_of_mechanical_production.core.interfaces.i_equipment_factory import IEquipmentFactory
 from design_of_mechanical_production.core.interfaces.i_formatters import INumberFormatter, ITableFormatter
+from design_of_mechanical_production.core.interfaces.i_machine_catalog import IMachineCatalog, IMachineRecord
 from design_of_mechanical_production.core.interfaces.i_machine_info import IMachineInfo
 from design_of_mechanical_production.core.interfaces.i_operation import IOperation
 from design_of_mechanical_production.core.interfaces.i_process import IProcess
@@ -21,6 +22,8 @@ __all__ = [
     'IAreaCalculator',
     'IEquipment',
     'IEquipmentFactory',
+    'IMachineCatalog',
+    'IMachineRecord',
     'IMachineInfo',
     'IOperation',
     'IProcess',
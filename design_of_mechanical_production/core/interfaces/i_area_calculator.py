@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Protocol
+from typing import Dict, Protocol, Union
 
 
 class IAreaCalculator(Protocol):
@@ -12,7 +12,7 @@ class IAreaCalculator(Protocol):
     Интерфейс для калькуляторов площади.
     """
 
-    def calculate_area(self, machines: Dict[str, 'IMachineInfo']) -> Decimal:
+    def calculate_area(self, machines: Dict[Union['IEquipment', str], 'IMachineInfo']) -> Decimal:
         """
         Рассчитывает площадь зоны.
 
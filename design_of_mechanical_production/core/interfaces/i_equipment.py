@@ -12,6 +12,9 @@ class IEquipment(Protocol):
     Интерфейс для оборудования.
     """
 
+    # Интерфейс не добавляет __dict__ реализациям со __slots__
+    __slots__ = ()
+
     name: str
     model: str
     length: Decimal
@@ -3,7 +3,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Dict, Iterable, Optional, Protocol
 
 from design_of_mechanical_production.core.interfaces import IEquipment
 
@@ -24,3 +24,24 @@ class IEquipmentFactory(Protocol):
             IEquipment: Объект оборудования
         """
         ...
+
+    def create_equipments(self, models: Iterable[str]) -> Dict[str, 'IEquipment']:
+        """
+        Создает объекты оборудования для набора моделей за один запрос к источнику данных.
+
+        Args:
+            models: Модели оборудования (могут повторяться)
+
+        Returns:
+            Dict[str, IEquipment]: Словарь {модель: оборудование}
+        """
+        ...
+
+    def invalidate_cache(self, models: Optional[Iterable[str]] = None) -> None:
+        """
+        Сбрасывает кэш оборудования.
+
+        Args:
+            models: Модели для удаления из кэша. Если не указаны, кэш очищается полностью.
+        """
+        ...
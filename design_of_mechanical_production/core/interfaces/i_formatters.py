@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from decimal import Decimal
-from typing import List, Protocol
+from typing import Iterable, Iterator, List, Protocol
 
 
 class INumberFormatter(Protocol):
@@ -42,3 +42,17 @@ class ITableFormatter(Protocol):
             List[str]: Отформатированная таблица
         """
         ...
+
+    def iter_format(self, headers: List[str], data: Iterable[tuple], total_row: tuple) -> Iterator[str]:
+        """
+        Форматирует таблицу построчно (без накопления строк).
+
+        Args:
+            headers: Заголовки колонок
+            data: Данные для строк (в том числе генератор)
+            total_row: Данные для строки итога
+
+        Returns:
+            Iterator[str]: Строки отформатированной таблицы
+        """
+        ...
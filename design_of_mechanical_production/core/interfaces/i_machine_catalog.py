@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Protocol, Union
+
+
+class IMachineRecord(Protocol):
+    """
+    Интерфейс для записи каталога станков.
+
+    Attributes:
+    name: Модель станка
+    group: Группа станка (1-9)
+    subgroup: Подгруппа (тип) станка
+    software_control: Тип управления ('no', 'ic', 'cnc' - значения machine_tools.SoftwareControl)
+    length, width, height: Габариты станка, мм
+    automation: Степень автоматизации
+    weight: Масса станка, кг
+    power: Мощность станка, кВт
+    """
+
+    name: str
+    group: Optional[int]
+    subgroup: Optional[int]
+    software_control: Optional[str]
+    length: Decimal
+    width: Decimal
+    height: Decimal
+    automation: Optional[str]
+    weight: Optional[Decimal]
+    power: Optional[Decimal]
+
+
+class IMachineCatalog(Protocol):
+    """
+    Интерфейс для каталога станков (источника данных об оборудовании).
+    """
+
+    def find_machines(self, names: Iterable[str]) -> Dict[str, IMachineRecord]:
+        """
+        Ищет станки по точному совпадению модели.
+
+        Args:
+            names: Модели станков
+
+        Returns:
+            Dict[str, IMachineRecord]: Найденные станки {модель: запись}. Ненайденные модели отсутствуют
+        """
+        ...
+
+    def names(
+        self,
+        group: Optional[int] = None,
+        subgroups: Optional[Union[int, Iterable[int]]] = None,
+        software_control: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[str]:
+        """
+        Возвращает модели станков по условию (в порядке каталога). Условие None не ограничивает выборку.
+
+        Args:
+            group: Группа станков
+            subgroups: Подгруппа или перечень подгрупп
+            software_control: Тип управления или перечень типов
+
+        Returns:
+            List[str]: Модели станков
+        """
+        ...
@@ -19,6 +19,9 @@ class IMachineInfo(Protocol):
     actual_count: Фактическое количество станков (может быть None)
     """
 
+    # Интерфейс не добавляет __dict__ реализациям со __slots__
+    __slots__ = ()
+
     model: Union[str, 'IEquipment']
     calculated_count: Decimal
     actual_count: Optional[int]
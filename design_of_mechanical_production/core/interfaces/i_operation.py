@@ -14,6 +14,9 @@ class IOperation(Protocol):
     Интерфейс для операции.
     """
 
+    # Интерфейс не добавляет __dict__ реализациям со __slots__
+    __slots__ = ()
+
     number: str
     name: str
     time: Decimal
@@ -53,6 +56,16 @@ class IOperation(Protocol):
         """
         ...
 
+    def assign_equipment_count(self, calculated: Decimal, accepted: int) -> None:
+        """
+        Устанавливает расчетное и принятое количество оборудования.
+
+        Args:
+            calculated: Расчетное количество оборудования
+            accepted: Принятое количество оборудования
+        """
+        ...
+
     def calculate_load_factor(self) -> None:
         """
         Рассчитывает коэффициент загрузки оборудования.
@@ -67,3 +80,12 @@ class IOperation(Protocol):
             total_time: Общее время на выполнение всех операций
         """
         ...
+
+    def scale(self, factor: Decimal) -> 'IOperation':
+        """
+        Создает операцию на производственную программу.
+
+        Args:
+            factor: Коэффициент масштабирования времени (объем производства)
+        """
+        ...
@@ -4,9 +4,9 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, List, Protocol
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional, Protocol
 
-from design_of_mechanical_production.core.interfaces import IMachineInfo, IOperation
+from design_of_mechanical_production.core.interfaces import IEquipment, IMachineInfo, IOperation
 
 
 class IProcess(Protocol):
@@ -24,14 +24,14 @@ class IProcess(Protocol):
             production_volume: Объем производства
 
         Returns:
-            Dict[str, IMachineInfo]: Словарь с информацией о станках
+            Dict[IEquipment, IMachineInfo]: Словарь с информацией о станках
         """
         ...
 
     @property
-    def machines(self) -> Dict[str, 'IMachineInfo']:
+    def machines(self) -> Dict['IEquipment', 'IMachineInfo']:
         """
-        Количество станков по типам.
+        Количество станков по оборудованию.
         """
         return ...
 
@@ -77,3 +77,71 @@ class IProcess(Protocol):
             operation: Операция для добавления
         """
         ...
+
+    def extend(self, operations: Iterable['IOperation']) -> None:
+        """
+        Добавляет операции в процесс (доли операций пересчитываются один раз).
+
+        Args:
+            operations: Операции для добавления
+        """
+        ...
+
+    def scale(self, factor: Decimal) -> 'IProcess':
+        """
+        Создает технологический процесс на производственную программу (время операций умножается на factor).
+
+        Args:
+            factor: Коэффициент масштабирования времени
+
+        Returns:
+            IProcess: Технологический процесс на производственную программу
+        """
+        ...
+
+    @property
+    def revision(self) -> int:
+        """
+        Номер актуального расчета.
+        """
+        return ...
+
+    def subscribe(self, listener: Callable[['IProcess'], None]) -> None:
+        """
+        Подписывает функцию на пересчет процесса.
+
+        Args:
+            listener: Функция, вызываемая с процессом после каждого пересчета
+        """
+        ...
+
+    def unsubscribe(self, listener: Callable[['IProcess'], None]) -> None:
+        """
+        Отписывает функцию от пересчета процесса.
+
+        Args:
+            listener: Функция, переданная в subscribe
+        """
+        ...
+
+    def batch_update(self) -> ContextManager['IProcess']:
+        """
+        Откладывает пересчет до выхода из блока.
+        """
+        ...
+
+    def update(
+        self,
+        fund_of_working: Optional[Decimal] = None,
+        compliance_coefficient: Optional[Decimal] = None,
+        progressivity_coefficient: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Изменяет коэффициенты процесса с одним пересчетом.
+
+        Args:
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+        """
+        ...
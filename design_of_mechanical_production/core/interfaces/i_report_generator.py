@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from pathlib import Path
-from typing import Protocol
+from typing import Optional, Protocol, TextIO
 
 
 class IReportGenerator(Protocol):
@@ -34,3 +34,27 @@ class IReportGenerator(Protocol):
             bool: Успешность сохранения
         """
         ...
+
+    def write_report(self, workshop: 'IWorkshop', stream: TextIO, width: Optional[int] = 120) -> None:
+        """
+        Записывает отчет о цехе в текстовый поток по мере формирования.
+
+        Args:
+            workshop: Объект цеха
+            stream: Текстовый поток
+            width: Максимальная ширина строки (None - без переноса)
+        """
+        ...
+
+    def export_report(self, workshop: 'IWorkshop', filepath: Path) -> bool:
+        """
+        Формирует отчет о цехе и сохраняет его в файл, не собирая весь текст в памяти.
+
+        Args:
+            workshop: Объект цеха
+            filepath: Путь к файлу
+
+        Returns:
+            bool: Успешность сохранения
+        """
+        ...
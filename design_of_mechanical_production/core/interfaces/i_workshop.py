@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Protocol
+from typing import Callable, Dict, Optional, Protocol
 
 
 class IWorkshop(Protocol):
@@ -18,6 +18,7 @@ class IWorkshop(Protocol):
     process: 'IProcess'
     zones: Dict[str, 'IWorkshopZone']
     length: Decimal
+    settings: 'SettingsSnapshot'  # снимок настроек, по которым рассчитан цех
     _total_area: Decimal
     _required_area: Decimal
     _calculated_length: Decimal
@@ -71,25 +72,61 @@ class IWorkshop(Protocol):
         """
         ...
 
-    def _calculate_total_area(self) -> None:
+    def _calculate_total_area(self) -> Decimal:
         """
         Рассчитывает общую площадь цеха.
         """
         ...
 
-    def _calculate_required_area(self) -> None:
+    def _calculate_required_area(self) -> Decimal:
         """
         Рассчитывает общую площадь, занимаемую оборудованием.
         """
         ...
 
-    def add_zone(self, name: str, zone: 'IWorkshopZone') -> None:
+    def add_zone(
+        self,
+        name: str,
+        zone: 'IWorkshopZone',
+        updater: Optional[Callable[['IWorkshop'], None]] = None,
+    ) -> None:
         """
         Добавляет зону в цех.
 
         Args:
             name: Название зоны
             zone: Объект зоны
+            updater: Функция пересчета зоны при изменении процесса
+        """
+        ...
+
+    def update(
+        self,
+        production_volume: Optional[Decimal] = None,
+        fund_of_working: Optional[Decimal] = None,
+        compliance_coefficient: Optional[Decimal] = None,
+        progressivity_coefficient: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Изменяет объем производства и (или) коэффициенты процесса с однократным пересчетом зависимых величин.
+
+        Args:
+            production_volume: Годовой объем производства
+            fund_of_working: Действительный фонд времени работы одного станка, ч
+            compliance_coefficient: Коэффициент выполнения нормы
+            progressivity_coefficient: Коэффициент прогрессивности
+        """
+        ...
+
+    def refresh_zones(self) -> None:
+        """
+        Пересчитывает зоны, зависящие от процесса, и длину цеха по умолчанию.
+        """
+        ...
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированные площади цеха.
         """
         ...
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Dict, Protocol, Union
 
-from design_of_mechanical_production.core.interfaces import IAreaCalculator, IMachineInfo
+from design_of_mechanical_production.core.interfaces import IAreaCalculator, IEquipment, IMachineInfo
 
 
 class IWorkshopZone(Protocol):
@@ -15,7 +15,7 @@ class IWorkshopZone(Protocol):
     """
 
     name: str
-    machines: Dict[str, 'IMachineInfo']
+    machines: Dict[Union['IEquipment', str], 'IMachineInfo']
 
     def calculate_area(self) -> Decimal:
         """
@@ -23,12 +23,12 @@ class IWorkshopZone(Protocol):
         """
         ...
 
-    def add_machine(self, name: str, machine: 'IMachineInfo') -> None:
+    def add_machine(self, name: Union['IEquipment', str], machine: 'IMachineInfo') -> None:
         """
         Добавляет станок в зону.
 
         Args:
-            name: Название станка
+            name: Оборудование (или название станка, если оборудование не загружено)
             machine: Информация о станке
         """
         ...
@@ -67,6 +67,19 @@ class IWorkshopZone(Protocol):
         """
         return ...
 
+    @property
+    def revision(self) -> int:
+        """
+        Номер состояния зоны (увеличивается при каждом сбросе кэша).
+        """
+        return ...
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированную площадь зоны.
+        """
+        ...
+
 
 class ISpecificWorkshopZone(Protocol):
     """
@@ -98,3 +111,25 @@ class ISpecificWorkshopZone(Protocol):
         Возвращает признаки сортировки.
         """
         return ...
+
+    @property
+    def revision(self) -> int:
+        """
+        Номер состояния зоны (увеличивается при каждом сбросе кэша).
+        """
+        return ...
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает кэшированную площадь зоны.
+        """
+        ...
+
+    def set_unit_of_calculation(self, value: Union[int, Decimal, float]) -> None:
+        """
+        Устанавливает количество элементов для расчета площади.
+
+        Args:
+            value: Количество элементов
+        """
+        ...
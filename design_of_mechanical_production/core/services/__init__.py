@@ -1,12 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from design_of_mechanical_production.core.services.operation_creator import create_operations_from_data
+from design_of_mechanical_production.core.services.calculation_task import (
+    CalculationCancelled,
+    CalculationProgress,
+    CalculationResult,
+    CalculationTask,
+    calculate_workshop,
+)
+from design_of_mechanical_production.core.services.operation_creator import (
+    create_operations_from_data,
+    create_process_table_from_data,
+)
+from design_of_mechanical_production.core.services.parameter_sweep import Scenario, run_sweep, scenario_grid
 from design_of_mechanical_production.core.services.process_creator import create_process_from_data
-from design_of_mechanical_production.core.services.workshop_creator import create_workshop_from_data
+from design_of_mechanical_production.core.services.workshop_creator import create_workshop, create_workshop_from_data
 
 __all__ = [
     'create_operations_from_data',
+    'create_process_table_from_data',
     'create_process_from_data',
+    'create_workshop',
     'create_workshop_from_data',
+    'Scenario',
+    'run_sweep',
+    'scenario_grid',
+    'CalculationCancelled',
+    'CalculationProgress',
+    'CalculationResult',
+    'CalculationTask',
+    'calculate_workshop',
 ]
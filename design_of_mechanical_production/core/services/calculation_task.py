@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Расчет цеха в фоновом потоке: уведомления о ходе расчета и отмена.
+
+Отмена кооперативная: расчет останавливается на границе этапов (запрос оборудования из базы, расчет зон,
+формирование отчета), прервать уже начатый этап нельзя.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from design_of_mechanical_production.core.interfaces import IReportGenerator, IWorkshop
+from design_of_mechanical_production.core.services.workshop_creator import (
+    STAGE_OPERATIONS,
+    STAGE_ZONES,
+    CalculationCancelled,
+    create_workshop_from_data,
+)
+
+# Этапы расчета (этапы STAGE_OPERATIONS и STAGE_ZONES выполняет create_workshop_from_data)
+STAGE_REPORT = 'report'
+
+STAGE_MESSAGES = {
+    STAGE_OPERATIONS: "Определение оборудования операций",
+    STAGE_ZONES: "Расчет зон цеха",
+    STAGE_REPORT: "Формирование отчета",
+}
+
+
+@dataclass(frozen=True)
+class CalculationProgress:
+    """
+    Уведомление о ходе расчета: этап step из total завершен.
+
+    Attributes:
+        stage: Завершенный этап (STAGE_OPERATIONS, STAGE_ZONES, STAGE_REPORT)
+        step: Номер завершенного этапа
+        total: Количество этапов
+        message: Описание этапа
+    """
+
+    stage: str
+    step: int
+    total: int
+    message: str
+
+
+@dataclass
+class CalculationResult:
+    """
+    Результат расчета.
+
+    Attributes:
+        workshop: Рассчитанный цех
+        report: Текст отчета (если задан генератор отчета)
+    """
+
+    workshop: IWorkshop
+    report: Optional[str] = None
+
+
+def calculate_workshop(
+    parameters_data: Dict[str, Any],
+    process_data: List[Dict[str, Any]],
+    on_progress: Optional[Callable[[CalculationProgress], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    report_generator: Optional[IReportGenerator] = None,
+) -> CalculationResult:
+    """
+    Рассчитывает цех (create_workshop_from_data) с уведомлениями о ходе расчета и формирует отчет.
+
+    Args:
+        parameters_data: Параметры цеха (name, production_volume, mass_detail)
+        process_data: Данные технологического процесса
+        on_progress: Функция, вызываемая после каждого этапа
+        is_cancelled: Функция проверки отмены (проверяется перед каждым этапом)
+        report_generator: Генератор отчета. Если не задан, отчет не формируется
+
+    Returns:
+        CalculationResult: Результат расчета
+
+    Raises:
+        ValueError: Если входные данные некорректны
+        CalculationCancelled: Если расчет отменен
+    """
+    stages = [STAGE_OPERATIONS, STAGE_ZONES] + ([STAGE_REPORT] if report_generator is not None else [])
+
+    def stage_done(stage: str) -> None:
+        if on_progress is not None:
+            on_progress(CalculationProgress(stage, stages.index(stage) + 1, len(stages), STAGE_MESSAGES[stage]))
+
+    workshop = create_workshop_from_data(
+        parameters_data, process_data, on_progress=stage_done, is_cancelled=is_cancelled
+    )
+
+    result = CalculationResult(workshop)
+    if report_generator is not None:
+        if is_cancelled is not None and is_cancelled():
+            raise CalculationCancelled()
+        result.report = report_generator.generate_report(workshop)
+        stage_done(STAGE_REPORT)
+    return result
+
+
+def _call(function: Callable[[], None]) -> None:
+    """Вызывает функцию в текущем потоке."""
+    function()
+
+
+class CalculationTask:
+    """
+    Расчет цеха в фоновом потоке.
+
+    Уведомления (ход расчета, результат, ошибка) передаются через функцию dispatch - например, в основной поток
+    графического интерфейса: dispatch=lambda f: Clock.schedule_once(lambda dt: f()). По умолчанию уведомления
+    вызываются в фоновом потоке. После отмены уведомления не передаются.
+    """
+
+    def __init__(
+        self,
+        parameters_data: Dict[str, Any],
+        process_data: List[Dict[str, Any]],
+        on_progress: Optional[Callable[[CalculationProgress], None]] = None,
+        on_done: Optional[Callable[[CalculationResult], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        report_generator: Optional[IReportGenerator] = None,
+        dispatch: Callable[[Callable[[], None]], None] = _call,
+    ):
+        """
+        Args:
+            parameters_data: Параметры цеха
+            process_data: Данные технологического процесса
+            on_progress: Функция, вызываемая после каждого этапа расчета
+            on_done: Функция, вызываемая с результатом расчета
+            on_error: Функция, вызываемая при ошибке расчета
+            report_generator: Генератор отчета (отчет формируется в фоновом потоке)
+            dispatch: Функция передачи уведомлений в нужный поток
+        """
+        self.parameters_data = parameters_data
+        self.process_data = process_data
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.report_generator = report_generator
+        self.dispatch = dispatch
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Расчет отменен."""
+        return self._cancel_event.is_set()
+
+    @property
+    def running(self) -> bool:
+        """Расчет выполняется."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'CalculationTask':
+        """Запускает расчет в фоновом потоке."""
+        self._thread = threading.Thread(target=self._run, name="workshop-calculation", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Отменяет расчет (на границе этапов)."""
+        self._cancel_event.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Ожидает завершения фонового потока."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _notify(self, callback: Optional[Callable[..., None]], *args: Any) -> None:
+        """Передает уведомление через dispatch (если расчет не отменен)."""
+        if callback is None or self.cancelled:
+            return
+        self.dispatch(lambda: None if self.cancelled else callback(*args))
+
+    def _run(self) -> None:
+        """Выполняет расчет (в фоновом потоке)."""
+        try:
+            result = calculate_workshop(
+                self.parameters_data,
+                self.process_data,
+                on_progress=lambda progress: self._notify(self.on_progress, progress),
+                is_cancelled=lambda: self.cancelled,
+                report_generator=self.report_generator,
+            )
+        except CalculationCancelled:
+            return
+        except SystemExit:
+            # EquipmentFactory завершает программу, если станка нет в базе (список станков выведен в консоль)
+            self._notify(self.on_error, RuntimeError("Станок не найден в базе данных"))
+        except Exception as e:
+            self._notify(self.on_error, e)
+        else:
+            self._notify(self.on_done, result)
@@ -4,13 +4,16 @@
 from decimal import Decimal
 from typing import Any, Callable, Dict, List
 
-from design_of_mechanical_production.core.entities import Operation
+from design_of_mechanical_production.core.entities import Operation, ProcessTable
 from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.core.interfaces import IOperation
 
 
 def create_operations_from_data(
-    process_data: List[Dict[str, Any]], factory: Callable = EquipmentFactory
-) -> List[Operation]:
+    process_data: List[Dict[str, Any]],
+    factory: Callable = EquipmentFactory,
+    operation_type: Callable[..., IOperation] = Operation,
+) -> List[IOperation]:
     """
     Создает список операций из входных данных.
 
@@ -21,18 +24,42 @@ def create_operations_from_data(
             - time: float - время операции
             - machine: str - модель станка
         factory: Callable - фабрика для создания оборудования
+        operation_type: Класс операции (SlottedOperation - компактный вариант для длинных маршрутов)
 
     Returns:
-        List[Operation]: Список созданных операций
+        List[IOperation]: Список созданных операций
     """
     # Создаем фабрику оборудования
     equipment_factory = factory()
+    # Получаем оборудование для всех различных станков маршрута одним пакетом
+    equipments = equipment_factory.create_equipments(op_data['machine'] for op_data in process_data)
     # Создаем список операций
     operations = []
     for op_data in process_data:
-        equipment = equipment_factory.create_equipment(op_data['machine'])
-        operation = Operation(
+        equipment = equipments[op_data['machine']]
+        operation = operation_type(
             number=op_data['number'], name=op_data['name'], time=Decimal(str(op_data['time'])), equipment=equipment
         )
         operations.append(operation)
     return operations
+
+
+def create_process_table_from_data(
+    process_data: List[Dict[str, Any]], factory: Callable = EquipmentFactory
+) -> ProcessTable:
+    """
+    Создает таблицу операций (столбцовое хранение) из входных данных без создания объектов операций.
+    Предназначена для маршрутов из миллионов операций (см. ProcessTable).
+
+    Args:
+        process_data: Список словарей с данными технологического процесса (см. create_operations_from_data)
+        factory: Callable - фабрика для создания оборудования
+
+    Returns:
+        ProcessTable: Таблица операций
+    """
+    equipments = factory().create_equipments(op_data['machine'] for op_data in process_data)
+    return ProcessTable.from_rows(
+        (op_data['number'], op_data['name'], op_data['time'], equipments[op_data['machine']])
+        for op_data in process_data
+    )
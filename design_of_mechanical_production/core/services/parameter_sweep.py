@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Многовариантный расчет цеха по сетке параметров (коэффициенты процесса, объем производства, доли зон).
+
+Оборудование и технологический процесс на одну деталь определяются один раз и используются во всех вариантах.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+from dataclasses import dataclass, fields, replace
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+from design_of_mechanical_production.core.entities import Process, SlottedOperation
+from design_of_mechanical_production.core.services.operation_creator import create_operations_from_data
+from design_of_mechanical_production.core.services.process_creator import create_process_from_data
+from design_of_mechanical_production.core.services.validation import (
+    validate_parameters_data,
+    validate_process_data,
+)
+from design_of_mechanical_production.core.services.workshop_creator import create_workshop
+from design_of_mechanical_production.settings import SettingsSnapshot, settings_snapshot
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Показатели, рассчитываемые для каждого варианта
+SWEEP_METRICS = (
+    'total_area',
+    'required_area',
+    'length',
+    'accepted_machines_count',
+    'total_machines_count',
+    'average_load_factor',
+)
+
+# Состояние процесса-исполнителя: базовый техпроцесс и параметры цеха передаются один раз при запуске пула
+_worker_state: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Вариант расчета. Незаданные (None) параметры берутся из исходных данных и настроек.
+
+    Attributes:
+        kv: Коэффициент выполнения нормы
+        kp: Коэффициент прогрессивности
+        fund_of_working: Действительный фонд времени работы одного станка, ч
+        production_volume: Годовой объем производства
+        grinding_zone_percent: Доля станков заточного отделения
+        repair_zone_percent: Доля станков ремонтного отделения
+    """
+
+    kv: Optional[Decimal] = None
+    kp: Optional[Decimal] = None
+    fund_of_working: Optional[Decimal] = None
+    production_volume: Optional[Decimal] = None
+    grinding_zone_percent: Optional[Decimal] = None
+    repair_zone_percent: Optional[Decimal] = None
+
+
+def scenario_grid(**axes: Iterable[Any]) -> List[Scenario]:
+    """
+    Формирует полную сетку вариантов (декартово произведение значений по осям).
+
+    Args:
+        **axes: Значения параметров по именам полей Scenario, например kp=[1.3, 1.4], production_volume=[5000, 50000]
+
+    Returns:
+        List[Scenario]: Варианты расчета
+
+    Raises:
+        ValueError: Если указан неизвестный параметр
+    """
+    names = [item.name for item in fields(Scenario)]
+    unknown = set(axes) - set(names)
+    if unknown:
+        raise ValueError(f"Неизвестные параметры варианта: {', '.join(sorted(unknown))}. Доступны: {', '.join(names)}")
+
+    keys = [name for name in names if name in axes]
+    values = [[Decimal(str(value)) for value in axes[key]] for key in keys]
+    return [Scenario(**dict(zip(keys, combination))) for combination in itertools.product(*values)]
+
+
+def evaluate_scenario(
+    process: Process,
+    parameters_data: Dict[str, Any],
+    scenario: Scenario,
+    settings: Optional[SettingsSnapshot] = None,
+) -> Dict[str, Any]:
+    """
+    Рассчитывает цех для одного варианта.
+
+    Args:
+        process: Технологический процесс на одну деталь (не изменяется)
+        parameters_data: Параметры цеха (name, production_volume, mass_detail)
+        scenario: Вариант расчета
+        settings: Снимок настроек расчета. Если не задан, используются текущие настройки
+
+    Returns:
+        Dict[str, Any]: Параметры варианта и показатели SWEEP_METRICS
+    """
+    settings = settings or settings_snapshot()
+    coefficients = {}
+    if scenario.kv is not None:
+        coefficients['_compliance_coefficient'] = scenario.kv
+    if scenario.kp is not None:
+        coefficients['_progressivity_coefficient'] = scenario.kp
+    if scenario.fund_of_working is not None:
+        coefficients['_fund_of_working'] = scenario.fund_of_working
+    scenario_process = replace(process, **coefficients) if coefficients else process
+
+    production_volume = scenario.production_volume
+    if production_volume is None:
+        production_volume = Decimal(str(parameters_data['production_volume']))
+    grinding_zone_percent = scenario.grinding_zone_percent
+    if grinding_zone_percent is None:
+        grinding_zone_percent = settings.grinding_zone_percent
+    repair_zone_percent = scenario.repair_zone_percent
+    if repair_zone_percent is None:
+        repair_zone_percent = settings.repair_zone_percent
+
+    workshop = create_workshop(
+        process=scenario_process,
+        name=parameters_data['name'],
+        production_volume=production_volume,
+        mass_detail=Decimal(str(parameters_data['mass_detail'])),
+        grinding_zone_percent=grinding_zone_percent,
+        repair_zone_percent=repair_zone_percent,
+        settings=settings,
+    )
+
+    row: Dict[str, Any] = {
+        'kv': workshop.process.compliance_coefficient,
+        'kp': workshop.process.progressivity_coefficient,
+        'fund_of_working': workshop.process.fund_of_working,
+        'production_volume': workshop.production_volume,
+        'grinding_zone_percent': grinding_zone_percent,
+        'repair_zone_percent': repair_zone_percent,
+        'total_area': workshop.total_area,
+        'required_area': workshop.required_area,
+        'length': workshop.length,
+        'accepted_machines_count': workshop.process.accepted_machines_count,
+        'total_machines_count': workshop.total_machines_count,
+        'average_load_factor': workshop.process.average_load_factor,
+    }
+    return {key: float(value) if isinstance(value, Decimal) else value for key, value in row.items()}
+
+
+def _init_worker(process: Process, parameters_data: Dict[str, Any], settings: SettingsSnapshot) -> None:
+    """Сохраняет базовые данные в процессе-исполнителе."""
+    _worker_state['process'] = process
+    _worker_state['parameters_data'] = parameters_data
+    _worker_state['settings'] = settings
+
+
+def _evaluate_in_worker(scenario: Scenario) -> Dict[str, Any]:
+    """Рассчитывает вариант в процессе-исполнителе."""
+    return evaluate_scenario(
+        _worker_state['process'], _worker_state['parameters_data'], scenario, _worker_state['settings']
+    )
+
+
+@validate_parameters_data
+@validate_process_data
+def run_sweep(
+    parameters_data: Dict[str, Any],
+    process_data: List[Dict[str, Any]],
+    scenarios: Sequence[Scenario],
+    workers: Optional[int] = 1,
+    vectorized: bool = False,
+) -> pd.DataFrame:
+    """
+    Выполняет многовариантный расчет цеха.
+
+    Args:
+        parameters_data: Параметры цеха (см. create_workshop_from_data)
+        process_data: Данные технологического процесса (см. create_workshop_from_data)
+        scenarios: Варианты расчета (см. scenario_grid)
+        workers: Количество процессов. None - по числу процессоров, 1 - расчет в текущем процессе
+        vectorized: Использовать векторизованный расчет количества станков (см. Process.vectorized)
+
+    Returns:
+        pd.DataFrame: Таблица, строка - вариант, столбцы - параметры варианта и показатели SWEEP_METRICS
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import pandas as pd
+
+    # Настройки и оборудование определяются один раз для всех вариантов (в том числе в процессах-исполнителях),
+    # операции компактные: процесс хранится в каждом процессе-исполнителе
+    settings = settings_snapshot()
+    operations = create_operations_from_data(process_data, operation_type=SlottedOperation)
+    process = create_process_from_data(operations, settings=settings)
+    if vectorized:
+        process = replace(process, vectorized=True)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(scenarios) <= 1:
+        rows = [evaluate_scenario(process, parameters_data, scenario, settings) for scenario in scenarios]
+    else:
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(process, dict(parameters_data), settings)
+        ) as executor:
+            rows = list(executor.map(_evaluate_in_worker, scenarios, chunksize=chunksize))
+
+    columns = [item.name for item in fields(Scenario)] + list(SWEEP_METRICS)
+    return pd.DataFrame(rows, columns=columns)
@@ -1,24 +1,30 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from typing import List
+from typing import List, Optional
 
 from design_of_mechanical_production.core.entities import Operation, Process
+from design_of_mechanical_production.settings import SettingsSnapshot, settings_snapshot
 
 
-def create_process_from_data(operations: List[Operation]) -> Process:
+def create_process_from_data(operations: List[Operation], settings: Optional[SettingsSnapshot] = None) -> Process:
     """
     Создает объект технологического процесса из входных данных.
 
     Args:
         operations: Список операций
+        settings: Снимок настроек расчета (фонд времени и коэффициенты). Если не задан, используются текущие настройки
 
     Returns:
         Process: Созданный объект технологического процесса
     """
-    # Создаем технологический процесс
-    process = Process()
-    for operation in operations:
-        process.add_operation(operation)
+    # Создаем технологический процесс (доли операций рассчитываются один раз для всего маршрута)
+    settings = settings or settings_snapshot()
+    process = Process.from_operations(
+        operations,
+        _compliance_coefficient=settings.kv,
+        _progressivity_coefficient=settings.kp,
+        _fund_of_working=settings.fund_of_working,
+    )
     process.calculate_required_machines()
     return process
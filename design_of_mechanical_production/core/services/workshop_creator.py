@@ -2,25 +2,37 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from decimal import Decimal
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 from design_of_mechanical_production.core.entities import MachineInfo, Workshop
 from design_of_mechanical_production.core.factories import WorkshopZoneFactory
-from design_of_mechanical_production.core.services import create_operations_from_data, create_process_from_data
+from design_of_mechanical_production.core.interfaces import IProcess, IWorkshop
+from design_of_mechanical_production.core.services.operation_creator import create_operations_from_data
+from design_of_mechanical_production.core.services.process_creator import create_process_from_data
 from design_of_mechanical_production.core.services.validation import (
     validate_parameters_data,
     validate_process_data,
 )
-from design_of_mechanical_production.settings import get_setting
+from design_of_mechanical_production.settings import SettingsSnapshot, settings_snapshot
 
-# Константы для расчета зон
-GRINDING_ZONE_PERCENT = Decimal(str(get_setting('grinding_zone_percent')))  # 5% от общего числа станков
-REPAIR_ZONE_PERCENT = Decimal(str(get_setting('repair_zone_percent')))  # 2.5% от общего числа станков
+# Этапы расчета цеха
+STAGE_OPERATIONS = 'operations'
+STAGE_ZONES = 'zones'
+
+
+class CalculationCancelled(Exception):
+    """Расчет отменен пользователем."""
 
 
 @validate_parameters_data
 @validate_process_data
-def create_workshop_from_data(parameters_data: Dict[str, Any], process_data: List[Dict[str, Any]]) -> Workshop:
+def create_workshop_from_data(
+    parameters_data: Dict[str, Any],
+    process_data: List[Dict[str, Any]],
+    on_progress: Optional[Callable[[str], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Workshop:
     """
     Создает объект цеха из входных данных.
 
@@ -34,61 +46,167 @@ def create_workshop_from_data(parameters_data: Dict[str, Any], process_data: Lis
             - name: str - название операции
             - time: float - время операции
             - machine: str - модель станка
+        on_progress: Функция, вызываемая с названием этапа (STAGE_OPERATIONS, STAGE_ZONES) после его завершения
+        is_cancelled: Функция проверки отмены (проверяется перед каждым этапом)
 
     Returns:
         Workshop: Созданный объект цеха
 
     Raises:
         ValueError: Если входные данные некорректны
+        CalculationCancelled: Если расчет отменен
     """
+
+    def check_cancelled() -> None:
+        if is_cancelled is not None and is_cancelled():
+            raise CalculationCancelled()
+
+    def stage_done(stage: str) -> None:
+        if on_progress is not None:
+            on_progress(stage)
+
+    check_cancelled()
+    # Настройки берутся один раз: изменение настроек во время расчета на него не влияет
+    settings = settings_snapshot()
     # Создаем технологический процесс
-    process = create_process_from_data(create_operations_from_data(process_data))
+    process = create_process_from_data(create_operations_from_data(process_data), settings=settings)
+    stage_done(STAGE_OPERATIONS)
 
-    # Создаем цех с основной зоной
-    workshop = Workshop(
+    check_cancelled()
+    workshop = create_workshop(
+        process=process,
         name=parameters_data['name'],
         production_volume=Decimal(str((parameters_data['production_volume']))),
         mass_detail=Decimal(str(parameters_data['mass_detail'])),
+        settings=settings,
+    )
+    stage_done(STAGE_ZONES)
+    return workshop
+
+
+def create_workshop(
+    process: IProcess,
+    name: str,
+    production_volume: Decimal,
+    mass_detail: Decimal,
+    grinding_zone_percent: Optional[Decimal] = None,
+    repair_zone_percent: Optional[Decimal] = None,
+    settings: Optional[SettingsSnapshot] = None,
+) -> Workshop:
+    """
+    Создает цех по готовому технологическому процессу на одну деталь (оборудование уже определено).
+
+    Args:
+        process: Технологический процесс на одну деталь
+        name: Название цеха
+        production_volume: Годовой объем производства
+        mass_detail: Масса детали
+        grinding_zone_percent: Доля станков заточного отделения от числа станков основной зоны
+            (по умолчанию - из настроек)
+        repair_zone_percent: Доля станков ремонтного отделения от числа станков основной зоны
+            (по умолчанию - из настроек)
+        settings: Снимок настроек расчета. Если не задан, используются текущие настройки
+
+    Returns:
+        Workshop: Созданный объект цеха
+    """
+    if settings is None:
+        settings = settings_snapshot()
+    if grinding_zone_percent is None:
+        grinding_zone_percent = settings.grinding_zone_percent
+    if repair_zone_percent is None:
+        repair_zone_percent = settings.repair_zone_percent
+
+    # Создаем цех с основной зоной
+    workshop = Workshop(
+        name=name,
+        production_volume=production_volume,
+        mass_detail=mass_detail,
         process_for_one_detail=process,
+        settings=settings,
     )
 
     # Создаем фабрику зон
-    zone_factory = WorkshopZoneFactory()
+    zone_factory = WorkshopZoneFactory(settings)
 
     # Создаем и добавляем основную зону
-    workshop.add_zone(*zone_factory.create_main_zone(workshop.process.machines))
+    workshop.add_zone(*zone_factory.create_main_zone(workshop.process.machines), updater=_update_main_zone)
 
     # Создаем и добавляем дополнительные зоны
     grinding_zone_machines_count = {
         "3В642": MachineInfo(
             model="Станок универсально-заточной 3В642",
-            calculated_count=workshop.process.accepted_machines_count * GRINDING_ZONE_PERCENT,
+            calculated_count=workshop.process.accepted_machines_count * grinding_zone_percent,
         )
     }
-    workshop.add_zone(*zone_factory.create_grinding_zone(grinding_zone_machines_count))
+    workshop.add_zone(
+        *zone_factory.create_grinding_zone(grinding_zone_machines_count),
+        updater=partial(_update_zone_machines_by_percent, 'grinding_zone', grinding_zone_percent),
+    )
     repair_zone_machines_count = {
         "3В642": MachineInfo(
             model="Станок универсально-заточной 3В642",
-            calculated_count=workshop.process.accepted_machines_count * REPAIR_ZONE_PERCENT,
+            calculated_count=workshop.process.accepted_machines_count * repair_zone_percent,
         )
     }
-    workshop.add_zone(*zone_factory.create_repair_zone(repair_zone_machines_count))
+    workshop.add_zone(
+        *zone_factory.create_repair_zone(repair_zone_machines_count),
+        updater=partial(_update_zone_machines_by_percent, 'repair_zone', repair_zone_percent),
+    )
 
     # Расчет общего количества станков
-    total_machines_count = (
-        workshop.zones['main_zone'].accepted_machines_count
-        + workshop.zones['grinding_zone'].accepted_machines_count
-        + workshop.zones['repair_zone'].accepted_machines_count
-    )
+    total_machines_count = _machines_count(workshop)
 
     # Создаем и добавляем вспомогательные зоны
-    workshop.add_zone(*zone_factory.create_tool_storage_zone(total_machines_count))
-    workshop.add_zone(*zone_factory.create_equipment_warehouse_zone(total_machines_count))
-    workshop.add_zone(*zone_factory.create_work_piece_storage_zone(workshop.zones['main_zone'].area))
-    workshop.add_zone(*zone_factory.create_control_department_zone(total_machines_count))
+    workshop.add_zone(
+        *zone_factory.create_tool_storage_zone(total_machines_count),
+        updater=partial(_update_zone_by_machines_count, 'tool_storage_zone'),
+    )
+    workshop.add_zone(
+        *zone_factory.create_equipment_warehouse_zone(total_machines_count),
+        updater=partial(_update_zone_by_machines_count, 'equipment_warehouse_zone'),
+    )
+    workshop.add_zone(
+        *zone_factory.create_work_piece_storage_zone(workshop.zones['main_zone'].area),
+        updater=partial(_update_zone_by_main_zone_area, 'work_piece_storage_zone'),
+    )
+    workshop.add_zone(
+        *zone_factory.create_control_department_zone(total_machines_count),
+        updater=partial(_update_zone_by_machines_count, 'control_department_zone'),
+    )
     workshop.add_zone(*zone_factory.create_sanitary_zone())
 
     # Рассчитываем длину цеха по дефолтному варианту
     workshop.default_calculate_length()
 
     return workshop
+
+
+def _machines_count(workshop: IWorkshop) -> int:
+    """Общее количество станков основной зоны, заточного и ремонтного отделений."""
+    return (
+        workshop.zones['main_zone'].accepted_machines_count
+        + workshop.zones['grinding_zone'].accepted_machines_count
+        + workshop.zones['repair_zone'].accepted_machines_count
+    )
+
+
+def _update_main_zone(workshop: IWorkshop) -> None:
+    """Пересчет основной зоны: состав и количество станков берутся из процесса на программу."""
+    workshop.zones['main_zone'].machines = dict(workshop.process.machines)
+
+
+def _update_zone_machines_by_percent(zone_name: str, percent: Decimal, workshop: IWorkshop) -> None:
+    """Пересчет заточного (ремонтного) отделения: доля от принятого количества станков процесса."""
+    for machine in workshop.zones[zone_name].machines.values():
+        machine.calculated_count = workshop.process.accepted_machines_count * percent
+
+
+def _update_zone_by_machines_count(zone_name: str, workshop: IWorkshop) -> None:
+    """Пересчет вспомогательной зоны, площадь которой зависит от общего количества станков."""
+    workshop.zones[zone_name].set_unit_of_calculation(_machines_count(workshop))
+
+
+def _update_zone_by_main_zone_area(zone_name: str, workshop: IWorkshop) -> None:
+    """Пересчет вспомогательной зоны, площадь которой зависит от площади основной зоны."""
+    workshop.zones[zone_name].set_unit_of_calculation(workshop.zones['main_zone'].area)
@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+from design_of_mechanical_production.data.input.columnar_reader import (
+    ColumnarReader,
+    convert_workbook,
+    create_data_reader,
+)
 from design_of_mechanical_production.data.input.create_initial_data import create_initial_data
 from design_of_mechanical_production.data.input.excel_reader import ExcelReader
 
-__all__ = ['create_initial_data', 'ExcelReader']
+__all__ = ['create_initial_data', 'ExcelReader', 'ColumnarReader', 'convert_workbook', 'create_data_reader']
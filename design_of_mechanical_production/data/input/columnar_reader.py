@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Чтение начальных данных из колоночных форматов (CSV, Parquet, Arrow IPC).
+
+Набор данных - каталог с таблицами Parameters и Process (названия совпадают с листами книги Excel),
+например: initial_data/Parameters.parquet и initial_data/Process.parquet.
+Для Parquet и Arrow IPC требуется pyarrow (или fastparquet для Parquet).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from design_of_mechanical_production.core.interfaces import IDataReader
+from design_of_mechanical_production.data.input.excel_reader import (
+    PARAMETERS_SHEET,
+    PROCESS_SHEET,
+    SHEET_DTYPES,
+    ExcelReader,
+    parameters_from_frame,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Форматы колоночных таблиц: {формат: расширение файла}
+COLUMNAR_FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+# Расширения файлов книг Excel
+EXCEL_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+
+
+def _table_file(dataset: Path, table: str) -> Optional[Path]:
+    """
+    Ищет файл таблицы набора данных (в порядке COLUMNAR_FORMATS).
+    """
+    for suffix in COLUMNAR_FORMATS.values():
+        path = dataset / f"{table}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def is_columnar_dataset(path: Union[str, Path]) -> bool:
+    """
+    Проверяет, что путь - каталог набора данных в колоночном формате (есть таблица Process).
+
+    Args:
+        path: Проверяемый путь
+    """
+    path = Path(path)
+    return path.is_dir() and _table_file(path, PROCESS_SHEET) is not None
+
+
+def read_table(path: Path, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Читает колоночную таблицу. Колонки из dtype приводятся к указанному типу (пустые значения остаются NaN).
+
+    Args:
+        path: Файл таблицы (.csv, .parquet, .arrow)
+        dtype: Типы колонок, например {'number': str}
+
+    Returns:
+        pd.DataFrame: Таблица
+    """
+    import pandas as pd
+
+    suffix = path.suffix.lower()
+    if suffix == COLUMNAR_FORMATS['csv']:
+        return pd.read_csv(path, dtype=dtype, encoding='utf-8')
+    if suffix == COLUMNAR_FORMATS['parquet']:
+        df = pd.read_parquet(path)
+    elif suffix == COLUMNAR_FORMATS['arrow']:
+        df = pd.read_feather(path)
+    else:
+        raise ValueError(f"Неизвестный формат таблицы: {path}")
+
+    # В Parquet и Arrow типы колонок сохранены в файле, приводим их так же, как при чтении CSV и Excel
+    for column, column_type in (dtype or {}).items():
+        if column in df.columns:
+            df[column] = df[column].map(lambda value: value if pd.isna(value) else column_type(value))
+    return df
+
+
+class ColumnarReader(IDataReader):
+    """
+    Класс для чтения начальных данных из колоночных таблиц (CSV, Parquet, Arrow IPC).
+    Результат совпадает с ExcelReader для тех же данных.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Каталог набора данных или файл таблицы Process (таблица Parameters ищется рядом)
+        """
+        path = Path(path)
+        self.dataset = path if path.is_dir() else path.parent
+        self.process_file = _table_file(path, PROCESS_SHEET) if path.is_dir() else path
+
+    def read_parameters_data(self) -> Dict[str, Any]:
+        """
+        Читает данные о цехе и параметрах.
+        """
+        try:
+            parameters_file = _table_file(self.dataset, PARAMETERS_SHEET)
+            if parameters_file is None:
+                raise FileNotFoundError(f"в каталоге {self.dataset} нет таблицы {PARAMETERS_SHEET}")
+            return parameters_from_frame(read_table(parameters_file, SHEET_DTYPES[PARAMETERS_SHEET]))
+        except Exception as e:
+            raise Exception(f"Ошибка при чтении данных о параметрах: {str(e)}")
+
+    def read_process_data(self) -> Dict[str, Any]:
+        """
+        Читает данные о технологическом процессе.
+        """
+        try:
+            if self.process_file is None:
+                raise FileNotFoundError(f"в каталоге {self.dataset} нет таблицы {PROCESS_SHEET}")
+            return read_table(self.process_file, SHEET_DTYPES[PROCESS_SHEET]).to_dict('records')
+        except Exception as e:
+            raise Exception(f"Ошибка при чтении данных о технологическом процессе: {str(e)}")
+
+
+def create_data_reader(path: Union[str, Path]) -> IDataReader:
+    """
+    Создает объект чтения начальных данных по пути: книга Excel или набор данных в колоночном формате.
+
+    Args:
+        path: Файл Excel, каталог набора данных или файл таблицы Process
+
+    Returns:
+        IDataReader: Объект чтения начальных данных
+    """
+    path = Path(path)
+    if path.suffix.lower() in EXCEL_SUFFIXES:
+        return ExcelReader(path)
+    return ColumnarReader(path)
+
+
+def convert_workbook(
+    workbook: Union[str, Path], output_dir: Optional[Union[str, Path]] = None, fmt: str = 'parquet'
+) -> Path:
+    """
+    Преобразует книгу Excel начальных данных в набор данных в колоночном формате.
+    Повторные расчеты по набору данных не используют openpyxl.
+
+    Args:
+        workbook: Файл Excel
+        output_dir: Каталог набора данных (по умолчанию - рядом с книгой, имя книги без расширения)
+        fmt: Формат таблиц ('csv', 'parquet', 'arrow')
+
+    Returns:
+        Path: Каталог набора данных
+    """
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Неизвестный формат: {fmt}. Доступны: {', '.join(COLUMNAR_FORMATS)}")
+    workbook = Path(workbook)
+    output_dir = Path(output_dir) if output_dir is not None else workbook.with_suffix('')
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for table, df in ExcelReader(workbook).read_sheets().items():
+        path = output_dir / f"{table}{COLUMNAR_FORMATS[fmt]}"
+        if fmt == 'csv':
+            df.to_csv(path, index=False, encoding='utf-8')
+        elif fmt == 'parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_feather(path)
+    return output_dir
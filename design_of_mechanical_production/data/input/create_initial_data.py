@@ -1,14 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-import pandas as pd
-
 from design_of_mechanical_production.settings import get_setting
 
 INPUT_DATA_PATH = str(get_setting('input_data_path'))
 
 
 def create_initial_data():
+    import pandas as pd
+
     # Данные о цехе
     parameters_data = {'name': ['Механический цех №1'], 'production_volume': [10000], 'mass_detail': [112.8]}
 
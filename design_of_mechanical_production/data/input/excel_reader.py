@@ -1,33 +1,113 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from pathlib import Path
-from typing import Any, Dict
+from __future__ import annotations
 
-import pandas as pd
+import math
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from design_of_mechanical_production.core.interfaces import IDataReader
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+PARAMETERS_SHEET = 'Parameters'
+PROCESS_SHEET = 'Process'
+# Типы колонок при чтении листов (номер операции читается как строка)
+SHEET_DTYPES = {PARAMETERS_SHEET: None, PROCESS_SHEET: {'number': str}}
+
+
+def parameters_from_frame(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Формирует параметры цеха из таблицы Parameters (первая строка).
+
+    Args:
+        df: Таблица параметров
+
+    Returns:
+        Dict[str, Any]: Параметры цеха (name, production_volume, mass_detail)
+    """
+    return {
+        'name': df['name'].iloc[0],
+        'production_volume': int(df['production_volume'].iloc[0]),
+        'mass_detail': float(df['mass_detail'].iloc[0]),
+    }
+
+
+def default_engine() -> Optional[str]:
+    """
+    Возвращает движок чтения Excel по умолчанию: calamine, если установлен пакет python-calamine,
+    иначе None (движок pandas по умолчанию - openpyxl).
+    """
+    return 'calamine' if find_spec('python_calamine') is not None else None
+
 
 class ExcelReader(IDataReader):
     """
     Класс для чтения данных из Excel файлов.
+
+    Книга открывается и разбирается один раз: оба листа (Parameters и Process) читаются при первом обращении
+    к любому из методов чтения.
     """
 
-    def __init__(self, filepath: Path):
+    def __init__(self, filepath: Path, engine: Optional[str] = None):
+        """
+        Args:
+            filepath: Путь к файлу начальных данных
+            engine: Движок чтения pandas ('openpyxl', 'calamine'). По умолчанию - см. default_engine
+        """
         self.filepath = filepath
+        self.engine = engine or default_engine()
+        self._sheets: Optional[Dict[str, pd.DataFrame]] = None
+        self._errors: Dict[str, Exception] = {}
+
+    def _load(self) -> None:
+        """
+        Открывает книгу и читает листы начальных данных за одно открытие файла.
+        Ошибка чтения листа сохраняется и выдается при обращении к этому листу.
+        """
+        if self._sheets is not None:
+            return
+        import pandas as pd
+
+        self._sheets = {}
+        try:
+            with pd.ExcelFile(self.filepath, engine=self.engine) as workbook:
+                for sheet_name, dtype in SHEET_DTYPES.items():
+                    try:
+                        self._sheets[sheet_name] = workbook.parse(sheet_name, dtype=dtype)
+                    except Exception as e:
+                        self._errors[sheet_name] = e
+        except Exception as e:
+            for sheet_name in SHEET_DTYPES:
+                self._errors[sheet_name] = e
+
+    def _sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        Возвращает прочитанный лист книги.
+        """
+        self._load()
+        if sheet_name in self._errors:
+            raise self._errors[sheet_name]
+        return self._sheets[sheet_name]
+
+    def read_sheets(self) -> Dict[str, pd.DataFrame]:
+        """
+        Возвращает листы начальных данных в виде таблиц (для преобразования в другие форматы).
+
+        Returns:
+            Dict[str, pd.DataFrame]: Таблицы по названиям листов (Parameters, Process)
+        """
+        return {sheet_name: self._sheet(sheet_name) for sheet_name in SHEET_DTYPES}
 
     def read_parameters_data(self) -> Dict[str, Any]:
         """
         Читает данные о цехе и параметрах из Excel.
         """
         try:
-            df = pd.read_excel(self.filepath, sheet_name='Parameters')
-            return {
-                'name': df['name'].iloc[0],
-                'production_volume': int(df['production_volume'].iloc[0]),
-                'mass_detail': float(df['mass_detail'].iloc[0])
-            }
+            return parameters_from_frame(self._sheet(PARAMETERS_SHEET))
         except Exception as e:
             raise Exception(f"Ошибка при чтении данных о параметрах: {str(e)}")
 
@@ -36,8 +116,102 @@ class ExcelReader(IDataReader):
         Читает данные о технологическом процессе из Excel.
         """
         try:
-            # Указываем тип данных для колонки number как строковый
-            df = pd.read_excel(self.filepath, sheet_name='Process', dtype={'number': str})
-            return df.to_dict('records')
+            # Колонка number читается как строковая (см. SHEET_DTYPES)
+            return self._sheet(PROCESS_SHEET).to_dict('records')
         except Exception as e:
             raise Exception(f"Ошибка при чтении данных о технологическом процессе: {str(e)}")
+
+    def iter_process_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Построчно читает технологический процесс без загрузки листа в память (openpyxl, режим read-only).
+        Предназначен для очень больших листов Process.
+
+        Строки совпадают с read_process_data: пустые строки пропускаются, пустые ячейки - NaN, номер операции -
+        строка. Лист просматривается дважды: сначала определяются дробные колонки (как в pandas, числовая колонка
+        с дробными значениями или пустыми ячейками читается как float), затем строки выдаются по одной.
+
+        Yields:
+            Dict[str, Any]: Данные операции
+        """
+        from openpyxl import load_workbook
+
+        try:
+            workbook = load_workbook(self.filepath, read_only=True, data_only=True)
+        except Exception as e:
+            raise Exception(f"Ошибка при чтении данных о технологическом процессе: {str(e)}")
+        try:
+            if PROCESS_SHEET not in workbook.sheetnames:
+                raise Exception(f"Ошибка при чтении данных о технологическом процессе: нет листа '{PROCESS_SHEET}'")
+            sheet = workbook[PROCESS_SHEET]
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(column) for column in header]
+            float_columns = _float_columns(rows, columns)
+            for values in sheet.iter_rows(min_row=2, values_only=True):
+                if _is_empty(values):
+                    continue
+                row = {column: _convert_cell(value) for column, value in zip(columns, _pad(values, len(columns)))}
+                for column in float_columns:
+                    row[column] = float(row[column])
+                if isinstance(row.get('number'), (int, float)) and not _is_nan(row['number']):
+                    row['number'] = str(row['number'])
+                yield row
+        finally:
+            workbook.close()
+
+
+def _float_columns(rows: Iterable[Sequence[Any]], columns: List[str]) -> List[str]:
+    """
+    Определяет колонки, которые pandas читает как дробные: все значения - числа, и среди них есть дробные
+    или пустые ячейки (колонка number читается как строковая и не учитывается).
+    """
+    numeric = [True] * len(columns)
+    fractional = [False] * len(columns)
+    for values in rows:
+        if _is_empty(values):
+            continue
+        for index, value in enumerate(_pad(values, len(columns))):
+            value = _convert_cell(value)
+            if _is_nan(value) or isinstance(value, float):
+                fractional[index] = True
+            elif isinstance(value, bool) or not isinstance(value, int):
+                numeric[index] = False
+    return [
+        column
+        for column, is_numeric, is_fractional in zip(columns, numeric, fractional)
+        if column != 'number' and is_numeric and is_fractional
+    ]
+
+
+def _is_empty(values: Sequence[Any]) -> bool:
+    """
+    Проверяет, что строка листа пустая (такие строки pandas пропускает).
+    """
+    return all(value is None for value in values)
+
+
+def _pad(values: Sequence[Any], size: int) -> Sequence[Any]:
+    """
+    Дополняет строку листа пустыми ячейками до количества колонок.
+    """
+    return values if len(values) >= size else tuple(values) + (None,) * (size - len(values))
+
+
+def _convert_cell(value: Any) -> Any:
+    """
+    Приводит значение ячейки к виду, который дает pandas: пустая ячейка - NaN, целое дробное число - int.
+    """
+    if value is None:
+        return float('nan')
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _is_nan(value: Any) -> bool:
+    """
+    Проверяет, что значение - NaN.
+    """
+    return isinstance(value, float) and math.isnan(value)
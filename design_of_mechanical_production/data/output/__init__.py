@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+from design_of_mechanical_production.data.output.summary import ReportSummary, write_operations_table
 from design_of_mechanical_production.data.output.text_report import TextReportGenerator
 
-__all__ = ['TextReportGenerator']
+__all__ = ['ReportSummary', 'TextReportGenerator', 'write_operations_table']
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from decimal import Decimal
-from typing import List
+from typing import Iterable, Iterator, List
 
 from design_of_mechanical_production.core.interfaces import INumberFormatter, ITableFormatter
 
@@ -44,23 +44,27 @@ class TableFormatter(ITableFormatter):
         """
         Форматирует таблицу с заголовками, данными и строкой итога.
         """
-        table = list()
+        return list(self.iter_format(headers, data, total_row))
+
+    def iter_format(self, headers: List[str], data: Iterable[tuple], total_row: tuple) -> Iterator[str]:
+        """
+        Форматирует таблицу построчно: строки данных читаются и выводятся по одной.
+        """
+        separator = "+" + "+".join("-" * 20 for _ in headers) + "+"
         # Добавляем разделительную линию
-        table.append("+" + "+".join("-" * 20 for _ in headers) + "+")
+        yield separator
         # Добавляем заголовки
-        table.append("|" + "|".join(f"{header:^20}" for header in headers) + "|")
+        yield "|" + "|".join(f"{header:^20}" for header in headers) + "|"
         # Добавляем разделительную линию
-        table.append("+" + "+".join("-" * 20 for _ in headers) + "+")
+        yield separator
 
         # Добавляем данные
         for row in data:
-            table.append("|" + "|".join(f"{cell:^20}" for cell in row) + "|")
+            yield "|" + "|".join(f"{cell:^20}" for cell in row) + "|"
 
         # Добавляем разделительную линию
-        table.append("+" + "+".join("-" * 20 for _ in headers) + "+")
+        yield separator
         # Добавляем строку итога
-        table.append("|" + "|".join(f"{cell:^20}" for cell in total_row) + "|")
+        yield "|" + "|".join(f"{cell:^20}" for cell in total_row) + "|"
         # Добавляем нижнюю границу таблицы
-        table.append("+" + "+".join("-" * 20 for _ in headers) + "+")
-
-        return table
+        yield separator
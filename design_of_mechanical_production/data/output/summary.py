@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Сводный режим текстового отчета для длинных маршрутов.
+
+Операции группируются по виду операции и модели станка, подробный расчет в отчете приводится только
+для нескольких операций с наибольшей трудоемкостью (или загрузкой), а расчет по каждой операции сохраняется
+в отдельную таблицу операций (CSV, Parquet, Arrow IPC). Объем отчета не зависит от длины маршрута.
+"""
+import csv
+import heapq
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from design_of_mechanical_production.core.interfaces import IEquipment, IOperation
+from design_of_mechanical_production.data.input.columnar_reader import COLUMNAR_FORMATS
+
+# Критерии отбора операций для подробного расчета: {атрибут операции: наименование в отчете}
+DETAIL_KEYS = {'time': 'трудоемкостью', 'load_factor': 'коэффициентом загрузки'}
+# Окончание имени файла таблицы операций (рядом с файлом отчета)
+OPERATIONS_TABLE_SUFFIX = '_operations'
+# Колонки таблицы операций (первые четыре совпадают с таблицей Process начальных данных)
+OPERATIONS_TABLE_COLUMNS = (
+    'number',
+    'name',
+    'time',
+    'machine',
+    'percentage',
+    'calculated_equipment_count',
+    'accepted_equipment_count',
+    'load_factor',
+    'area',
+)
+# Текстовые колонки таблицы операций
+TEXT_COLUMNS = ('number', 'name', 'machine')
+
+
+@dataclass(frozen=True)
+class ReportSummary:
+    """
+    Параметры сводного отчета.
+
+    Attributes:
+        top: Количество операций с подробным расчетом
+        key: Критерий отбора операций ('time' - трудоемкость, 'load_factor' - коэффициент загрузки)
+        table_format: Формат таблицы операций ('csv', 'parquet', 'arrow')
+    """
+
+    top: int = 20
+    key: str = 'time'
+    table_format: str = 'csv'
+
+    def __post_init__(self) -> None:
+        if self.top < 0:
+            raise ValueError(f"Количество операций с подробным расчетом не может быть отрицательным: {self.top}")
+        if self.key not in DETAIL_KEYS:
+            raise ValueError(f"Неизвестный критерий отбора операций: {self.key}. Доступны: {', '.join(DETAIL_KEYS)}")
+        if self.table_format not in COLUMNAR_FORMATS:
+            raise ValueError(
+                f"Неизвестный формат таблицы операций: {self.table_format}. Доступны: {', '.join(COLUMNAR_FORMATS)}"
+            )
+
+    def table_path(self, report_path: Path) -> Path:
+        """
+        Файл таблицы операций для файла отчета (например, report.txt -> report_operations.csv).
+
+        Args:
+            report_path: Файл отчета
+        """
+        report_path = Path(report_path)
+        return report_path.with_name(
+            f"{report_path.stem}{OPERATIONS_TABLE_SUFFIX}{COLUMNAR_FORMATS[self.table_format]}"
+        )
+
+
+@dataclass
+class OperationGroup:
+    """
+    Операции одного вида на станках одной модели.
+    """
+
+    name: str
+    equipment: IEquipment
+    count: int = 0
+    time: Decimal = Decimal('0')
+    percentage: Decimal = Decimal('0')
+    calculated_equipment_count: Decimal = Decimal('0')
+    accepted_equipment_count: int = 0
+    area: Decimal = Decimal('0')  # площадь, занимаемая станками операций (с местом на проходы), м²
+
+    @property
+    def load_factor(self) -> Decimal:
+        """Коэффициент загрузки станков группы."""
+        if self.accepted_equipment_count > 0:
+            return self.calculated_equipment_count / Decimal(self.accepted_equipment_count)
+        return Decimal('0')
+
+
+def operation_area(operation: IOperation, passage_area: Decimal) -> Decimal:
+    """
+    Площадь, занимаемая станками операции (с местом на проходы), м².
+
+    Args:
+        operation: Операция
+        passage_area: Место на проходы, м²
+    """
+    equipment = operation.equipment
+    return equipment.length * equipment.width * operation.accepted_equipment_count + passage_area
+
+
+def group_operations(operations: Iterable[IOperation], passage_area: Decimal) -> List[OperationGroup]:
+    """
+    Группирует операции по виду операции и модели станка (в порядке первого появления).
+
+    Args:
+        operations: Операции рассчитанного техпроцесса
+        passage_area: Место на проходы, м²
+
+    Returns:
+        List[OperationGroup]: Группы операций
+    """
+    groups: Dict[Tuple[str, str], OperationGroup] = {}
+    for operation in operations:
+        key = (operation.name, operation.equipment.model)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = OperationGroup(operation.name, operation.equipment)
+        group.count += 1
+        group.time += operation.time
+        group.percentage += operation.percentage or 0
+        group.calculated_equipment_count += operation.calculated_equipment_count
+        group.accepted_equipment_count += operation.accepted_equipment_count
+        group.area += operation_area(operation, passage_area)
+    return list(groups.values())
+
+
+def select_operations(operations: Sequence[IOperation], top: int, key: str = 'time') -> List[IOperation]:
+    """
+    Отбирает операции с наибольшей трудоемкостью или загрузкой (в порядке маршрута).
+
+    Args:
+        operations: Операции техпроцесса
+        top: Количество операций
+        key: Критерий отбора ('time' или 'load_factor')
+
+    Returns:
+        List[IOperation]: Отобранные операции
+    """
+    indexes = heapq.nlargest(top, range(len(operations)), key=lambda index: getattr(operations[index], key))
+    return [operations[index] for index in sorted(indexes)]
+
+
+def _operation_rows(operations: Iterable[IOperation], passage_area: Decimal) -> Iterable[tuple]:
+    """Строки таблицы операций (значения в порядке OPERATIONS_TABLE_COLUMNS)."""
+    for operation in operations:
+        yield (
+            operation.number,
+            operation.name,
+            operation.time,
+            operation.equipment.model,
+            operation.percentage,
+            operation.calculated_equipment_count,
+            operation.accepted_equipment_count,
+            operation.load_factor,
+            operation_area(operation, passage_area),
+        )
+
+
+def _column_values(name: str, values: Sequence[Any]) -> List[Any]:
+    """Значения колонки таблицы операций для Parquet и Arrow IPC (Decimal хранится как float64)."""
+    if name in TEXT_COLUMNS or name == 'accepted_equipment_count':
+        return list(values)
+    return [None if value is None else float(value) for value in values]
+
+
+def write_operations_table(operations: Iterable[IOperation], passage_area: Decimal, filepath: Path) -> None:
+    """
+    Сохраняет расчет по каждой операции в колоночную таблицу. Формат определяется расширением файла:
+    CSV записывается построчно (значения без округления), для Parquet и Arrow IPC требуется pandas и pyarrow.
+    Первые колонки совпадают с таблицей Process, поэтому таблица читается ColumnarReader.
+
+    Args:
+        operations: Операции рассчитанного техпроцесса
+        passage_area: Место на проходы, м²
+        filepath: Файл таблицы (.csv, .parquet, .arrow)
+    """
+    filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
+    rows = _operation_rows(operations, passage_area)
+    if suffix == COLUMNAR_FORMATS['csv']:
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(OPERATIONS_TABLE_COLUMNS)
+            writer.writerows(('' if value is None else value for value in row) for row in rows)
+        return
+    if suffix not in (COLUMNAR_FORMATS['parquet'], COLUMNAR_FORMATS['arrow']):
+        raise ValueError(f"Неизвестный формат таблицы: {filepath}")
+
+    import pandas as pd
+
+    columns = list(zip(*rows)) or [()] * len(OPERATIONS_TABLE_COLUMNS)
+    df = pd.DataFrame({name: _column_values(name, values) for name, values in zip(OPERATIONS_TABLE_COLUMNS, columns)})
+    if suffix == COLUMNAR_FORMATS['parquet']:
+        df.to_parquet(filepath, index=False)
+    else:
+        df.to_feather(filepath)
@@ -2,314 +2,521 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 import textwrap
-from decimal import Decimal
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO
 
 from design_of_mechanical_production.core.entities.workshop import Workshop
-from design_of_mechanical_production.core.interfaces import INumberFormatter, IReportGenerator, ITableFormatter
+from design_of_mechanical_production.core.interfaces import (
+    INumberFormatter,
+    IOperation,
+    IReportGenerator,
+    ITableFormatter,
+)
+from design_of_mechanical_production.data.input.columnar_reader import COLUMNAR_FORMATS
 from design_of_mechanical_production.data.output.formatters import NumberFormatter, TableFormatter
-from design_of_mechanical_production.settings import get_setting
+from design_of_mechanical_production.data.output.summary import (
+    DETAIL_KEYS,
+    OPERATIONS_TABLE_SUFFIX,
+    OperationGroup,
+    ReportSummary,
+    group_operations,
+    operation_area,
+    select_operations,
+    write_operations_table,
+)
+
+# Максимальная ширина строки сохраненного отчета
+REPORT_WIDTH = 120
+
+
+def wrap_lines(lines: Iterable[str], width: int = REPORT_WIDTH) -> Iterator[str]:
+    """
+    Переносит строки отчета по ширине (пустые строки сохраняются как есть).
+
+    Args:
+        lines: Строки отчета
+        width: Максимальная ширина строки
+
+    Returns:
+        Iterator[str]: Строки после переноса
+    """
+    for line in lines:
+        if line.strip() == "":  # Если строка пустая
+            yield ""  # Добавляем пустую строку как есть
+        elif len(line) <= width and line.isprintable() and not line.endswith(" "):
+            # Короткая строка без табуляций и пробелов в конце не изменяется при переносе
+            yield line
+        else:
+            # Оборачиваем непустую строку с максимальной шириной
+            yield from textwrap.wrap(line, width=width)
 
 
 class TextReportGenerator(IReportGenerator):
     """
     Класс для генерации текстовых отчетов.
+
+    Отчет формируется по разделам генераторами строк: его можно получить строкой (generate_report)
+    или записать в поток (write_report, export_report) без накопления всего текста в памяти.
+    В сводном режиме (summary) операции в таблицах группируются по виду и модели станка, подробный расчет
+    приводится только для summary.top операций, а export_report сохраняет расчет по каждой операции
+    в отдельную таблицу операций.
     """
 
-    def __init__(self, number_formatter: INumberFormatter = None, table_formatter: ITableFormatter = None):
+    def __init__(
+        self,
+        number_formatter: INumberFormatter = None,
+        table_formatter: ITableFormatter = None,
+        summary: Optional[ReportSummary] = None,
+    ):
         self.number_formatter = number_formatter or NumberFormatter()
         self.fn = self.number_formatter.format
         self.table_formatter = table_formatter or TableFormatter()
-        self.ft = self.table_formatter.format
+        self.ft = self.table_formatter.iter_format
+        self.summary = summary
 
     def generate_report(self, workshop: Workshop) -> str:
         """
-        Генерирует текстовый отчет о цехе.
+        Генерирует текстовый отчет о цехе (по снимку настроек, по которому рассчитан цех).
         """
-        report = list()
-        report.append(f"Отчет по цеху: {workshop.name}")
+        return "\n".join(self.iter_lines(workshop))
 
-        report.append(f"1. Исходные данные:")
-        report.append("")
-        report_total_time = self.fn(workshop.process.total_time)
-        report.append(f"Трудоемкость изготовления 1го изделия − {report_total_time} нормо-часа.")
-        report.append(f"Годовой объем выпуска продукции – {workshop.production_volume} шт.")
-        report.append(f"Трудоемкость производственной программы по операциям определяется по формуле:")
+    def iter_sections(self, workshop: Workshop) -> Iterator[Iterator[str]]:
+        """
+        Возвращает разделы отчета (каждый раздел - генератор строк).
+
+        Args:
+            workshop: Объект цеха
+
+        Returns:
+            Iterator[Iterator[str]]: Разделы отчета
+        """
+        operations = workshop.process.operations
+        groups = None
+        if self.summary is not None:
+            groups = group_operations(operations, workshop.settings.passage_area)
+            operations = select_operations(operations, self.summary.top, self.summary.key)
+        yield self._initial_data_section(workshop, groups)
+        yield self._machines_section(workshop, operations, groups)
+        yield self._main_area_section(workshop, operations, groups)
+        yield self._additional_areas_section(workshop)
+        yield self._layout_section(workshop)
+
+    def iter_lines(self, workshop: Workshop) -> Iterator[str]:
+        """
+        Возвращает строки отчета по мере формирования.
+
+        Args:
+            workshop: Объект цеха
+
+        Returns:
+            Iterator[str]: Строки отчета
+        """
+        return chain.from_iterable(self.iter_sections(workshop))
+
+    def write_report(self, workshop: Workshop, stream: TextIO, width: Optional[int] = REPORT_WIDTH) -> None:
+        """
+        Записывает отчет в текстовый поток (файл, сокет) по мере формирования строк.
+        Результат совпадает с save_report(generate_report(workshop)), а при width=None - с generate_report.
+
+        Args:
+            workshop: Объект цеха
+            stream: Текстовый поток
+            width: Максимальная ширина строки (None - без переноса)
+        """
+        lines = self.iter_lines(workshop)
+        if width is not None:
+            # Строки разбиваются так же, как текст отчета целиком (str.splitlines)
+            lines = wrap_lines(chain.from_iterable((line + "\n").splitlines() for line in lines), width)
+        separator = ""
+        for line in lines:
+            stream.write(separator)
+            stream.write(line)
+            separator = "\n"
+
+    def export_report(self, workshop: Workshop, filepath: Path) -> bool:
+        """
+        Формирует отчет и сохраняет его в текстовый файл (потоково, см. write_report).
+        В сводном режиме рядом сохраняется таблица операций (см. ReportSummary.table_path).
+        """
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                self.write_report(workshop, f)
+            if self.summary is not None:
+                write_operations_table(
+                    workshop.process.operations, workshop.settings.passage_area, self.summary.table_path(filepath)
+                )
+            return True
+        except Exception as e:
+            print(f"Ошибка при сохранении отчета: {str(e)}")
+            return False
+
+    def _initial_data_section(self, workshop: Workshop, groups: Optional[List[OperationGroup]] = None) -> Iterator[str]:
+        """
+        Раздел 1: исходные данные и таблица операций (в сводном режиме - таблица групп операций).
+        """
+        yield f"Отчет по цеху: {workshop.name}"
 
-        report.append(f"Т_ОП = t_g∙ N ∙ П_ОП")
-        report.append(f"где t_g –  трудоёмкость детале-операции, ч.;")
-        report.append(f"t_g = {report_total_time} н-ч.;")
-        report.append(f"N – годовой объём выпуска;")
-        report.append(f"N = {workshop.production_volume} шт.;")
-        report.append(f"П_ОП – процентное содержание операции, %.")
-        report.append("")
+        yield f"1. Исходные данные:"
+        yield ""
+        report_total_time = self.fn(workshop.process.total_time)
+        yield f"Трудоемкость изготовления 1го изделия − {report_total_time} нормо-часа."
+        yield f"Годовой объем выпуска продукции – {workshop.production_volume} шт."
+        yield f"Трудоемкость производственной программы по операциям определяется по формуле:"
+
+        yield f"Т_ОП = t_g∙ N ∙ П_ОП"
+        yield f"где t_g –  трудоёмкость детале-операции, ч.;"
+        yield f"t_g = {report_total_time} н-ч.;"
+        yield f"N – годовой объём выпуска;"
+        yield f"N = {workshop.production_volume} шт.;"
+        yield f"П_ОП – процентное содержание операции, %."
+        yield ""
+
+        if groups is not None:
+            yield "Таблица 1 - Операции по видам и моделям станков"
+            headers = [
+                "Наименование операции",
+                "Модель станка",
+                "Количество операций",
+                "Доля от общей трудоемкости",
+                "T_шт,н-ч",
+            ]
+            table_data = (
+                (group.name, group.equipment.model, group.count, f"{self.fn(group.percentage)}%", self.fn(group.time))
+                for group in groups
+            )
+            total_row = ('Итого', '-', len(workshop.process.operations), '-', self.fn(workshop.process.total_time))
+            yield from self.ft(headers, table_data, total_row)
+            yield ""
+            return
 
-        report.append(f"Таблица 1 - Наименование операций")
+        yield f"Таблица 1 - Наименование операций"
 
-        # Подготавливаем данные для таблицы
+        # Подготавливаем данные для таблицы (строки формируются по мере записи)
         headers = ["№ операции", "Наименование операции", "Доля от общей трудоемкости", "T_штi,н-ч"]
-        table_data = []
-        for operation in workshop.process.operations:
-            number = str(operation.number)
-            percentage = f"{self.fn(operation.percentage)}%"
-            time = str(self.fn(operation.time))
-            table_data.append((number, operation.name, percentage, time))
+        table_data = (
+            (str(operation.number), operation.name, f"{self.fn(operation.percentage)}%", str(self.fn(operation.time)))
+            for operation in workshop.process.operations
+        )
         # Строка итога
         workshop_total_time = self.fn(workshop.process.total_time)
         total_row = ('-', '-', 'Итого', workshop_total_time)
         # Форматируем таблицу
-        report.extend(self.ft(headers, table_data, total_row))
+        yield from self.ft(headers, table_data, total_row)
 
-        report.append("")
+        yield ""
 
-        report.append("2. Расчётное количество станков на каждой операции ([1]):")
-        report.append("")
-
-        report.append("С_Р = t_(g_i )/(F_g∙ K_V∙ K_P ),	(2)")
-        report.append("где t_(g_i ) – трудоемкость i-той операций, ч.;")
-        report.append("F_g – действительный фонд времени работы одного станка, ч;")
-        report.append(f"F_g = {int(get_setting('fund_of_working'))} ч. − при двухсменном режиме работы;")
-        report.append(
+    def _machines_section(
+        self,
+        workshop: Workshop,
+        operations: Sequence[IOperation],
+        groups: Optional[List[OperationGroup]] = None,
+    ) -> Iterator[str]:
+        """
+        Раздел 2: количество станков, коэффициенты загрузки, заточное и ремонтное отделения.
+        Расчет приводится для операций operations, таблицы в сводном режиме - по группам операций.
+        """
+        settings = workshop.settings
+        yield "2. Расчётное количество станков на каждой операции ([1]):"
+        yield ""
+
+        yield "С_Р = t_(g_i )/(F_g∙ K_V∙ K_P ),	(2)"
+        yield "где t_(g_i ) – трудоемкость i-той операций, ч.;"
+        yield "F_g – действительный фонд времени работы одного станка, ч;"
+        yield f"F_g = {int(settings.fund_of_working)} ч. − при двухсменном режиме работы;"
+        yield (
             "K_V − коэффициент выполнения норм, принимается ориентировочно 1,1... 1,25; для станков с ЧПУ "
             "его следует принимать равным 1;"
         )
-        report.append("K_P – коэффициент прогрессивности технологии проектируемого цеха;")
-        report.append(f"K_P = {get_setting('kp')}")
-        report.append("")
-
-        report.append("Расчётное количество оборудования округляем до целого.")
-        for operation in workshop.process.operations:
+        yield "K_P – коэффициент прогрессивности технологии проектируемого цеха;"
+        yield f"K_P = {settings.kp}"
+        yield ""
+
+        yield "Расчётное количество оборудования округляем до целого."
+        if groups is not None:
+            yield from self._summary_note(workshop, operations)
+        for operation in operations:
             operation_name = f"С_(Р {operation.number} {operation.name})"
             report_time = self.fn(operation.time)
-            report.append(
-                f"{operation_name} = {report_time} / ({get_setting('fund_of_working')} ∙ {get_setting('kv')} "
-                f"∙ {get_setting('kp')}) = {self.fn(operation.calculated_equipment_count)}"
+            yield (
+                f"{operation_name} = {report_time} / ({settings.fund_of_working} ∙ {settings.kv} "
+                f"∙ {settings.kp}) = {self.fn(operation.calculated_equipment_count)}"
             )
             operation_name = f"С_(ПР {operation.number} {operation.name})"
-            report.append(f"принимаем {operation_name} = {operation.accepted_equipment_count}")
+            yield f"принимаем {operation_name} = {operation.accepted_equipment_count}"
 
-        report.append("")
+        yield ""
 
-        report.append("Коэффициент загрузки:")
-        report.append("К_З = С_Р/С_ПРР")
-        report.append("где С_Р − расчётное количество станков;")
-        report.append("С_ПР − принятое количество станков.")
-        for operation in workshop.process.operations:
-            report.append(
+        yield "Коэффициент загрузки:"
+        yield "К_З = С_Р/С_ПРР"
+        yield "где С_Р − расчётное количество станков;"
+        yield "С_ПР − принятое количество станков."
+        for operation in operations:
+            yield (
                 f"К_(З {operation.number} {operation.name}) = "
                 f"{self.fn(operation.calculated_equipment_count)}/{operation.accepted_equipment_count} = "
                 f"{self.fn(operation.load_factor)}"
             )
-        report.append("")
-
-        report.append("Средний коэффициент загрузки для всего станочного парка:")
-        report.append("К_(З СР) = (∑С_Р)/(∑С_ПР )")
-        report_list_load_factor = f"({self.fn(workshop.process.operations[0].load_factor)}"
-        report_list_count = f"({workshop.process.operations[0].accepted_equipment_count}"
-        for operation in workshop.process.operations[1:]:
-            report_list_load_factor += f" + {self.fn(operation.load_factor)}"
-            report_list_count += f" + {operation.accepted_equipment_count}"
-        report_list_load_factor += f")"
-        report_list_count += f")"
+        yield ""
 
+        yield "Средний коэффициент загрузки для всего станочного парка:"
+        yield "К_(З СР) = (∑С_Р)/(∑С_ПР )"
         average_load_factor = self.fn(workshop.process.average_load_factor)
-        report.append(
-            f"К_(З СР) = ({report_list_load_factor})/({report_list_count}) = {average_load_factor}"
+        if groups is not None:
+            # Суммы по всем операциям маршрута
+            calculated_machines_count = self.fn(workshop.process.calculated_machines_count)
+            accepted_machines_count = workshop.process.accepted_machines_count
+            yield f"К_(З СР) = {calculated_machines_count}/{accepted_machines_count} = {average_load_factor}"
+        else:
+            # Слагаемые собираются одним join (без повторной конкатенации строк)
+            report_list_load_factor = " + ".join(self.fn(operation.load_factor) for operation in operations)
+            report_list_count = " + ".join(str(operation.accepted_equipment_count) for operation in operations)
+            yield f"К_(З СР) = (({report_list_load_factor}))/(({report_list_count})) = {average_load_factor}"
+        yield ""
+        yield (
+            "Значения коэффициентов загрузки каждого станка, а также средний коэффициент загрузки заносим в "
+            "таблицу 2."
         )
-        report.append("")
-        report.append("Значения коэффициентов загрузки каждого станка, а также средний коэффициент загрузки заносим в "
-                      "таблицу 2.")
 
-        report.append("")
-        report.append("Таблица 2 - Необходимое количество станков и их загрузка")
+        yield ""
+        yield "Таблица 2 - Необходимое количество станков и их загрузка"
         headers = [
             "№ и наименование операции",
             "Расчетное количество станков, ед",
             "Принятое количество станков, ед",
             "Коэффициент загрузки",
         ]
-        table_data = []
-        for operation in workshop.process.operations:
-            number = f"{operation.number} {operation.name}"
-            calculated_machines_count = self.fn(operation.calculated_equipment_count)
-            accepted_machines_count = operation.accepted_equipment_count
-            load_factor = self.fn(operation.load_factor)
-            table_data.append((number, calculated_machines_count, accepted_machines_count, load_factor))
+        table_data = (
+            (
+                f"{operation.number} {operation.name}",
+                self.fn(operation.calculated_equipment_count),
+                operation.accepted_equipment_count,
+                self.fn(operation.load_factor),
+            )
+            for operation in operations
+        )
+        if groups is not None:
+            headers = ["Наименование операции", "Модель станка", *headers[1:]]
+            table_data = (
+                (
+                    group.name,
+                    group.equipment.model,
+                    self.fn(group.calculated_equipment_count),
+                    group.accepted_equipment_count,
+                    self.fn(group.load_factor),
+                )
+                for group in groups
+            )
         calculated_machines_count = self.fn(workshop.process.calculated_machines_count)
-        average_load_factor = self.fn(workshop.process.average_load_factor)
         total_row = (
             'Итого',
+            *(('-',) if groups is not None else ()),
             f'{calculated_machines_count}',
             f'{workshop.process.accepted_machines_count}',
             f'{average_load_factor}',
         )
         # Форматируем таблицу
-        report.extend(self.table_formatter.format(headers, table_data, total_row))
+        yield from self.ft(headers, table_data, total_row)
 
-        report.append("")
-        report.append("Данные по принятому оборудованию производится в таблице 3.")
-        report.append("")
+        yield ""
+        yield "Данные по принятому оборудованию производится в таблице 3."
+        yield ""
 
-        report.append("Таблица 3 - Необходимое количество станков")
+        yield "Таблица 3 - Необходимое количество станков"
         headers = ["№ и наименование операции", "Наименование станков", "Количество, шт.", "Габаритные размеры, мм"]
-        table_data = []
-        for operation in workshop.process.operations:
-            number = f"{operation.number} {operation.name}"
-            length = self.fn(operation.equipment.length * 1000)
-            width = self.fn(operation.equipment.width * 1000)
-            height = self.fn(operation.equipment.height * 1000)
-            dimensions = f"{length} x {width} x {height}"
-            table_data.append((number, operation.equipment.model, operation.accepted_equipment_count, dimensions))
+        table_data = (
+            (
+                f"{operation.number} {operation.name}",
+                operation.equipment.model,
+                operation.accepted_equipment_count,
+                self._dimensions(operation.equipment),
+            )
+            for operation in operations
+        )
         # Строка итога
         total_row = ('-', 'Итого', f'{workshop.zones["main_zone"].accepted_machines_count}', '-')
+        if groups is not None:
+            headers = ["Наименование операции", "Модель станка", "Количество операций", *headers[2:]]
+            table_data = (
+                (
+                    group.name,
+                    group.equipment.model,
+                    group.count,
+                    group.accepted_equipment_count,
+                    self._dimensions(group.equipment),
+                )
+                for group in groups
+            )
+            total_row = ('Итого', '-', len(workshop.process.operations), *total_row[2:])
         # Форматируем таблицу
-        report.extend(self.table_formatter.format(headers, table_data, total_row))
-        report.append("")
+        yield from self.ft(headers, table_data, total_row)
+        yield ""
 
-        report.append("Для централизованной переточки режущего инструмента в цехе организовывается заточное отделение. "
-                      "Основным оборудованием являются заточные станки:")
-        rep_zone_percent = self.fn(Decimal(get_setting('grinding_zone_percent')) * 100)
+        yield (
+            "Для централизованной переточки режущего инструмента в цехе организовывается заточное отделение. "
+            "Основным оборудованием являются заточные станки:"
+        )
+        rep_zone_percent = self.fn(settings.grinding_zone_percent * 100)
         rep_machines_count = workshop.process.accepted_machines_count
         rep_calc_count = workshop.zones["grinding_zone"].calculated_machines_count
         rep_ac_count_1 = workshop.zones["grinding_zone"].accepted_machines_count
-        report.append(f"С_зат= {rep_zone_percent}% ∙ С_О	(5)")
-        report.append("где С_О − число станков основного производства.")
-        report.append(
-            f"С_ЗАТ = {rep_zone_percent}% ∙ {rep_machines_count} = {self.fn(rep_calc_count)}"
-        )
-        report.append(f"принимаем С_(ПР ЗАТ) = {rep_ac_count_1}")
-        report.append("")
+        yield f"С_зат= {rep_zone_percent}% ∙ С_О\t(5)"
+        yield "где С_О − число станков основного производства."
+        yield f"С_ЗАТ = {rep_zone_percent}% ∙ {rep_machines_count} = {self.fn(rep_calc_count)}"
+        yield f"принимаем С_(ПР ЗАТ) = {rep_ac_count_1}"
+        yield ""
 
-        report.append(
+        yield (
             "В состав цеха кроме заточного отделения может входить и ремонтное отделение. Количество станков "
             "ремонтного отделения можно принимать от числа обслуживаемых станков:"
         )
-        rep_repair_zone_percent = self.fn(Decimal(get_setting('repair_zone_percent')) * 100)
+        rep_repair_zone_percent = self.fn(settings.repair_zone_percent * 100)
         rep_calc_count = workshop.zones["repair_zone"].calculated_machines_count
         rep_ac_count_2 = workshop.zones["repair_zone"].accepted_machines_count
-        report.append("где С_О − число станков основного производства.")
-        report.append(
-            f"С_рем = {rep_repair_zone_percent}% ∙ {rep_machines_count} = "
-            f"{self.fn(rep_calc_count)}"
-        )
-        report.append(f"принимаем С_(ПР РЕМ) = {rep_ac_count_2}")
-        report.append("")
+        yield "где С_О − число станков основного производства."
+        yield f"С_рем = {rep_repair_zone_percent}% ∙ {rep_machines_count} = {self.fn(rep_calc_count)}"
+        yield f"принимаем С_(ПР РЕМ) = {rep_ac_count_2}"
+        yield ""
 
-        report.append("Общее количество станков цеха:")
-        report.append("С_ОБЩ = С_О + С_(ПР ЗАТ) + С_(ПР РЕМ)")
-        report.append(
-            f"С_ОБЩ = {rep_machines_count} + {rep_ac_count_1} + {rep_ac_count_2} = " f"{workshop.total_machines_count}"
+        yield "Общее количество станков цеха:"
+        yield "С_ОБЩ = С_О + С_(ПР ЗАТ) + С_(ПР РЕМ)"
+        yield f"С_ОБЩ = {rep_machines_count} + {rep_ac_count_1} + {rep_ac_count_2} = {workshop.total_machines_count}"
+        yield ""
+
+    def _dimensions(self, equipment) -> str:
+        """
+        Габаритные размеры оборудования, мм.
+        """
+        length = self.fn(equipment.length * 1000)
+        width = self.fn(equipment.width * 1000)
+        height = self.fn(equipment.height * 1000)
+        return f"{length} x {width} x {height}"
+
+    def _summary_note(self, workshop: Workshop, operations: Sequence[IOperation]) -> Iterator[str]:
+        """
+        Пояснение сводного режима: для каких операций приведен подробный расчет.
+        """
+        yield (
+            f"Подробный расчет приведен для {len(operations)} из {len(workshop.process.operations)} операций "
+            f"с наибольшей {DETAIL_KEYS[self.summary.key]}, расчет по каждой операции сохраняется в таблицу "
+            f"операций (файл *{OPERATIONS_TABLE_SUFFIX}{COLUMNAR_FORMATS[self.summary.table_format]})."
         )
-        report.append("")
-
-        report.append("3. Расчёт площади участка")
-        report.append("Определение размеров площади станочного отделения.")
-        report.append("Площадь станочного отделения рассчитывается по формуле:")
-        passage_area = get_setting('passage_area')
-        report.append(f"S_СП = (a x b + {passage_area})∙C_ПР,")
-        report.append("где a,b - габаритные размеры оборудования, м.;")
-        report.append(f"{passage_area} – место на проходы;")
-        report.append("С_ПР - принятое количество оборудования.")
-
-        str_area_sum = ""
-        for operation in workshop.process.operations:
+
+    def _main_area_section(
+        self,
+        workshop: Workshop,
+        operations: Sequence[IOperation],
+        groups: Optional[List[OperationGroup]] = None,
+    ) -> Iterator[str]:
+        """
+        Раздел 3: площадь станочного отделения (расчет приводится для операций operations).
+        """
+        settings = workshop.settings
+        yield "3. Расчёт площади участка"
+        yield "Определение размеров площади станочного отделения."
+        yield "Площадь станочного отделения рассчитывается по формуле:"
+        passage_area = settings.passage_area
+        yield f"S_СП = (a x b + {passage_area})∙C_ПР,"
+        yield "где a,b - габаритные размеры оборудования, м.;"
+        yield f"{passage_area} – место на проходы;"
+        yield "С_ПР - принятое количество оборудования."
+
+        if groups is not None:
+            yield from self._summary_note(workshop, operations)
+        areas = []
+        for operation in operations:
             number = f"{operation.number} {operation.name}"
             length = self.fn(operation.equipment.length)
             width = self.fn(operation.equipment.width)
-            area = self.fn(
-                operation.equipment.length * operation.equipment.width * operation.accepted_equipment_count
-                + passage_area
-            )
-            str_area_sum += f"{area} + "
-            report.append(
+            area = self.fn(operation_area(operation, passage_area))
+            areas.append(area)
+            yield (
                 f"S_({number}) = ({length} ∙ {width} + {passage_area}) ∙ {operation.accepted_equipment_count} "
                 f"= {area} м²;"
             )
 
-        report.append("Суммарную площадь станочного отделения рассчитываем по формуле:")
-        report.append("S_СП = ∑S_СПi + S_ЗАТ + S_РЕМ")
-        str_area_sum += f"{self.fn(workshop.zones['grinding_zone'].area)} + "
-        str_area_sum += f"{self.fn(workshop.zones['repair_zone'].area)}"
-        report.append(
-            f"S_СП = {str_area_sum} = {self.fn(workshop.zones['main_zone'].area)} м²;"
-        )
+        yield "Суммарную площадь станочного отделения рассчитываем по формуле:"
+        yield "S_СП = ∑S_СПi + S_ЗАТ + S_РЕМ"
+        if groups is not None:
+            # Сумма по всем операциям маршрута
+            areas = [self.fn(sum(group.area for group in groups))]
+        areas.append(self.fn(workshop.zones['grinding_zone'].area))
+        areas.append(self.fn(workshop.zones['repair_zone'].area))
+        yield f"S_СП = {' + '.join(areas)} = {self.fn(workshop.zones['main_zone'].area)} м²;"
 
-        report.append("")
+        yield ""
 
-        report.append("4. Корректировка компоновки технологического оборудования дополнительными площадями")
-        report.append("Дополнительная площадь цеха складывается из:")
-        report.append("")
-
-        report.append("а) инструментально-раздаточной кладовой")
-        report.append("Площадь склада инструмента:")
-        report.append("S_(С.И.) = S_УД∙ C_ОБЩ,")
-        report.append(
+    def _additional_areas_section(self, workshop: Workshop) -> Iterator[str]:
+        """
+        Раздел 4: дополнительные площади цеха.
+        """
+        settings = workshop.settings
+        yield "4. Корректировка компоновки технологического оборудования дополнительными площадями"
+        yield "Дополнительная площадь цеха складывается из:"
+        yield ""
+
+        yield "а) инструментально-раздаточной кладовой"
+        yield "Площадь склада инструмента:"
+        yield "S_(С.И.) = S_УД∙ C_ОБЩ,"
+        yield (
             "где S_УД – удельная площадь склада инструмента на 1 станок, в зависимости от вида производства"
             " при работе в 2 смены;"
         )
-        rep_tool_storage = self.fn(Decimal(get_setting('specific_areas.tool_storage')))
-        report.append(f"S_УД = {rep_tool_storage} м²;")
-        report.append("C_ОБЩ – общее количество оборудования проектируемого участка.")
-        report.append(
+        rep_tool_storage = self.fn(settings.tool_storage)
+        yield f"S_УД = {rep_tool_storage} м²;"
+        yield "C_ОБЩ – общее количество оборудования проектируемого участка."
+        yield (
             f"S_(С.И.) = {rep_tool_storage} ∙ {workshop.total_machines_count} = "
             f"{self.fn(workshop.zones['tool_storage_zone'].area)} м²"
         )
-        report.append("")
-
-        report.append("б) склада приспособлений")
-        report.append("Площадь склада приспособлений:")
-        report.append("S_(С.П.) = S_УД∙ C_ОБЩ,")
-        report.append("где S_УД – удельная площадь склада приспособлений на 1 станок;")
-        rep_equipment_warehouse = self.fn(
-            Decimal(get_setting('specific_areas.equipment_warehouse'))
-        )
-        report.append(f"S_УД = {rep_equipment_warehouse} м²;")
-        report.append(
+        yield ""
+
+        yield "б) склада приспособлений"
+        yield "Площадь склада приспособлений:"
+        yield "S_(С.П.) = S_УД∙ C_ОБЩ,"
+        yield "где S_УД – удельная площадь склада приспособлений на 1 станок;"
+        rep_equipment_warehouse = self.fn(settings.equipment_warehouse)
+        yield f"S_УД = {rep_equipment_warehouse} м²;"
+        yield (
             f"S_(С.П.) = {rep_equipment_warehouse} ∙ {workshop.total_machines_count} = "
             f"{self.fn(workshop.zones['equipment_warehouse_zone'].area)} м²"
         )
-        report.append("")
+        yield ""
 
-        report.append("в) склада материалов и заготовок, межоперационных, готовых деталей")
-        report.append("Площадь склада материалов и заготовок, межоперационных, готовых деталей:")
-        work_piece_storage_percent = self.fn(
-            Decimal(get_setting('specific_areas.work_piece_storage')) * 100
-        )
-        report.append(
+        yield "в) склада материалов и заготовок, межоперационных, готовых деталей"
+        yield "Площадь склада материалов и заготовок, межоперационных, готовых деталей:"
+        work_piece_storage_percent = self.fn(settings.work_piece_storage * 100)
+        yield (
             f"Общая площадь промежуточных складов S_(С.К.П.) составляет {work_piece_storage_percent}% от "
             f"площади станочного отделения:"
         )
-        report.append(f"S_(С.К.П.) = {work_piece_storage_percent}% ∙ S_(УД СТ),")
-        report.append(
+        yield f"S_(С.К.П.) = {work_piece_storage_percent}% ∙ S_(УД СТ),"
+        yield (
             f"S_(С.К.П.) = {work_piece_storage_percent}% ∙ "
             f"{self.fn(workshop.zones['main_zone'].area)} "
             f"= {self.fn(workshop.zones['work_piece_storage_zone'].area)} м²"
         )
-        report.append("")
+        yield ""
 
-        report.append("г) контрольного отделения")
-        report.append("Площадь контрольного отделения:")
-        rep_control_department = self.fn(Decimal(get_setting('specific_areas.control_department')))
-        report.append(f"S_КОНТР = {rep_control_department} ∙ S_(УД СТ),")
-        report.append(
+        yield "г) контрольного отделения"
+        yield "Площадь контрольного отделения:"
+        rep_control_department = self.fn(settings.control_department)
+        yield f"S_КОНТР = {rep_control_department} ∙ S_(УД СТ),"
+        yield (
             f"S_КОНТР = {rep_control_department} ∙ {self.fn(workshop.zones['main_zone'].area)} "
             f"= {self.fn(workshop.zones['control_department_zone'].area)} м²"
         )
-        report.append("")
+        yield ""
 
-        report.append("д) санитарно-бытовых помещений")
-        report.append(
-            "На проектируемом цехе предусматривается площадь, занимаемая двумя санитарными узлами по 8 м² каждый."
-        )
-        rep_sanitary_zone = self.fn(Decimal(get_setting('specific_areas.sanitary_zone')))
-        report.append(
-            f"S_САН = 2 ∙ {rep_sanitary_zone} = {self.fn(workshop.zones['sanitary_zone'].area)} м²"
-        )
-        report.append("")
+        yield "д) санитарно-бытовых помещений"
+        yield "На проектируемом цехе предусматривается площадь, занимаемая двумя санитарными узлами по 8 м² каждый."
+        rep_sanitary_zone = self.fn(settings.sanitary_zone)
+        yield f"S_САН = 2 ∙ {rep_sanitary_zone} = {self.fn(workshop.zones['sanitary_zone'].area)} м²"
+        yield ""
 
-        report.append("Размер дополнительной площади цеха составляет:")
-        report.append("S_ДОП = S_(С.И.) + S_(С.П.) + S_(С.К.П.) + S_КОНТР + S_САН,")
-        report.append(
+        yield "Размер дополнительной площади цеха составляет:"
+        yield "S_ДОП = S_(С.И.) + S_(С.П.) + S_(С.К.П.) + S_КОНТР + S_САН,"
+        yield (
             f"S_ДОП = {self.fn(workshop.zones['tool_storage_zone'].area)} + "
             f"{self.fn(workshop.zones['equipment_warehouse_zone'].area)} + "
             f"{self.fn(workshop.zones['work_piece_storage_zone'].area)} + "
@@ -317,77 +524,71 @@ class TextReportGenerator(IReportGenerator):
             f"{self.fn(workshop.zones['sanitary_zone'].area)} = "
             f"{self.fn(workshop.required_area_additional_zones)} м²"
         )
-        report.append("")
+        yield ""
 
-        report.append("Общий размер площади цеха составляет:")
-        report.append("S = S_СП + S_ДОП,")
-        report.append(
+        yield "Общий размер площади цеха составляет:"
+        yield "S = S_СП + S_ДОП,"
+        yield (
             f"S = {self.fn(workshop.required_area_main_zone)} + "
             f"{self.fn(workshop.required_area_additional_zones)} = "
             f"{self.fn(workshop.required_area)} м²"
         )
-        report.append("")
-
-        report.append("5. Окончательная компоновка цеха. ")
-        report.append("Общие размеры и площади цеха определяют на основе планирования оборудования и всех помещений.")
-        report.append("Размеры пролета принимают в зависимости от рода машиностроения и характера выполняемых работ.")
-        workshop_nam = get_setting('workshop_nam')
-        workshop_span = get_setting('workshop_span')
-        report.append(f"Принимаем ширину пролета цеха l = {workshop_span} м, число пролетов = {workshop_nam}.")
-        report.append(
+        yield ""
+
+    def _layout_section(self, workshop: Workshop) -> Iterator[str]:
+        """
+        Раздел 5: окончательная компоновка цеха.
+        """
+        settings = workshop.settings
+        yield "5. Окончательная компоновка цеха. "
+        yield "Общие размеры и площади цеха определяют на основе планирования оборудования и всех помещений."
+        yield "Размеры пролета принимают в зависимости от рода машиностроения и характера выполняемых работ."
+        workshop_nam = settings.workshop_nam
+        workshop_span = settings.workshop_span
+        yield f"Принимаем ширину пролета цеха l = {workshop_span} м, число пролетов = {workshop_nam}."
+        yield (
             "Длина пролета участка определяется суммой размеров производственных и вспомогательных "
             "отделений, последовательно расположенных вдоль пролета, проходов и других цехов участка. "
             "Основным размером, определяющим длину пролета, является длина технологической линии станков, "
             "расположенных вдоль пролета."
         )
 
-        report.append("Длина пролёта:")
-        report.append("L_(РАСЧ) = S_Ц/l,")
-        report.append("где S_Ц – общая площадь участка;")
-        report.append("l – суммарная ширина пролетов, которая определяется по формуле:")
-        report.append("l = l_1 ∙ n,")
-        report.append(f"где l_1 = {workshop_span} – ширина одного пролета;")
-        report.append(f"где n = {workshop_nam} – количество пролетов.")
-        report.append("Таким образом, длина пролёта определяется по формуле:")
-        report.append("L_(РАСЧ) = S_Ц/(l_1 ∙ n),")
-        report.append(
+        yield "Длина пролёта:"
+        yield "L_(РАСЧ) = S_Ц/l,"
+        yield "где S_Ц – общая площадь участка;"
+        yield "l – суммарная ширина пролетов, которая определяется по формуле:"
+        yield "l = l_1 ∙ n,"
+        yield f"где l_1 = {workshop_span} – ширина одного пролета;"
+        yield f"где n = {workshop_nam} – количество пролетов."
+        yield "Таким образом, длина пролёта определяется по формуле:"
+        yield "L_(РАСЧ) = S_Ц/(l_1 ∙ n),"
+        yield (
             f"L_(РАСЧ) = {self.fn(workshop.required_area)}/({workshop_span} ∙ {workshop_nam}) = "
             f"{self.fn(workshop.calculated_length)} м,"
         )
-        report.append("Расчетную длину пролетов округляем до большего целого числа, кратного 6.")
-        report.append(f"Принимаем: L = {self.fn(workshop.length)}")
-        report.append("")
-
-        report.append("Таким образом, размеры цеха составляют:")
-        report.append(f"    - ширина одного пролета l_1 = {workshop_span} м,")
-        report.append(f"    - число пролетов n = {workshop_nam},")
-        report.append(f"    - принятая длина пролета L = {self.fn(workshop.length)} м.")
-        report.append("Общая площадь цеха:")
-        report.append(f"S_Ц = l ∙ n ∙ L,")
-        report.append(
+        yield "Расчетную длину пролетов округляем до большего целого числа, кратного 6."
+        yield f"Принимаем: L = {self.fn(workshop.length)}"
+        yield ""
+
+        yield "Таким образом, размеры цеха составляют:"
+        yield f"    - ширина одного пролета l_1 = {workshop_span} м,"
+        yield f"    - число пролетов n = {workshop_nam},"
+        yield f"    - принятая длина пролета L = {self.fn(workshop.length)} м."
+        yield "Общая площадь цеха:"
+        yield f"S_Ц = l ∙ n ∙ L,"
+        yield (
             f"S_Ц = {workshop_span} ∙ {workshop_nam} ∙ {self.fn(workshop.length)} = "
             f"{self.fn(workshop.total_area)} м²"
         )
 
-        return "\n".join(report)
-
     def save_report(self, report: str, filepath: Path) -> bool:
         """
         Сохраняет отчет в текстовый файл.
         """
         try:
-            # Разбиваем текст на строки и обрабатываем каждую отдельно
-            wrapped_lines = []
-            for line in report.splitlines():
-                if line.strip() == "":  # Если строка пустая
-                    wrapped_lines.append("")  # Добавляем пустую строку как есть
-                else:
-                    # Оборачиваем непустую строку с максимальной шириной 120 символов
-                    wrapped_lines.extend(textwrap.wrap(line, width=120))
-            
-            # Собираем обратно в текст, сохраняя переносы строк
-            wrapped_report = '\n'.join(wrapped_lines)
-            
+            # Разбиваем текст на строки, переносим каждую по ширине и собираем обратно
+            wrapped_report = '\n'.join(wrap_lines(report.splitlines()))
+
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(wrapped_report)
             return True
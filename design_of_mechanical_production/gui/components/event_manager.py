@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
+from kivy.clock import Clock
 from kivy.uix.spinner import Spinner
 from kivy.uix.textinput import TextInput
 
@@ -15,6 +16,10 @@ class TableEventManagerImpl(TableEventManager):
     """
     Реализация менеджера событий таблицы.
 
+    Положение строки определяется за O(1) по словарю "ключ строки -> индекс" (ключ - id списка виджетов строки,
+    он не меняется, пока строка в таблице). Словарь проверяется при обращении и перестраивается, если таблица
+    изменена в обход менеджера. Изменения полей накапливаются и обрабатываются один раз за кадр.
+
     Attributes:
         table: Экземпляр таблицы, для которой обрабатываются события.
     """
@@ -27,10 +32,34 @@ class TableEventManagerImpl(TableEventManager):
             table: Экземпляр таблицы, для которой обрабатываются события.
         """
         self.table = table
+        # Индексы строк по ключу строки
+        self._positions: Dict[int, int] = {}
+        # Измененные строки, ожидающие обработки (по ключу строки)
+        self._pending: Dict[int, List[Any]] = {}
+        self._flush_trigger = Clock.create_trigger(self._flush_changes)
+
+    def _row_index(self, row: List[Any]) -> Optional[int]:
+        """
+        Возвращает индекс строки в таблице.
+
+        Args:
+            row: Список виджетов строки.
+
+        Returns:
+            Optional[int]: Индекс строки или None, если строки нет в таблице.
+        """
+        rows = self.table.table_rows
+        index = self._positions.get(id(row))
+        if index is None or index >= len(rows) or rows[index] is not row:
+            # Таблица изменена в обход менеджера (например, set_data) - перестраиваем индекс
+            self._positions = {id(table_row): position for position, table_row in enumerate(rows)}
+            index = self._positions.get(id(row))
+        return index
 
     def add_row(self, row_widgets: List[Any]):
         """Добавляет строку в таблицу."""
         # Получаем виджеты из фабрики
+        self._positions[id(row_widgets)] = len(self.table.table_rows)
         self.table.table_rows.append(row_widgets)
         # Устнавливаем связи новых виджетов с событиями таблицы
         self.bind_row_events(row_widgets)
@@ -39,17 +68,23 @@ class TableEventManagerImpl(TableEventManager):
 
     def add_empty_row(self):
         """Добавляет пустую строку в таблицу."""
-        row_widgets = self.table.row_factory.create_row()
-        if self.table.table_rows[-1][0].text or self.table.table_rows[-1][2].text or self.table.table_rows[-1][3].text:
-            self.add_row(row_widgets)
+        rows = self.table.table_rows
+        if not rows or rows[-1][0].text or rows[-1][2].text or rows[-1][3].text:
+            self.add_row(self.table.row_factory.create_row())
 
     def remove_row(self, row_index: int):
         """Удаляет строку из таблицы."""
-        for widget in self.table.table_rows[row_index]:
+        rows = self.table.table_rows
+        for widget in rows[row_index]:
             if isinstance(widget, MachineToolSuggestField):
                 widget.remove_suggestions()
             self.table.grid.remove_widget(widget)
-        del self.table.table_rows[row_index]
+        self._pending.pop(id(rows[row_index]), None)
+        self._positions.pop(id(rows[row_index]), None)
+        del rows[row_index]
+        # Сдвигаем индексы следующих строк
+        for position in range(row_index, len(rows)):
+            self._positions[id(rows[position])] = position
 
     def bind_row_events(self, row_widgets: List[Any]):
         """
@@ -70,18 +105,32 @@ class TableEventManagerImpl(TableEventManager):
 
     def on_row_text_changed(self, row: List[Any], value: str):
         """
-        Обрабатывает изменения в строке.
+        Обрабатывает изменения в строке. Строка обрабатывается в следующем кадре, несколько изменений строки
+        за кадр обрабатываются один раз.
 
         Args:
             row: Список виджетов измененной строки.
             value: Новое значение.
         """
-        row_index = self.table.table_rows.index(row)
-        row_data = [
-            w.text if hasattr(w, 'text') else w.text_input.text if isinstance(w, MachineToolSuggestField) else ''
-            for w in row
-        ]
-        self.on_row_changed(row_index, row_data)
+        self._pending[id(row)] = row
+        self._flush_trigger()
+
+    def _flush_changes(self, *args):
+        """Обрабатывает накопленные изменения строк. После обработки в конце таблицы всегда есть пустая строка."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        for row in pending.values():
+            row_index = self._row_index(row)
+            if row_index is None:
+                # Строка уже удалена
+                continue
+            row_data = [
+                w.text if hasattr(w, 'text') else w.text_input.text if isinstance(w, MachineToolSuggestField) else ''
+                for w in row
+            ]
+            self.on_row_changed(row_index, row_data)
+        # Пустая строка в конце таблицы (в том числе после удаления последней строки)
         self.add_empty_row()
 
     def on_row_changed(self, row_index: int, data: List[str]):
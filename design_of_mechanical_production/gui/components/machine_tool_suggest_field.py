@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from typing import List
+from typing import Iterable, List, Optional
 
 from kivy.clock import Clock
 from kivy.core.window import Window
@@ -12,6 +12,16 @@ from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.textinput import TextInput
 
+from design_of_mechanical_production.utils.machines.name_index import MachineNameIndex
+
+# Задержка обновления подсказок после ввода символа, с (подсказки строятся один раз за серию нажатий)
+SUGGESTIONS_DELAY = 0.15
+# Максимальное количество подсказок
+MAX_SUGGESTIONS = 50
+# Высота строки подсказки и количество видимых строк
+SUGGESTION_ROW_HEIGHT = 30
+SUGGESTION_VISIBLE_ROWS = 5
+
 
 class Tooltip(BoxLayout):
     """Всплывающая подсказка."""
@@ -47,7 +57,7 @@ class MachineToolSuggestField(BoxLayout):
     Поле с автодополнением для выбора станка.
 
     Attributes:
-        machine_tools_names: Список доступных станков.
+        name_index: Поисковый индекс доступных станков (общий для всех строк таблицы с одной операцией).
         text_input: Текстовое поле для ввода.
         suggestions_layout: Layout для отображения подсказок.
     """
@@ -57,17 +67,32 @@ class MachineToolSuggestField(BoxLayout):
         Инициализирует поле с автодополнением.
 
         Args:
-            machine_tools_names: Список доступных станков.
+            text: Начальное значение поля.
             **kwargs: Дополнительные аргументы для BoxLayout.
         """
         super().__init__(orientation='vertical', size_hint_y=None, height=30, **kwargs)
-        self.machine_tools_names = ["16К20", "16К20Ф3", "16К20Ф3С32", "16К20Ф3С5", "16К20Ф3С32", "16К20Ф3С5"]
+        self.name_index = MachineNameIndex(["16К20", "16К20Ф3", "16К20Ф3С32", "16К20Ф3С5"])
         self.text_input = TextInput(text=text, size_hint_y=None, height=30, multiline=False)
         self.text_input.bind(text=self.on_text)
         self.text_input.bind(on_touch_down=self._on_touch_down)
         self.add_widget(self.text_input)
         self.suggestions_layout = None
         self.tooltip = None
+        # Подсказки обновляются с задержкой: серия нажатий приводит к одному поиску
+        self._update_trigger = Clock.create_trigger(self._update_suggestions, SUGGESTIONS_DELAY)
+        # Список подсказок и кнопки создаются один раз и используются повторно
+        self._suggestions_box: Optional[BoxLayout] = None
+        self._suggestions_scroll: Optional[ScrollView] = None
+        self._buttons: List[Button] = []
+
+    @property
+    def machine_tools_names(self) -> List[str]:
+        """Список доступных станков."""
+        return self.name_index.names
+
+    @machine_tools_names.setter
+    def machine_tools_names(self, names: Iterable[str]) -> None:
+        self.name_index = MachineNameIndex(names)
 
     def _on_touch_down(self, instance, touch):
         """
@@ -85,6 +110,7 @@ class MachineToolSuggestField(BoxLayout):
     def clear_value(self):
         """Очищает поле ввода."""
         self.text_input.text = ""
+        self._update_trigger.cancel()
         self.remove_suggestions()
         self.remove_tooltip()
 
@@ -97,32 +123,49 @@ class MachineToolSuggestField(BoxLayout):
             value: Новое значение текста
         """
         self.remove_suggestions()
+        self._update_trigger()
 
-        filtered = self.machine_tools_names
-        if len(value) >= 1:
-            filtered = [tool for tool in self.machine_tools_names if value.lower() in tool.lower()]
+    def _update_suggestions(self, dt: float) -> None:
+        """
+        Показывает подсказки для текущего текста поля ввода.
 
+        Args:
+            dt: Время с момента вызова триггера
+        """
+        self.remove_suggestions()
+        filtered = self.name_index.search(self.text_input.text, limit=MAX_SUGGESTIONS)
         if len(filtered) < 2:
             return
 
-        if filtered:
-            max_rows = 5
-            row_height = 30
-            max_height = max_rows * row_height
-            content_height = row_height * len(filtered)
-            box = BoxLayout(orientation='vertical', size_hint_y=None, height=content_height)
-            for tool in filtered:
-                btn = Button(text=tool, size_hint_y=None, height=row_height)
-                btn.bind(on_release=lambda btn, name=tool: self.select_tool(name))
-                box.add_widget(btn)
-            scroll = ScrollView(
-                size_hint=(None, None), size=(self.text_input.width, min(max_height, content_height)), bar_width=8
-            )
-            scroll.add_widget(box)
-            self.suggestions_layout = scroll
-            x_win, y_win = self.text_input.to_window(self.text_input.x, self.text_input.y)
-            self.suggestions_layout.pos = (x_win, y_win - self.suggestions_layout.height)
-            Window.add_widget(self.suggestions_layout)
+        scroll, box = self._get_suggestions_layout()
+        # Недостающие кнопки создаются, лишние убираются из списка и остаются в запасе
+        while len(self._buttons) < len(filtered):
+            btn = Button(size_hint_y=None, height=SUGGESTION_ROW_HEIGHT)
+            btn.bind(on_release=lambda btn: self.select_tool(btn.text))
+            self._buttons.append(btn)
+        box.clear_widgets()
+        for btn, tool in zip(self._buttons, filtered):
+            btn.text = tool
+            box.add_widget(btn)
+
+        content_height = SUGGESTION_ROW_HEIGHT * len(filtered)
+        box.height = content_height
+        scroll.size = (self.text_input.width, min(SUGGESTION_VISIBLE_ROWS * SUGGESTION_ROW_HEIGHT, content_height))
+        scroll.scroll_y = 1
+        self.suggestions_layout = scroll
+        x_win, y_win = self.text_input.to_window(self.text_input.x, self.text_input.y)
+        self.suggestions_layout.pos = (x_win, y_win - self.suggestions_layout.height)
+        Window.add_widget(self.suggestions_layout)
+
+    def _get_suggestions_layout(self):
+        """
+        Возвращает область прокрутки и список подсказок (создаются при первом обращении).
+        """
+        if self._suggestions_scroll is None:
+            self._suggestions_box = BoxLayout(orientation='vertical', size_hint_y=None)
+            self._suggestions_scroll = ScrollView(size_hint=(None, None), bar_width=8)
+            self._suggestions_scroll.add_widget(self._suggestions_box)
+        return self._suggestions_scroll, self._suggestions_box
 
     def show_tooltip(self, text: str):
         """
@@ -157,9 +200,25 @@ class MachineToolSuggestField(BoxLayout):
             tool: Название выбранного станка.
         """
         self.text_input.text = tool
+        self._update_trigger.cancel()
         self.remove_suggestions()
         self.remove_tooltip()
 
+    def get_value(self) -> str:
+        """Возвращает значение поля ввода."""
+        return self.text_input.text
+
+    def set_value(self, value: str) -> None:
+        """
+        Устанавливает значение поля ввода без показа подсказок.
+
+        Args:
+            value: Новое значение
+        """
+        self.text_input.text = value
+        self._update_trigger.cancel()
+        self.remove_suggestions()
+
     @property
     def text(self) -> str:
         """
@@ -55,16 +55,8 @@ class EditableTable(FloatLayout):
             self.headers.add_widget(label)
         self.vbox.add_widget(self.headers)
 
-        # Табличная часть (только строки)
-        self.grid = GridLayout(cols=len(config.headers), size_hint_y=None, spacing=2, padding=[0, 0, 0, 0])
-        self.grid.bind(minimum_height=self.grid.setter('height'))
-
-        # Прокрутка
-        self.scroll = ScrollView(
-            size_hint=(1, None), height=self.height - 30
-        )  # высота области прокрутки (можно менять)
-        self.scroll.add_widget(self.grid)
-        self.vbox.add_widget(self.scroll)
+        # Табличная часть (только строки) с прокруткой
+        self.vbox.add_widget(self._create_body())
         self.add_widget(self.vbox)
 
         # Рамка вокруг vbox (headers+scroll), не затрагивает table_label
@@ -73,6 +65,18 @@ class EditableTable(FloatLayout):
             self._border = Line(rectangle=(0, 0, 0, 0), width=1.5)
         self.bind(pos=self._update_border, size=self._update_border)
 
+    def _create_body(self) -> ScrollView:
+        """Создает табличную часть (строки) с прокруткой."""
+        self.grid = GridLayout(cols=len(self.config.headers), size_hint_y=None, spacing=2, padding=[0, 0, 0, 0])
+        self.grid.bind(minimum_height=self.grid.setter('height'))
+
+        # Прокрутка
+        self.scroll = ScrollView(
+            size_hint=(1, None), height=self.height - 30
+        )  # высота области прокрутки (можно менять)
+        self.scroll.add_widget(self.grid)
+        return self.scroll
+
     def _update_border(self, *args):
         """Обновляет рамку вокруг vbox (headers+scroll), не затрагивает table_label."""
         padding = 5
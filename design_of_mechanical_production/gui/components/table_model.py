@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+from typing import Any, Dict, List, Optional
+
+# Колонки таблицы технологического процесса
+NUMBER_COLUMN, OPERATION_COLUMN, TIME_COLUMN, MACHINE_COLUMN = range(4)
+COLUMNS_COUNT = 4
+
+
+class ProcessTableModel:
+    """
+    Данные таблицы технологического процесса в виде списка строк (без виджетов).
+
+    В конце таблицы всегда есть пустая строка для ввода новой операции. Правила те же, что у EditableTable:
+    заполнение последней строки добавляет новую пустую строку, а строка, у которой очищены номер, время и станок,
+    удаляется.
+    """
+
+    def __init__(self, rows: Optional[List[List[str]]] = None):
+        """
+        Args:
+            rows: Данные строк [номер, операция, время, станок]
+        """
+        self.rows: List[List[str]] = []
+        self.set_rows(rows or [])
+
+    @staticmethod
+    def empty_row() -> List[str]:
+        """Пустая строка таблицы."""
+        return [''] * COLUMNS_COUNT
+
+    @staticmethod
+    def is_empty(row: List[str]) -> bool:
+        """Строка считается пустой, если не заданы номер, время и станок (операция выбирается из списка)."""
+        return not (row[NUMBER_COLUMN] or row[TIME_COLUMN] or row[MACHINE_COLUMN])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_rows(self, rows: List[List[str]]) -> None:
+        """
+        Заменяет данные таблицы.
+
+        Args:
+            rows: Данные строк [номер, операция, время, станок]
+        """
+        self.rows = [[str(value) for value in row] for row in rows]
+        self._ensure_empty_row()
+
+    def _ensure_empty_row(self) -> bool:
+        """
+        Добавляет пустую строку в конец таблицы, если последняя строка заполнена.
+
+        Returns:
+            bool: Строка добавлена
+        """
+        if not self.rows or not self.is_empty(self.rows[-1]):
+            self.rows.append(self.empty_row())
+            return True
+        return False
+
+    def update_cell(self, row_index: int, column: int, value: str) -> bool:
+        """
+        Изменяет значение ячейки.
+
+        Args:
+            row_index: Индекс строки
+            column: Индекс колонки
+            value: Новое значение
+
+        Returns:
+            bool: Изменился состав строк (строка добавлена или удалена)
+        """
+        row = self.rows[row_index]
+        if row[column] == value:
+            return False
+        row[column] = value
+        if self.is_empty(row) and row_index != len(self.rows) - 1:
+            del self.rows[row_index]
+            return True
+        return self._ensure_empty_row()
+
+    def process_data(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает данные технологического процесса (без пустой строки в конце таблицы).
+
+        Returns:
+            List[Dict[str, Any]]: Данные операций в формате ExcelReader.read_process_data
+        """
+        rows = self.rows[:-1] if self.rows and self.is_empty(self.rows[-1]) else self.rows
+        return [
+            {
+                'number': row[NUMBER_COLUMN],
+                'name': row[OPERATION_COLUMN],
+                'time': float(row[TIME_COLUMN]),
+                'machine': row[MACHINE_COLUMN],
+            }
+            for row in rows
+        ]
@@ -4,15 +4,12 @@
 from typing import Any, List
 
 from kivy.core.window import Window
-from machine_tools import get_finder_with_list_names
 
 from design_of_mechanical_production.gui.components.customized_spinner import CustomizedSpinner
 from design_of_mechanical_production.gui.components.customized_text_input import CustomizedTextInput, TimeTextInput
 from design_of_mechanical_production.gui.components.machine_tool_suggest_field import MachineToolSuggestField
 from design_of_mechanical_production.utils.machines import MACHINE_TOOL_OPERATION_MAP as OPERATION_MAP
 
-machine_tool_finder = get_finder_with_list_names()
-
 
 class TableRow:
     """
@@ -83,11 +80,14 @@ class TableRow:
     def _on_operation_selected(self, value: str, machine_name_replace: bool = True) -> None:
         """Функция вызывается при выборе операции в списке."""
         if value and value != "":
-            machine_names = OPERATION_MAP[value]
-            self.machine_input.machine_tools_names = machine_names
+            # Проверка станка до получения индекса: при промахе карта операций сверяется с каталогом
             machine = self.machine_input.text
-            if machine not in machine_names and machine_name_replace:
-                self.machine_input.text = machine_names[0]
+            known = bool(machine) and OPERATION_MAP.has_machine(value, machine)
+            # Индекс станков операции общий для всех строк таблицы
+            name_index = OPERATION_MAP.name_index(value)
+            self.machine_input.name_index = name_index
+            if not known and machine_name_replace:
+                self.machine_input.text = name_index.names[0]
             self._validate_machine_name()
         else:
             self.clear()
@@ -107,8 +107,7 @@ class TableRow:
             else:
                 self.machine_input.set_style("normal")
         elif operation:
-            machine_names = OPERATION_MAP[operation]
-            if machine not in machine_names:
+            if not OPERATION_MAP.has_machine(operation, machine):
                 self.machine_input.set_style("error")
                 self.machine_input.show_tooltip("Станок не соответствует выбранной операции")
             else:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+from design_of_mechanical_production.gui.components.config import TableConfig
+from design_of_mechanical_production.gui.components.table import EditableTable
+from design_of_mechanical_production.gui.components.table_model import (
+    MACHINE_COLUMN,
+    NUMBER_COLUMN,
+    OPERATION_COLUMN,
+    TIME_COLUMN,
+    ProcessTableModel,
+)
+from design_of_mechanical_production.gui.components.table_row import TableRow
+
+# Высота строки таблицы
+ROW_HEIGHT = 30
+
+
+class TableRowView(RecycleDataViewBehavior, BoxLayout):
+    """
+    Строка виртуальной таблицы. Виджеты строки создаются один раз и показывают данные разных строк таблицы
+    по мере прокрутки.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='horizontal', size_hint_y=None, height=ROW_HEIGHT, spacing=2, **kwargs)
+        self.index: Optional[int] = None
+        self.table: Optional['VirtualizedEditableTable'] = None
+        # Флаг заполнения строки данными (изменения полей не передаются в таблицу)
+        self._refreshing = False
+        self.table_row = TableRow()
+        self._widgets = self.table_row.get_widgets()
+        for widget in self._widgets:
+            self.add_widget(widget)
+
+        self.table_row.number_input.bind(text=partial(self._on_cell_changed, NUMBER_COLUMN))
+        self.table_row.operation_spinner.bind(text=partial(self._on_cell_changed, OPERATION_COLUMN))
+        self.table_row.time_input.bind(text=partial(self._on_cell_changed, TIME_COLUMN))
+        self.table_row.machine_input.text_input.bind(text=partial(self._on_cell_changed, MACHINE_COLUMN))
+
+    def refresh_view_attrs(self, rv: 'TableRecycleView', index: int, data: Dict[str, Any]):
+        """
+        Заполняет строку данными строки таблицы.
+
+        Args:
+            rv: Виртуальный список
+            index: Индекс строки таблицы
+            data: Данные строки ({'cells': [номер, операция, время, станок]})
+        """
+        self.index = index
+        self.table = rv.table
+        for widget, width in zip(self._widgets, rv.table.config.column_widths):
+            if width:
+                widget.size_hint_x = None
+                widget.width = width
+
+        cells = data['cells']
+        self._refreshing = True
+        try:
+            # Операция устанавливается первой: при ее изменении строка подставляет станок из списка операции
+            self.table_row.operation_spinner.set_value(cells[OPERATION_COLUMN])
+            self.table_row.number_input.set_value(cells[NUMBER_COLUMN])
+            self.table_row.time_input.set_value(cells[TIME_COLUMN])
+            self.table_row.machine_input.set_value(cells[MACHINE_COLUMN])
+            self.table_row.machine_input.remove_tooltip()
+        finally:
+            self._refreshing = False
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_cell_changed(self, column: int, instance: Any, value: str) -> None:
+        """Передает изменение поля в данные таблицы."""
+        if self._refreshing or self.table is None or self.index is None:
+            return
+        self.table.on_cell_changed(self.index, column, value)
+
+
+class TableRecycleView(RecycleView):
+    """
+    Виртуальный список строк таблицы: виджеты создаются только для видимых строк.
+    """
+
+    def __init__(self, table: 'VirtualizedEditableTable', **kwargs):
+        super().__init__(**kwargs)
+        self.table = table
+        self.viewclass = TableRowView
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, ROW_HEIGHT),
+            default_size_hint=(1, None),
+            spacing=2,
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+
+class VirtualizedEditableTable(EditableTable):
+    """
+    Редактируемая таблица для больших технологических процессов.
+
+    Данные хранятся в ProcessTableModel (список строк), а виджеты создаются только для видимых строк
+    (RecycleView), поэтому get_data и set_data не создают виджетов.
+    """
+
+    def __init__(self, config: TableConfig, height: float = 300, **kwargs):
+        self.model = ProcessTableModel()
+        super().__init__(config=config, row_factory=None, height=height, **kwargs)
+
+    def _create_body(self) -> TableRecycleView:
+        """Создает табличную часть (виртуальный список строк)."""
+        self.view = TableRecycleView(table=self, size_hint=(1, None), height=self.height - 30)
+        return self.view
+
+    def _update_view(self) -> None:
+        """Передает строки таблицы в виртуальный список (строки передаются по ссылке, без копирования)."""
+        self.view.data = [{'cells': row} for row in self.model.rows]
+
+    def init(self):
+        """Создает строки по данным в конфиге"""
+        self.set_data(self.config.initial_data)
+
+    def on_cell_changed(self, row_index: int, column: int, value: str) -> None:
+        """
+        Обрабатывает изменение поля строки.
+
+        Args:
+            row_index: Индекс строки
+            column: Индекс колонки
+            value: Новое значение
+        """
+        if self.model.update_cell(row_index, column, value):
+            self._update_view()
+
+    def get_data(self) -> List[Dict[str, Any]]:
+        """Возвращает данные таблицы в виде списка словарей."""
+        return self.model.process_data()
+
+    def set_data(self, new_data: List[List[str]]):
+        """Обновляет данные таблицы."""
+        self.model.set_rows(new_data)
+        self._update_view()
@@ -4,10 +4,10 @@
 """
 Модуль содержит класс окна ввода данных, наследующий от шаблонного окна.
 """
-import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog
+from typing import Callable, Optional
 
+from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle
 from kivy.uix.boxlayout import BoxLayout
@@ -20,17 +20,20 @@ from kivymd.uix.button import MDIconButton
 from kivymd.uix.filemanager import MDFileManager
 from kivymd.uix.label import MDLabel
 
-from design_of_mechanical_production.core.services.workshop_creator import create_workshop_from_data
+from design_of_mechanical_production.core.services.calculation_task import (
+    CalculationProgress,
+    CalculationResult,
+    CalculationTask,
+)
 from design_of_mechanical_production.data.input import ExcelReader
 from design_of_mechanical_production.gui.components.config import TableConfig
 from design_of_mechanical_production.gui.components.customized_text_input import CustomizedTextInput
-from design_of_mechanical_production.gui.components.event_manager import TableEventManagerImpl
-from design_of_mechanical_production.gui.components.row_factory import BaseTableRowFactory
-from design_of_mechanical_production.gui.components.table import EditableTable
+from design_of_mechanical_production.gui.components.virtualized_table import VirtualizedEditableTable
 from design_of_mechanical_production.gui.windows.template_window import TemplateWindow
 from design_of_mechanical_production.settings import get_setting
 
 INPUT_DATA_PATH = Path(get_setting('input_data_path'))
+INPUT_LABEL_TEXT = "Ведите начальные данные для расчета"
 OPERATIONS = [
     "Токарная",
     "Токарная с ЧПУ",
@@ -61,7 +64,9 @@ class TemplateInputWindow(TemplateWindow):
             select_path=self.load_table_data,
             preview=True,
         )
-        self.label.text = "Ведите начальные данные для расчета"
+        self.label.text = INPUT_LABEL_TEXT
+        # Выполняемый расчет
+        self.calculation: Optional[CalculationTask] = None
         # Инициализируем наш контент
         self._init_content()
         # Инициализируем кнопки
@@ -137,17 +142,13 @@ class TemplateInputWindow(TemplateWindow):
                 ["005", "Токарная с ЧПУ", "", ""],
             ],
         )
-        # Создаем фабрику строк
-        row_factory = BaseTableRowFactory()
-        # Создаем таблицу (теперь она сама содержит прокрутку и рамку)
-        self.table = EditableTable(
+        # Создаем таблицу (содержит прокрутку и рамку; виджеты создаются только для видимых строк)
+        self.table = VirtualizedEditableTable(
             config=table_config,
-            row_factory=row_factory,
             pos_hint={'x': 0, 'top': 1},
             size_hint=(1, 1),
             height=400,
         )
-        self.table.event_manager = TableEventManagerImpl(self.table)
         self.table.init()
         right_col.add_widget(self.table)
 
@@ -174,17 +175,23 @@ class TemplateInputWindow(TemplateWindow):
         self.buttons_box.clear_widgets()
 
         # Создаем новые кнопки
-        calc_btn = Button(
+        self.calc_btn = Button(
             text='Начать расчет', size_hint=(None, 1), width=self.max_button_width, on_release=self.save_data
         )
         cancel_btn = Button(text='Отмена', size_hint=(None, 1), width=self.max_button_width, on_release=self.cancel)
 
         # Добавляем кнопки в контейнер
-        self.buttons_box.add_widget(calc_btn)
+        self.buttons_box.add_widget(self.calc_btn)
         self.buttons_box.add_widget(cancel_btn)
 
     def save_data(self, instance):
-        """Сохраняет введенные данные и переходит к результатам расчета."""
+        """
+        Запускает расчет по введенным данным в фоновом потоке. К результатам расчета окно переходит после
+        завершения расчета. Повторное нажатие во время расчета отменяет его.
+        """
+        if self.calculation is not None and self.calculation.running:
+            self._cancel_calculation()
+            return
         try:
             # Получаем данные параметров
             parameters_data = {
@@ -194,20 +201,58 @@ class TemplateInputWindow(TemplateWindow):
             }
             # Получаем данные из таблицы и преобразуем их в нужный формат
             process_data = self.table.get_data()
-            # Делаем расчет
-            workshop = create_workshop_from_data(parameters_data, process_data)
-
-            # Переходим к окну результатов
-            if self.screen_manager:
-                # Передаем workshop в окно результатов
-                result_screen = self.screen_manager.get_screen('result_window')
-                result_screen.set_workshop(workshop)
-                self.screen_manager.current = 'result_window'
-            else:
-                print("Ошибка: screen_manager не передан!")
-
         except ValueError as e:
             print("Ошибка ввода данных:", e)
+            return
+
+        # Делаем расчет (уведомления о ходе расчета передаются в основной поток через Clock)
+        self.calculation = CalculationTask(
+            parameters_data,
+            process_data,
+            on_progress=self._on_calculation_progress,
+            on_done=self._on_calculation_done,
+            on_error=self._on_calculation_error,
+            dispatch=_dispatch_to_main_thread,
+        )
+        self._set_calculating(True)
+        self.calculation.start()
+
+    def _cancel_calculation(self):
+        """Отменяет выполняемый расчет."""
+        self.calculation.cancel()
+        self.calculation = None
+        self._set_calculating(False)
+
+    def _set_calculating(self, calculating: bool):
+        """Переключает окно в режим расчета (кнопка расчета отменяет его) и обратно."""
+        self.calc_btn.text = 'Остановить расчет' if calculating else 'Начать расчет'
+        self.label.text = "Выполняется расчет..." if calculating else INPUT_LABEL_TEXT
+
+    def _on_calculation_progress(self, progress: CalculationProgress):
+        """Показывает ход расчета."""
+        self.label.text = f"{progress.message}: выполнено ({progress.step}/{progress.total})"
+
+    def _on_calculation_done(self, result: CalculationResult):
+        """Передает результат расчета в окно результатов и переходит к нему."""
+        self.calculation = None
+        self._set_calculating(False)
+        # Переходим к окну результатов
+        if self.screen_manager:
+            # Передаем workshop в окно результатов
+            result_screen = self.screen_manager.get_screen('result_window')
+            result_screen.set_workshop(result.workshop)
+            self.screen_manager.current = 'result_window'
+        else:
+            print("Ошибка: screen_manager не передан!")
+
+    def _on_calculation_error(self, error: BaseException):
+        """Сообщает об ошибке расчета."""
+        self.calculation = None
+        self._set_calculating(False)
+        if isinstance(error, ValueError):
+            print("Ошибка ввода данных:", error)
+        else:
+            print("Ошибка расчета:", error)
 
     def get_table_data(self):
         """Возвращает данные из таблицы."""
@@ -256,7 +301,16 @@ class InputWindow(Screen):
         self.template_window.set_table_data(new_data)
 
 
+def _dispatch_to_main_thread(function: Callable[[], None]) -> None:
+    """Выполняет функцию в основном потоке Kivy (Clock.schedule_once можно вызывать из любого потока)."""
+    Clock.schedule_once(lambda dt: function())
+
+
 def open_native_file_dialog():
+    # tkinter нужен только для системного диалога выбора файла
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # Не показывать главное окно
     file_path = filedialog.askopenfilename(
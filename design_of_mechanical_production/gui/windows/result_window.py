@@ -153,9 +153,8 @@ class TemplateResultWindow(TemplateWindow):
             return
         # Генерация и сохранение отчета
         report_generator = TextReportGenerator()
-        report = report_generator.generate_report(self.workshop)
         report_path = Path(get_setting('report_path'))
-        result = report_generator.save_report(report, report_path)
+        result = report_generator.export_report(self.workshop, report_path)
         return report_path if result else None
 
     def _update_content_debug(self, instance, value):
@@ -10,7 +10,7 @@ from kivy.uix.textinput import TextInput
 from kivymd.app import MDApp
 from kivymd.uix.label import MDLabel
 
-from design_of_mechanical_production.settings import get_setting, set_setting
+from design_of_mechanical_production.settings import get_setting, set_setting, settings_transaction
 
 
 class SettingsInput(BoxLayout):
@@ -186,66 +186,68 @@ class SettingsWindow(Screen):
     def _save_settings(self, instance) -> None:
         """Сохраняет настройки из полей ввода."""
         try:
-            # Фонд рабочего времени
-            new_fund = str(self.fund_of_working.input.text)
-            if new_fund != str(get_setting("fund_of_working")):
-                set_setting("fund_of_working", new_fund)
-
-            # Коэффициенты
-            new_kv = str(self.kv.input.text)
-            if new_kv != str(get_setting("kv")):
-                set_setting("kv", new_kv)
-
-            new_kp = str(self.kp.input.text)
-            if new_kp != str(get_setting("kp")):
-                set_setting("kp", new_kp)
-
-            # Удельные площади
-            new_tool_storage = str(self.tool_storage.input.text)
-            if new_tool_storage != str(get_setting("specific_areas.tool_storage")):
-                set_setting("specific_areas.tool_storage", new_tool_storage)
-
-            new_equipment_warehouse = str(self.equipment_warehouse.input.text)
-            if new_equipment_warehouse != str(get_setting("specific_areas.equipment_warehouse")):
-                set_setting("specific_areas.equipment_warehouse", new_equipment_warehouse)
-
-            new_work_piece_storage = str(self.work_piece_storage.input.text)
-            if new_work_piece_storage != str(get_setting("specific_areas.work_piece_storage")):
-                set_setting("specific_areas.work_piece_storage", new_work_piece_storage)
-
-            new_control_department = str(self.control_department.input.text)
-            if new_control_department != str(get_setting("specific_areas.control_department")):
-                set_setting("specific_areas.control_department", new_control_department)
-
-            new_sanitary_zone = str(self.sanitary_zone.input.text)
-            if new_sanitary_zone != str(get_setting("specific_areas.sanitary_zone")):
-                set_setting("specific_areas.sanitary_zone", new_sanitary_zone)
-
-            # Проценты для зон
-            new_grinding_zone = str(self.grinding_zone.input.text)
-            if new_grinding_zone != str(get_setting("grinding_zone_percent")):
-                set_setting("grinding_zone_percent", new_grinding_zone)
-
-            new_repair_zone = str(self.repair_zone.input.text)
-            if new_repair_zone != str(get_setting("repair_zone_percent")):
-                set_setting("repair_zone_percent", new_repair_zone)
-
-            # Площадь проходов
-            new_passage_area = str(self.passage_area.input.text)
-            if new_passage_area != str(get_setting("passage_area")):
-                set_setting("passage_area", new_passage_area)
-
-            # Настройки цеха
-            new_workshop_span = str(self.workshop_span.input.text)
-            if new_workshop_span != str(get_setting("workshop_span")):
-                set_setting("workshop_span", new_workshop_span)
-
-            new_workshop_nam = str(self.workshop_nam.input.text)
-            if new_workshop_nam != str(get_setting("workshop_nam")):
-                set_setting("workshop_nam", new_workshop_nam)
+            # Все изменения записываются в файл настроек один раз
+            with settings_transaction():
+                # Фонд рабочего времени
+                new_fund = str(self.fund_of_working.input.text)
+                if new_fund != str(get_setting("fund_of_working")):
+                    set_setting("fund_of_working", new_fund)
+
+                # Коэффициенты
+                new_kv = str(self.kv.input.text)
+                if new_kv != str(get_setting("kv")):
+                    set_setting("kv", new_kv)
+
+                new_kp = str(self.kp.input.text)
+                if new_kp != str(get_setting("kp")):
+                    set_setting("kp", new_kp)
+
+                # Удельные площади
+                new_tool_storage = str(self.tool_storage.input.text)
+                if new_tool_storage != str(get_setting("specific_areas.tool_storage")):
+                    set_setting("specific_areas.tool_storage", new_tool_storage)
+
+                new_equipment_warehouse = str(self.equipment_warehouse.input.text)
+                if new_equipment_warehouse != str(get_setting("specific_areas.equipment_warehouse")):
+                    set_setting("specific_areas.equipment_warehouse", new_equipment_warehouse)
+
+                new_work_piece_storage = str(self.work_piece_storage.input.text)
+                if new_work_piece_storage != str(get_setting("specific_areas.work_piece_storage")):
+                    set_setting("specific_areas.work_piece_storage", new_work_piece_storage)
+
+                new_control_department = str(self.control_department.input.text)
+                if new_control_department != str(get_setting("specific_areas.control_department")):
+                    set_setting("specific_areas.control_department", new_control_department)
+
+                new_sanitary_zone = str(self.sanitary_zone.input.text)
+                if new_sanitary_zone != str(get_setting("specific_areas.sanitary_zone")):
+                    set_setting("specific_areas.sanitary_zone", new_sanitary_zone)
+
+                # Проценты для зон
+                new_grinding_zone = str(self.grinding_zone.input.text)
+                if new_grinding_zone != str(get_setting("grinding_zone_percent")):
+                    set_setting("grinding_zone_percent", new_grinding_zone)
+
+                new_repair_zone = str(self.repair_zone.input.text)
+                if new_repair_zone != str(get_setting("repair_zone_percent")):
+                    set_setting("repair_zone_percent", new_repair_zone)
+
+                # Площадь проходов
+                new_passage_area = str(self.passage_area.input.text)
+                if new_passage_area != str(get_setting("passage_area")):
+                    set_setting("passage_area", new_passage_area)
+
+                # Настройки цеха
+                new_workshop_span = str(self.workshop_span.input.text)
+                if new_workshop_span != str(get_setting("workshop_span")):
+                    set_setting("workshop_span", new_workshop_span)
+
+                new_workshop_nam = str(self.workshop_nam.input.text)
+                if new_workshop_nam != str(get_setting("workshop_nam")):
+                    set_setting("workshop_nam", new_workshop_nam)
 
             self.hide()
-        except ValueError as e:
+        except (ValueError, OSError) as e:
             print(f"Ошибка при сохранении настроек: {e}")
             # Здесь можно добавить всплывающее окно с ошибкой
 
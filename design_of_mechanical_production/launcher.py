@@ -8,9 +8,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-from design_of_mechanical_production.core import create_workshop_from_data
-from design_of_mechanical_production.data.input import ExcelReader
-from design_of_mechanical_production.data.output import TextReportGenerator
 from design_of_mechanical_production.data.utils.file_system import (
     create_initial_data_file,
     ensure_directories_exist,
@@ -57,6 +54,11 @@ def run_without_gui() -> None:
     5. Создает объект цеха, делает расчет площади цеха
     6. Генерирует и сохраняет отчет
     """
+    # Расчетная часть загружается только в консольном режиме (в режиме GUI - при запуске окон)
+    from design_of_mechanical_production.core import create_workshop_from_data
+    from design_of_mechanical_production.data.input import ExcelReader
+    from design_of_mechanical_production.data.output import TextReportGenerator
+
     # Создаем необходимые директории
     ensure_directories_exist()
     # Проверяем и создаем файл с начальными данными
@@ -76,10 +78,8 @@ def run_without_gui() -> None:
 
     # Генерация и сохранение отчета
     report_generator = TextReportGenerator()
-    report = report_generator.generate_report(workshop)
-
     report_path = Path(get_setting('report_path'))
-    if report_generator.save_report(report, report_path):
+    if report_generator.export_report(workshop, report_path):
         print(f"Отчет успешно сгенерирован и сохранен в {report_path}")
     else:
         print("Ошибка при сохранении отчета")
@@ -6,17 +6,33 @@
 
 Предоставляет функционал для:
 - получения и установки настроек
-- сохранения и загрузки настроек
+- сохранения и загрузки настроек (в том числе группой изменений за одну запись)
+- подписки на изменения настроек
+- получения неизменяемого снимка расчетных настроек
 """
 from design_of_mechanical_production.settings.manager import (
     DEFAULT_CONFIG,
     get_setting,
+    is_affected,
     set_setting,
+    settings_revision,
+    settings_transaction,
+    subscribe_settings,
+    unsubscribe_settings,
 )
+from design_of_mechanical_production.settings.snapshot import SettingsSnapshot, settings_snapshot
 
 __all__ = [
     # Функции
     'get_setting',
     'set_setting',
+    'settings_revision',
+    'settings_snapshot',
+    'settings_transaction',
+    'subscribe_settings',
+    'unsubscribe_settings',
+    'is_affected',
     'DEFAULT_CONFIG',
+    # Классы
+    'SettingsSnapshot',
 ]
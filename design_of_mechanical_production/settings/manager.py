@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ----------------------------------------------------------------------------------------------------------------------
+import copy
 import os
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
 
 import yaml
 
+# Подписчик на изменения настроек: получает множество измененных ключей (вложенные ключи через точку)
+SettingsListener = Callable[[FrozenSet[str]], None]
+
 
 class DecimalConstructor(yaml.constructor.Constructor):
     """
@@ -23,6 +28,14 @@ class DecimalConstructor(yaml.constructor.Constructor):
             return value
 
 
+def _represent_decimal(dumper: yaml.Dumper, data: Decimal) -> yaml.ScalarNode:
+    """Сохраняет Decimal в YAML как строку."""
+    return dumper.represent_scalar('tag:yaml.org,2002:str', str(data))
+
+
+yaml.add_representer(Decimal, _represent_decimal)
+
+
 class ConfigRepository(ABC):
     """Абстрактный класс для работы с конфигурацией"""
 
@@ -53,22 +66,35 @@ class YamlConfigRepository(ConfigRepository):
             return {}
 
     def save(self, config: Dict[str, Any]) -> None:
-        with open(self.file_path, "w", encoding="utf-8") as file:
-            # Преобразуем Decimal в строки при сохранении
-            def decimal_representer(dumper, data):
-                return dumper.represent_scalar('tag:yaml.org,2002:str', str(data))
-
-            yaml.add_representer(Decimal, decimal_representer)
+        """
+        Сохраняет конфигурацию. Файл записывается атомарно: во временный файл, который затем заменяет
+        файл конфигурации (при сбое записи остается прежний файл).
+        """
+        path = Path(self.file_path)
+        temp_path = path.with_name(path.name + '.tmp')
+        # Decimal сохраняется строкой (см. _represent_decimal)
+        with open(temp_path, "w", encoding="utf-8") as file:
             yaml.dump(config, file, default_flow_style=False, allow_unicode=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
 
 
 class ConfigManager:
-    """Менеджер конфигурации"""
+    """
+    Менеджер конфигурации.
+
+    Изменения настроек можно группировать в транзакцию (см. transaction): файл записывается один раз,
+    а подписчики (см. subscribe) получают все измененные ключи одним уведомлением.
+    """
 
     def __init__(self, repository: ConfigRepository, default_config: Dict[str, Any]):
         self.repository = repository
         self.default_config = default_config
         self._config: Optional[Dict[str, Any]] = None
+        self.revision = 0  # Номер изменения настроек (увеличивается при каждой записи изменений)
+        self._changed_keys: Optional[Set[str]] = None  # Ключи, измененные в текущей транзакции
+        self._listeners: List[SettingsListener] = []
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -110,6 +136,7 @@ class ConfigManager:
     def set_setting(self, key_path: str, new_value: Any) -> None:
         """
         Изменяет значение настройки и сохраняет его.
+        Внутри транзакции значение изменяется в памяти, а сохраняется при завершении транзакции.
 
         Parameters
         ----------
@@ -117,20 +144,113 @@ class ConfigManager:
             Путь к настройке через точку
         new_value : Any
             Новое значение настройки
+
+        Raises
+        ------
+        ValueError
+            Если путь к настройке проходит через значение, не являющееся разделом настроек.
+            Ошибка (как и ошибка записи файла) не перехватывается, поэтому транзакция отменяется целиком.
         """
-        try:
-            config = self.config
+        with self.transaction():
             keys = key_path.split(".")
-            temp = config
-            for key in keys[:-1]:
-                temp = temp.setdefault(key, {})
-            temp[keys[-1]] = new_value
+            temp = self.config
+            try:
+                for key in keys[:-1]:
+                    temp = temp.setdefault(key, {})
+                if keys[-1] in temp and temp[keys[-1]] == new_value:
+                    return
+                temp[keys[-1]] = new_value
+            except (AttributeError, TypeError):
+                raise ValueError(f"Ошибка: настройка '{key_path}' не может быть изменена.") from None
+            self._changed_keys.add(key_path)
+        print(f"Настройка '{key_path}' изменена на {new_value}.")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Группирует изменения настроек: изменения применяются в памяти, файл записывается один раз
+        при выходе из блока, после чего подписчики получают все измененные ключи.
+        При исключении внутри блока изменения отменяются. Вложенные транзакции входят во внешнюю.
+
+        Пример:
+            with config_manager.transaction():
+                config_manager.set_setting("kv", "1.1")
+                config_manager.set_setting("kp", "1.5")
+        """
+        if self._changed_keys is not None:
+            yield
+            return
 
-            self.repository.save(config)
-            self._config = config  # Обновляем кэш
-            print(f"Настройка '{key_path}' изменена на {new_value}.")
-        except Exception as e:
-            print(f"Ошибка при изменении настройки: {e}")
+        backup = copy.deepcopy(self.config)
+        self._changed_keys = set()
+        try:
+            yield
+            changed_keys = frozenset(self._changed_keys)
+            if changed_keys:
+                # Ошибка записи файла также отменяет изменения
+                self.repository.save(self.config)
+        except BaseException:
+            self._config = backup
+            if self._changed_keys:
+                # Значения, прочитанные внутри транзакции, больше не действительны
+                self._notify(frozenset(self._changed_keys))
+            raise
+        else:
+            if changed_keys:
+                self.revision += 1
+                self._notify(changed_keys)
+        finally:
+            self._changed_keys = None
+
+    def subscribe(self, listener: SettingsListener) -> None:
+        """
+        Подписывает функцию на изменения настроек.
+
+        Parameters
+        ----------
+        listener : SettingsListener
+            Функция, получающая множество измененных ключей
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: SettingsListener) -> None:
+        """Отменяет подписку на изменения настроек."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, changed_keys: FrozenSet[str]) -> None:
+        """Уведомляет подписчиков об изменении настроек."""
+        for listener in list(self._listeners):
+            listener(changed_keys)
+
+
+def is_affected(changed_keys: AbstractSet[str], key_paths: Iterable[str]) -> bool:
+    """
+    Проверяет, затрагивают ли измененные ключи настройки key_paths (с учетом вложенности: изменение
+    "specific_areas" затрагивает "specific_areas.tool_storage" и наоборот).
+
+    Parameters
+    ----------
+    changed_keys : AbstractSet[str]
+        Измененные ключи
+    key_paths : Iterable[str]
+        Ключи настроек, от которых зависит значение
+
+    Returns
+    -------
+    bool
+        Хотя бы одна из настроек key_paths изменена
+    """
+    for key_path in key_paths:
+        for changed_key in changed_keys:
+            if (
+                changed_key == key_path
+                or key_path.startswith(changed_key + ".")
+                or changed_key.startswith(key_path + ".")
+            ):
+                return True
+    return False
 
 
 # Инициализация путей
@@ -166,6 +286,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
     # Площадь проходов
     'passage_area': '10.0',  # Площадь проходов в м²
+    # Каталог станков
+    'machine_catalog': '',  # Путь к снимку каталога станков (SQLite). Пусто - база machine_tools
 }
 
 # Создаем экземпляр менеджера конфигурации
@@ -183,6 +305,11 @@ def get_setting(key_path: str) -> Any:
     return value
 
 
+def settings_revision() -> int:
+    """Возвращает номер изменения настроек (для сброса значений, рассчитанных по настройкам)."""
+    return config_manager.revision
+
+
 def set_setting(key_path: str, new_value: Any) -> None:
     """Изменяет значение настройки и сохраняет его в config.yaml."""
     # Преобразуем Decimal в строки при сохранении
@@ -191,6 +318,28 @@ def set_setting(key_path: str, new_value: Any) -> None:
     config_manager.set_setting(key_path, new_value)
 
 
+def settings_transaction():
+    """
+    Группирует изменения настроек (set_setting): файл настроек записывается один раз в конце блока.
+
+    Пример:
+        with settings_transaction():
+            set_setting("kv", "1.1")
+            set_setting("kp", "1.5")
+    """
+    return config_manager.transaction()
+
+
+def subscribe_settings(listener: SettingsListener) -> None:
+    """Подписывает функцию на изменения настроек (функция получает множество измененных ключей)."""
+    config_manager.subscribe(listener)
+
+
+def unsubscribe_settings(listener: SettingsListener) -> None:
+    """Отменяет подписку на изменения настроек."""
+    config_manager.unsubscribe(listener)
+
+
 # Автоматическое создание файла конфигурации при первом запуске
 if not os.path.exists(CONFIG_FILE):
     config_manager.repository.save(DEFAULT_CONFIG)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Неизменяемый снимок расчетных настроек.
+
+Снимок берется один раз в начале расчета и передается по цепочке расчета (процесс, зоны, цех, отчет):
+значения уже преобразованы в Decimal, а расчет не зависит от изменения настроек во время расчета.
+"""
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple
+
+from design_of_mechanical_production.settings.manager import config_manager, is_affected, subscribe_settings
+
+# Ключи настроек для полей снимка (вложенные ключи через точку)
+SNAPSHOT_KEYS: Dict[str, str] = {
+    'fund_of_working': 'fund_of_working',
+    'kv': 'kv',
+    'kp': 'kp',
+    'workshop_span': 'workshop_span',
+    'workshop_nam': 'workshop_nam',
+    'grinding_zone_percent': 'grinding_zone_percent',
+    'repair_zone_percent': 'repair_zone_percent',
+    'passage_area': 'passage_area',
+    'tool_storage': 'specific_areas.tool_storage',
+    'equipment_warehouse': 'specific_areas.equipment_warehouse',
+    'work_piece_storage': 'specific_areas.work_piece_storage',
+    'control_department': 'specific_areas.control_department',
+    'sanitary_zone': 'specific_areas.sanitary_zone',
+}
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """
+    Снимок расчетных настроек (значения в Decimal).
+
+    Attributes:
+        fund_of_working: Фонд рабочего времени, ч
+        kv: Коэффициент выполнения норм
+        kp: Коэффициент прогрессивности технологии
+        workshop_span: Ширина пролета цеха, м
+        workshop_nam: Количество пролетов
+        grinding_zone_percent: Доля станков заточного отделения
+        repair_zone_percent: Доля станков ремонтного отделения
+        passage_area: Площадь проходов, м²
+        tool_storage: Удельная площадь склада инструмента
+        equipment_warehouse: Удельная площадь склада приспособлений
+        work_piece_storage: Удельная площадь склада заготовок и деталей
+        control_department: Удельная площадь контрольного отделения
+        sanitary_zone: Удельная площадь санитарно-бытовых помещений
+    """
+
+    # dataclass(slots=True) доступен только с Python 3.10
+    __slots__ = tuple(SNAPSHOT_KEYS)
+
+    fund_of_working: Decimal
+    kv: Decimal
+    kp: Decimal
+    workshop_span: Decimal
+    workshop_nam: Decimal
+    grinding_zone_percent: Decimal
+    repair_zone_percent: Decimal
+    passage_area: Decimal
+    tool_storage: Decimal
+    equipment_warehouse: Decimal
+    work_piece_storage: Decimal
+    control_department: Decimal
+    sanitary_zone: Decimal
+
+    @classmethod
+    def from_settings(cls, get_value: Callable[[str], Any]) -> 'SettingsSnapshot':
+        """
+        Создает снимок по функции получения настройки.
+
+        Args:
+            get_value: Функция получения значения настройки по ключу (например, get_setting)
+
+        Returns:
+            SettingsSnapshot: Снимок настроек
+        """
+        return cls(**{name: Decimal(str(get_value(key))) for name, key in SNAPSHOT_KEYS.items()})
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Замороженный класс со __slots__ не восстанавливается через setattr (нужно для передачи в процессы)
+        return self.__class__, tuple(getattr(self, item.name) for item in fields(self))
+
+
+# Снимок текущих настроек (сбрасывается при изменении расчетных настроек)
+_snapshot: Optional[SettingsSnapshot] = None
+
+
+def settings_snapshot() -> SettingsSnapshot:
+    """
+    Возвращает снимок текущих настроек. Снимок создается заново только после изменения расчетных настроек.
+
+    Returns:
+        SettingsSnapshot: Снимок настроек
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = _snapshot = SettingsSnapshot.from_settings(config_manager.get_setting)
+    return snapshot
+
+
+def _on_settings_changed(changed_keys: AbstractSet[str]) -> None:
+    """Сбрасывает снимок, если изменены расчетные настройки."""
+    global _snapshot
+    if is_affected(changed_keys, SNAPSHOT_KEYS.values()):
+        _snapshot = None
+
+
+subscribe_settings(_on_settings_changed)
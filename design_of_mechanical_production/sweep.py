@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Многовариантный расчет цеха по сетке параметров из командной строки.
+
+Использование:
+    python -m design_of_mechanical_production.sweep initial_data.xlsx --kp 1.3:1.6:0.1 --production-volume 5000,50000
+"""
+import argparse
+import time
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Sequence
+
+from design_of_mechanical_production.core.services.parameter_sweep import Scenario, run_sweep, scenario_grid
+from design_of_mechanical_production.data.input import create_data_reader
+
+
+def parse_axis(value: str) -> List[Decimal]:
+    """
+    Разбирает значения параметра: список через запятую ("5000,10000") или диапазон с шагом ("1.3:1.6:0.1",
+    границы включаются).
+
+    Args:
+        value: Строка со значениями
+
+    Returns:
+        List[Decimal]: Значения параметра
+    """
+    try:
+        if ':' not in value:
+            return [Decimal(item.strip()) for item in value.split(',') if item.strip()]
+        parts = [Decimal(item.strip()) for item in value.split(':')]
+    except InvalidOperation as error:
+        raise argparse.ArgumentTypeError(f"Некорректное значение параметра: {value}") from error
+
+    if len(parts) != 3 or parts[2] <= 0:
+        raise argparse.ArgumentTypeError(f"Диапазон задается как начало:конец:шаг (шаг > 0): {value}")
+    start, stop, step = parts
+    values = []
+    while start <= stop:
+        values.append(start)
+        start += step
+    return values
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа многовариантного расчета.
+
+    Args:
+        argv: Аргументы командной строки (по умолчанию sys.argv[1:])
+
+    Returns:
+        int: Код возврата
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m design_of_mechanical_production.sweep",
+        description="Многовариантный расчет цеха по сетке параметров. "
+        "Значения задаются списком (5000,10000) или диапазоном (1.3:1.6:0.1).",
+    )
+    parser.add_argument("input", help="файл начальных данных (Excel) или набор данных в колоночном формате")
+    parser.add_argument("--kv", type=parse_axis, help="коэффициент выполнения нормы")
+    parser.add_argument("--kp", type=parse_axis, help="коэффициент прогрессивности")
+    parser.add_argument("--fund-of-working", type=parse_axis, help="действительный фонд времени работы станка, ч")
+    parser.add_argument("--production-volume", type=parse_axis, help="годовой объем производства")
+    parser.add_argument("--grinding-zone-percent", type=parse_axis, help="доля станков заточного отделения")
+    parser.add_argument("--repair-zone-percent", type=parse_axis, help="доля станков ремонтного отделения")
+    parser.add_argument("-o", "--output", default="sweep.csv", help="файл результатов (CSV)")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="количество процессов (по умолчанию - по числу ядер)"
+    )
+    parser.add_argument("--vectorized", action="store_true", help="векторизованный расчет количества станков")
+    args = parser.parse_args(argv)
+
+    axes = {name: getattr(args, name) for name in Scenario.__dataclass_fields__ if getattr(args, name) is not None}
+    scenarios = scenario_grid(**axes) if axes else [Scenario()]
+
+    reader = create_data_reader(args.input)
+    start = time.perf_counter()
+    result = run_sweep(
+        reader.read_parameters_data(),
+        reader.read_process_data(),
+        scenarios,
+        workers=args.workers,
+        vectorized=args.vectorized,
+    )
+    result.to_csv(args.output, index=False)
+
+    print(result.to_string(index=False))
+    print(f"\nРассчитано вариантов: {len(result)} за {time.perf_counter() - start:.2f} с. Результаты: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+from design_of_mechanical_production.utils.machines.catalog import (
+    InMemoryMachineCatalog,
+    MachineRecord,
+    get_machine_catalog,
+    set_machine_catalog,
+)
 from design_of_mechanical_production.utils.machines.machine_map import MACHINE_TOOL_OPERATION_MAP
 
-__all__ = ["MACHINE_TOOL_OPERATION_MAP"]
+__all__ = [
+    "MACHINE_TOOL_OPERATION_MAP",
+    "InMemoryMachineCatalog",
+    "MachineRecord",
+    "get_machine_catalog",
+    "set_machine_catalog",
+]
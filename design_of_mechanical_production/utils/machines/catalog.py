@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Подключаемый каталог станков.
+
+По умолчанию данные об оборудовании запрашиваются у базы machine_tools. Вместо нее можно подключить каталог
+в памяти (InMemoryMachineCatalog) или локальный снимок каталога в SQLite (см. catalog_snapshot):
+set_machine_catalog(...) или настройка 'machine_catalog' (путь к файлу снимка).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from design_of_mechanical_production.core.interfaces import IMachineCatalog, IMachineRecord
+from design_of_mechanical_production.settings import get_setting, is_affected, subscribe_settings
+
+# Типы управления станков (значения machine_tools.SoftwareControl)
+SOFTWARE_CONTROL_NO = 'no'
+SOFTWARE_CONTROL_IC = 'ic'
+SOFTWARE_CONTROL_CNC = 'cnc'
+
+
+@dataclass(frozen=True)
+class MachineRecord(IMachineRecord):
+    """
+    Запись каталога станков (габариты в мм).
+    """
+
+    name: str
+    group: Optional[int] = None
+    subgroup: Optional[int] = None
+    software_control: Optional[str] = None
+    length: Decimal = Decimal('0')
+    width: Decimal = Decimal('0')
+    height: Decimal = Decimal('0')
+    automation: Optional[str] = None
+    weight: Optional[Decimal] = None
+    power: Optional[Decimal] = None
+
+
+def as_values(value: Optional[Union[Any, Iterable[Any]]]) -> Optional[Tuple[Any, ...]]:
+    """
+    Приводит условие поиска (значение или перечень значений) к кортежу. None - условие не задано.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return (value,)
+    return tuple(value)
+
+
+class InMemoryMachineCatalog(IMachineCatalog):
+    """
+    Каталог станков в памяти с индексами по модели и по (группа, подгруппа, тип управления).
+    """
+
+    def __init__(self, records: Iterable[IMachineRecord] = ()):
+        """
+        Args:
+            records: Записи каталога (порядок сохраняется в результатах поиска)
+        """
+        self._records: Dict[str, IMachineRecord] = {}
+        self._index: Dict[Tuple[Optional[int], Optional[int], Optional[str]], List[int]] = {}
+        self._names: List[str] = []
+        for record in records:
+            self.add(record)
+
+    def add(self, record: IMachineRecord) -> None:
+        """
+        Добавляет станок в каталог. Модель, уже содержащаяся в каталоге, не добавляется повторно.
+
+        Args:
+            record: Запись каталога
+        """
+        if record.name in self._records:
+            return
+        self._records[record.name] = record
+        key = (record.group, record.subgroup, record.software_control)
+        self._index.setdefault(key, []).append(len(self._names))
+        self._names.append(record.name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def records(self) -> List[IMachineRecord]:
+        """Все записи каталога (в порядке каталога)."""
+        return [self._records[name] for name in self._names]
+
+    def find_machines(self, names: Iterable[str]) -> Dict[str, IMachineRecord]:
+        """Ищет станки по точному совпадению модели (поиск по индексу модели)."""
+        return {name: self._records[name] for name in names if name in self._records}
+
+    def names(
+        self,
+        group: Optional[int] = None,
+        subgroups: Optional[Union[int, Iterable[int]]] = None,
+        software_control: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[str]:
+        """Возвращает модели станков по условию (перебираются только ключи индекса, а не все станки)."""
+        subgroups, controls = as_values(subgroups), as_values(software_control)
+        positions = [
+            position
+            for (record_group, record_subgroup, record_control), items in self._index.items()
+            if (group is None or record_group == group)
+            and (subgroups is None or record_subgroup in subgroups)
+            and (controls is None or record_control in controls)
+            for position in items
+        ]
+        return [self._names[position] for position in sorted(positions)]
+
+
+class CatalogMachineFinder:
+    """
+    Поисковик станков по операциям (интерфейс MachineFinderForOperations) поверх каталога станков.
+    """
+
+    # Сессии БД нет (совместимость с MachineToolOperationMap.__exit__)
+    session = None
+
+    def __init__(self, catalog: IMachineCatalog):
+        self.catalog = catalog
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def all(self) -> List[str]:
+        """Получение всех станков"""
+        return self.catalog.names()
+
+    def get_names_by_condition(
+        self,
+        group: Optional[int] = None,
+        subgroups: Optional[Union[int, Iterable[int]]] = None,
+        software_control: Optional[str] = SOFTWARE_CONTROL_NO,
+    ) -> List[str]:
+        """Получение станков по группе, типу и типу управления"""
+        # Условия задаются так же, как в MachineFinderForOperations: пустое значение не ограничивает выборку
+        software_control = getattr(software_control, 'value', software_control)
+        return self.catalog.names(group or None, subgroups or None, software_control or None)
+
+    def get_cnc_names(self, group: Optional[int] = None, subgroups: Optional[Union[int, Iterable[int]]] = None):
+        """Получение имен станков с ЧПУ, по группе и типу"""
+        return self.get_names_by_condition(group, subgroups, SOFTWARE_CONTROL_CNC)
+
+    def get_no_cnc_names(self, group: Optional[int] = None, subgroups: Optional[Union[int, Iterable[int]]] = None):
+        """Получение имен станков без ЧПУ, по группе и типу"""
+        names = []
+        names.extend(self.get_names_by_condition(group, subgroups, SOFTWARE_CONTROL_NO))
+        names.extend(self.get_names_by_condition(group, subgroups, SOFTWARE_CONTROL_IC))
+        return names
+
+
+# Подключенный каталог (None - база machine_tools или снимок из настроек)
+_catalog: Optional[IMachineCatalog] = None
+# Снимок каталога, открытый по настройке 'machine_catalog': (путь, каталог)
+_snapshot: Optional[Tuple[str, IMachineCatalog]] = None
+
+
+def set_machine_catalog(catalog: Optional[IMachineCatalog]) -> None:
+    """
+    Подключает каталог станков. Кэш оборудования и загруженная карта операций сбрасываются.
+
+    Args:
+        catalog: Каталог станков. None - база machine_tools (или снимок из настройки 'machine_catalog')
+    """
+    global _catalog
+    _catalog = catalog
+    _invalidate_caches()
+
+
+def _invalidate_caches() -> None:
+    """Сбрасывает кэш оборудования и загруженную карту операций."""
+    from design_of_mechanical_production.core.factories import EquipmentFactory
+    from design_of_mechanical_production.utils.machines.machine_map import MACHINE_TOOL_OPERATION_MAP
+
+    EquipmentFactory.invalidate_cache()
+    MACHINE_TOOL_OPERATION_MAP.invalidate()
+
+
+def get_machine_catalog() -> Optional[IMachineCatalog]:
+    """
+    Возвращает подключенный каталог станков.
+
+    Returns:
+        Optional[IMachineCatalog]: Каталог станков или None, если используется база machine_tools
+    """
+    global _snapshot
+    if _catalog is not None:
+        return _catalog
+    try:
+        path = get_setting('machine_catalog')
+    except ValueError:
+        path = None  # файл настроек создан до появления настройки
+    if not path:
+        return None
+    if _snapshot is None or _snapshot[0] != str(path):
+        from design_of_mechanical_production.utils.machines.catalog_snapshot import SQLiteMachineCatalog
+
+        _snapshot = (str(path), SQLiteMachineCatalog(Path(path)))
+    return _snapshot[1]
+
+
+def _on_settings_changed(changed_keys: AbstractSet[str]) -> None:
+    """Сбрасывает данные, загруженные из прежнего каталога, при изменении настройки 'machine_catalog'."""
+    if _catalog is None and is_affected(changed_keys, ('machine_catalog',)):
+        _invalidate_caches()
+
+
+subscribe_settings(_on_settings_changed)
+
+
+def create_machine_finder():
+    """
+    Создает поисковик станков по операциям для подключенного каталога.
+
+    Returns:
+        MachineFinderForOperations или CatalogMachineFinder
+    """
+    catalog = get_machine_catalog()
+    if catalog is not None:
+        return CatalogMachineFinder(catalog)
+    # ORM базы станков загружается только при первом поиске
+    from design_of_mechanical_production.utils.machines.finder import MachineFinderForOperations
+
+    return MachineFinderForOperations()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Локальный снимок каталога станков в SQLite.
+
+Снимок заполняется выгрузкой базы machine_tools и индексируется по модели, группе, подгруппе и типу управления,
+поэтому поиск станков не требует подключения к базе и дает одинаковый результат при каждом запуске.
+
+Использование:
+    python -m design_of_mechanical_production.utils.machines.catalog_snapshot settings/machine_catalog.sqlite
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from design_of_mechanical_production.core.interfaces import IMachineCatalog, IMachineRecord
+from design_of_mechanical_production.utils.machines.catalog import MachineRecord, as_values
+
+# Версия схемы снимка (при изменении схемы снимок нужно пересоздать)
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE machines (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    machine_group INTEGER,
+    subgroup INTEGER,
+    software_control TEXT,
+    length TEXT NOT NULL,
+    width TEXT NOT NULL,
+    height TEXT NOT NULL,
+    automation TEXT,
+    weight TEXT,
+    power TEXT
+);
+CREATE INDEX ix_machines_group ON machines (machine_group, subgroup, software_control);
+CREATE INDEX ix_machines_software_control ON machines (software_control);
+"""
+
+COLUMNS = (
+    'name',
+    'machine_group',
+    'subgroup',
+    'software_control',
+    'length',
+    'width',
+    'height',
+    'automation',
+    'weight',
+    'power',
+)
+
+
+def _text(value: Optional[Decimal]) -> Optional[str]:
+    """Число хранится строкой, чтобы Decimal восстанавливался без потери точности."""
+    return None if value is None else str(value)
+
+
+def _decimal(value: Optional[str]) -> Optional[Decimal]:
+    """Восстанавливает число, сохраненное строкой."""
+    return None if value is None else Decimal(value)
+
+
+def create_snapshot(path: Union[str, Path], records: Iterable[IMachineRecord]) -> Path:
+    """
+    Создает снимок каталога станков (существующий файл перезаписывается).
+
+    Args:
+        path: Файл снимка
+        records: Записи каталога (порядок сохраняется; повторные модели пропускаются)
+
+    Returns:
+        Path: Файл снимка
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    if temp_path.exists():
+        temp_path.unlink()
+
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            f"INSERT OR IGNORE INTO machines ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            (
+                (
+                    record.name,
+                    record.group,
+                    record.subgroup,
+                    record.software_control,
+                    _text(record.length),
+                    _text(record.width),
+                    _text(record.height),
+                    record.automation,
+                    _text(record.weight),
+                    _text(record.power),
+                )
+                for record in records
+            ),
+        )
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.commit()
+    finally:
+        connection.close()
+    # Файл снимка заменяется целиком: открытые снимки не видят частично записанных данных
+    temp_path.replace(path)
+    return path
+
+
+class SQLiteMachineCatalog(IMachineCatalog):
+    """
+    Каталог станков из локального снимка SQLite (только чтение).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Файл снимка (см. create_snapshot)
+        """
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Снимок каталога станков не найден: {self.path}")
+        self._connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._connection.close()
+            raise ValueError(f"Снимок каталога станков {self.path} создан другой версией программы, пересоздайте его")
+
+    def close(self) -> None:
+        """Закрывает файл снимка."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM machines").fetchone()[0]
+
+    def find_machines(self, names: Iterable[str]) -> Dict[str, IMachineRecord]:
+        """Ищет станки по точному совпадению модели (поиск по индексу модели)."""
+        names = list(dict.fromkeys(names))
+        found = {}
+        # Ограничение SQLite на количество параметров запроса
+        for start in range(0, len(names), 500):
+            chunk = names[start : start + 500]
+            rows = self._connection.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM machines WHERE name IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            for row in rows:
+                found[row[0]] = self._record(row)
+        return {name: found[name] for name in names if name in found}
+
+    def names(
+        self,
+        group: Optional[int] = None,
+        subgroups: Optional[Union[int, Iterable[int]]] = None,
+        software_control: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[str]:
+        """Возвращает модели станков по условию (поиск по индексу группы и типа управления)."""
+        conditions, parameters = [], []
+        if group is not None:
+            conditions.append("machine_group = ?")
+            parameters.append(group)
+        for column, values in (('subgroup', as_values(subgroups)), ('software_control', as_values(software_control))):
+            if values is not None:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                parameters.extend(values)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._connection.execute(f"SELECT name FROM machines{where} ORDER BY position", parameters)
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _record(row: Sequence[Any]) -> MachineRecord:
+        """Создает запись каталога по строке таблицы machines."""
+        name, group, subgroup, software_control, length, width, height, automation, weight, power = row
+        return MachineRecord(
+            name=name,
+            group=group,
+            subgroup=subgroup,
+            software_control=software_control,
+            length=Decimal(length),
+            width=Decimal(width),
+            height=Decimal(height),
+            automation=automation,
+            weight=_decimal(weight),
+            power=_decimal(power),
+        )
+
+
+def record_from_machine_info(machine_tool: Any) -> MachineRecord:
+    """
+    Создает запись каталога по данным станка из базы machine_tools (MachineInfo).
+
+    Args:
+        machine_tool: Данные станка (формат ListMachineInfoFormatter)
+
+    Returns:
+        MachineRecord: Запись каталога
+    """
+    software_control = getattr(machine_tool, 'software_control', None)
+    automation = getattr(machine_tool, 'automation', None)
+    weight = getattr(machine_tool, 'weight', None)
+    power = getattr(machine_tool, 'power', None)
+    return MachineRecord(
+        name=machine_tool.name,
+        group=getattr(machine_tool, 'group', None),
+        subgroup=getattr(machine_tool, 'type', None),
+        software_control=getattr(software_control, 'value', software_control),
+        length=Decimal(str(machine_tool.dimensions.length)),
+        width=Decimal(str(machine_tool.dimensions.width)),
+        height=Decimal(str(machine_tool.dimensions.height)),
+        automation=getattr(automation, 'value', automation),
+        weight=None if weight is None else Decimal(str(weight)),
+        power=None if power is None else Decimal(str(power)),
+    )
+
+
+def dump_machine_tools_catalog() -> List[MachineRecord]:
+    """
+    Выгружает каталог станков из базы machine_tools.
+
+    Returns:
+        List[MachineRecord]: Записи каталога (в порядке базы)
+    """
+    # ORM базы станков загружается только при выгрузке
+    from machine_tools import Finder, ListMachineInfoFormatter
+
+    with Finder(limit=None) as finder:
+        finder.set_formatter(ListMachineInfoFormatter())
+        return [record_from_machine_info(machine_tool) for machine_tool in finder.find_all()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Создает снимок каталога станков по базе machine_tools.
+
+    Returns:
+        int: Код возврата
+    """
+    parser = argparse.ArgumentParser(description="Создание локального снимка каталога станков (SQLite).")
+    parser.add_argument("path", type=Path, help="файл снимка")
+    args = parser.parse_args(argv)
+
+    records = dump_machine_tools_catalog()
+    create_snapshot(args.path, records)
+    print(f"Снимок каталога станков сохранен: {args.path} ({len(records)} станков)")
+    print("Для использования снимка укажите путь к нему в настройке 'machine_catalog'.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
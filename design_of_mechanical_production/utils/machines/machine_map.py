@@ -1,7 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from design_of_mechanical_production.settings.manager import CONFIG_DIR
+from design_of_mechanical_production.utils.machines.catalog import create_machine_finder, get_machine_catalog
 from design_of_mechanical_production.utils.machines.machine_tool_operation_map import *
+from design_of_mechanical_production.utils.machines.name_index import MachineNameIndex
+
+# Файл дискового кэша карты операций
+MACHINE_MAP_CACHE_FILE = CONFIG_DIR / "machine_tool_operation_map.json"
+# Группы станков, по которым считаются отпечатки каталога
+CATALOG_GROUPS = tuple(range(1, 10))
 
 
 class MachineToolOperationMapFactory:
@@ -48,7 +63,294 @@ class MachineToolOperationMapFactory:
         return _names_map
 
 
-MACHINE_TOOL_OPERATION_MAP = MachineToolOperationMapFactory().get_map()
+def catalog_fingerprint(names: Iterable[str]) -> str:
+    """
+    Рассчитывает отпечаток перечня станков (не зависит от порядка имен).
+
+    Args:
+        names: Имена станков
+
+    Returns:
+        str: Хэш перечня
+    """
+    digest = hashlib.sha1()
+    for name in sorted(set(str(name) for name in names)):
+        digest.update(name.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def catalog_stamp() -> Optional[str]:
+    """
+    Быстрая метка версии каталога станков (без чтения каталога): для снимка каталога в файле - путь, время
+    изменения и размер файла.
+
+    Returns:
+        Optional[str]: Метка или None, если для каталога (база machine_tools, каталог в памяти) ее получить нельзя
+    """
+    path = getattr(get_machine_catalog(), 'path', None)
+    if path is None:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return f"{Path(path).resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class MachineToolOperationMapCache:
+    """
+    Дисковый кэш карты операций.
+
+    Кэш хранит списки станков по каждому виду операции, отпечатки каталога (общий и по группам станков)
+    и быструю метку версии каталога (catalog_stamp). При запуске карта берется из кэша без обращения
+    к каталогу: если метка не изменилась, или если метку получить нельзя (тогда карта считается непроверенной
+    и сверяется с каталогом в фоне после запуска, см. LazyMachineToolOperationMap).
+    При сверке общий отпечаток считается по всему каталогу, и пересобираются только те виды операций,
+    группы станков которых изменились.
+
+    Attributes:
+        validated: Карта, возвращенная get_map, сверена с каталогом
+    """
+
+    def __init__(
+        self,
+        file_path: Path = MACHINE_MAP_CACHE_FILE,
+        factory: Optional[MachineToolOperationMapFactory] = None,
+    ):
+        self.file_path = Path(file_path)
+        self._factory = factory
+        self.validated = False
+
+    @property
+    def factory(self) -> MachineToolOperationMapFactory:
+        """Фабрика карт операций (создается при первом обращении)."""
+        if self._factory is None:
+            self._factory = MachineToolOperationMapFactory()
+        return self._factory
+
+    def load(self) -> Dict[str, Any]:
+        """Загружает содержимое кэша. Поврежденный или отсутствующий кэш считается пустым."""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """Сохраняет содержимое кэша."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=1)
+
+    def clear(self) -> None:
+        """Удаляет файл кэша."""
+        if self.file_path.exists():
+            self.file_path.unlink()
+
+    def get_map(self, validate: bool = False) -> Dict[str, List[str]]:
+        """
+        Возвращает карту операций, при необходимости пересобирая изменившиеся виды операций.
+
+        Args:
+            validate: Сверить кэш с каталогом, даже если метка версии каталога неизвестна
+
+        Returns:
+            Dict[str, List[str]]: Словарь {название операции: список станков}
+        """
+        cached = self.load()
+        entries: Dict[str, Dict[str, Any]] = cached.get('entries', {})
+        getters = self.factory.operation_getters
+        stamp = catalog_stamp()
+
+        if all(self._key(g) in entries for g in getters):
+            if stamp is not None and cached.get('stamp') == stamp:
+                self.validated = True
+                return self._compose(entries)
+            if stamp is None and not validate:
+                self.validated = False
+                return self._compose(entries)
+
+        with create_machine_finder() as finder:
+            fingerprint = catalog_fingerprint(finder.all())
+            if cached.get('fingerprint') == fingerprint and all(self._key(g) in entries for g in getters):
+                if stamp is not None and cached.get('stamp') != stamp:
+                    self.save({**cached, 'stamp': stamp})
+                self.validated = True
+                return self._compose(entries)
+
+            cached_groups: Dict[str, str] = cached.get('groups', {})
+            groups = {
+                str(group): catalog_fingerprint(finder.get_names_by_condition(group=group, software_control=None))
+                for group in CATALOG_GROUPS
+            }
+            changed = {group for group, value in groups.items() if cached_groups.get(group) != value}
+
+            for getter in getters:
+                key = self._key(getter)
+                if getter.groups is None:
+                    outdated = True  # зависит от всего каталога, а общий отпечаток изменился
+                else:
+                    outdated = any(str(group) in changed for group in getter.groups)
+                if key not in entries or outdated:
+                    getter.machine_finder = finder
+                    entries[key] = {'operation_name': getter.operation_name, 'machine_tools': getter.machine_tools}
+
+        self.save({'fingerprint': fingerprint, 'stamp': stamp, 'groups': groups, 'entries': entries})
+        self.validated = True
+        return self._compose(entries)
+
+    @staticmethod
+    def _key(getter: MachineToolOperationMap) -> str:
+        """Ключ вида операции в кэше."""
+        return type(getter).__name__
+
+    def _compose(self, entries: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Собирает карту операций из записей кэша в порядке фабрики (как MachineToolOperationMapFactory.get_map)."""
+        _names_map = {}
+        for getter in self.factory.operation_getters:
+            entry = entries[self._key(getter)]
+            if entry['machine_tools']:
+                _names_map[entry['operation_name']] = entry['machine_tools']
+        return _names_map
+
+
+class LazyMachineToolOperationMap(Mapping):
+    """
+    Карта операций, которая строится (или загружается из дискового кэша) при первом обращении.
+    Непроверенная карта из кэша (метку версии каталога получить нельзя, например для базы machine_tools)
+    сверяется с каталогом один раз за сеанс в фоновом потоке, а также при промахе поиска, если фоновая сверка
+    еще не завершилась (операция или станок не найдены).
+    """
+
+    def __init__(self, cache: Optional[MachineToolOperationMapCache] = None, background_validation: bool = True):
+        """
+        Args:
+            cache: Дисковый кэш карты операций
+            background_validation: Сверять непроверенную карту из кэша с каталогом в фоновом потоке
+        """
+        self._cache = cache or MachineToolOperationMapCache()
+        self._background_validation = background_validation
+        self._map: Optional[Dict[str, List[str]]] = None
+        self._indexes: Dict[str, MachineNameIndex] = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # Номер загрузки карты (увеличивается при сбросе)
+        self._validation: Optional[threading.Thread] = None
+
+    @property
+    def data(self) -> Dict[str, List[str]]:
+        """Словарь {название операции: список станков}."""
+        if self._map is None:
+            self._map = self._cache.get_map()
+            if not self._cache.validated and self._background_validation:
+                self._start_validation()
+        return self._map
+
+    def _start_validation(self) -> None:
+        """Запускает сверку карты с каталогом в фоновом потоке."""
+        self._validation = threading.Thread(
+            target=self._validate_in_background, args=(self._generation,), name="machine-map-validation", daemon=True
+        )
+        self._validation.start()
+
+    def _validate_in_background(self, generation: int) -> None:
+        """Сверяет карту с каталогом и подменяет загруженную карту, если за время сверки она не сбрасывалась."""
+        try:
+            validated_map = self._cache.get_map(validate=True)
+        except Exception:
+            return  # каталог недоступен: карта останется непроверенной и будет сверена при промахе поиска
+        with self._lock:
+            if generation == self._generation:
+                self._map = validated_map
+                self._indexes = {}
+
+    def wait_validation(self, timeout: Optional[float] = None) -> None:
+        """
+        Ожидает завершения фоновой сверки карты с каталогом.
+
+        Args:
+            timeout: Максимальное время ожидания, с
+        """
+        if self._validation is not None:
+            self._validation.join(timeout)
+
+    def invalidate(self, clear_disk_cache: bool = False) -> None:
+        """
+        Сбрасывает загруженную карту. Следующее обращение проверит каталог заново.
+
+        Args:
+            clear_disk_cache: Удалить также дисковый кэш (полная пересборка)
+        """
+        with self._lock:
+            self._generation += 1
+            self._map = None
+            self._indexes = {}
+        if clear_disk_cache:
+            self._cache.clear()
+
+    def validate(self) -> bool:
+        """
+        Сверяет карту, загруженную из кэша без проверки, с каталогом станков.
+
+        Returns:
+            bool: Карта была сверена (False - карта уже была проверена ранее)
+        """
+        self.wait_validation()
+        if self._map is not None and self._cache.validated:
+            return False
+        validated_map = self._cache.get_map(validate=True)
+        with self._lock:
+            self._map = validated_map
+            self._indexes = {}
+        return True
+
+    def has_machine(self, operation_name: str, machine: str) -> bool:
+        """
+        Проверяет, что станок подходит для вида операции. При промахе непроверенная карта сверяется с каталогом.
+
+        Args:
+            operation_name: Название операции
+            machine: Модель станка
+
+        Returns:
+            bool: Станок найден в списке станков операции
+        """
+        if operation_name in self and machine in self.name_index(operation_name):
+            return True
+        return self.validate() and operation_name in self and machine in self.name_index(operation_name)
+
+    def name_index(self, operation_name: str) -> MachineNameIndex:
+        """
+        Поисковый индекс станков вида операции (строится один раз и используется всеми строками таблицы).
+
+        Args:
+            operation_name: Название операции
+
+        Returns:
+            MachineNameIndex: Индекс моделей станков
+        """
+        index = self._indexes.get(operation_name)
+        if index is None:
+            index = self._indexes[operation_name] = MachineNameIndex(self[operation_name])
+        return index
+
+    def __getitem__(self, operation_name: str) -> List[str]:
+        try:
+            return self.data[operation_name]
+        except KeyError:
+            if not self.validate():
+                raise
+        return self.data[operation_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+MACHINE_TOOL_OPERATION_MAP = LazyMachineToolOperationMap()
 
 
 if __name__ == "__main__":
@@ -1,26 +1,51 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Callable, List
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from design_of_mechanical_production.utils.machines.finder import MachineFinderForOperations
+if TYPE_CHECKING:
+    from design_of_mechanical_production.utils.machines.finder import MachineFinderForOperations
 
 
 class MachineToolOperationMap(ABC):
     """Базовый класс. Хранит условия соответствия имен станков для конкретного вида механической операции."""
 
+    # Группы станков, от которых зависит список (None - все группы). Используется для частичной пересборки кэша.
+    groups: Optional[Tuple[int, ...]] = None
+
     def __init__(self, find_function: str, name: str):
-        self.machine_finder = MachineFinderForOperations()
-        self._find_function: Callable = getattr(self.machine_finder, find_function)
+        # Поисковик создается при первом обращении, чтобы не открывать сессию БД при создании карты
+        self._machine_finder: Optional[MachineFinderForOperations] = None
+        self._find_function_name: str = find_function
         self._name: str = name
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.machine_finder.session:
-            self.machine_finder.session_manager.close_session()
+        if self._machine_finder and self._machine_finder.session:
+            self._machine_finder.session_manager.close_session()
+
+    @property
+    def machine_finder(self) -> MachineFinderForOperations:
+        """Поисковик станков (создается при первом обращении)."""
+        if self._machine_finder is None:
+            from design_of_mechanical_production.utils.machines.catalog import create_machine_finder
+
+            self._machine_finder = create_machine_finder()
+        return self._machine_finder
+
+    @machine_finder.setter
+    def machine_finder(self, machine_finder: MachineFinderForOperations) -> None:
+        self._machine_finder = machine_finder
+
+    @property
+    def _find_function(self) -> Callable:
+        """Функция поиска имен станков."""
+        return getattr(self.machine_finder, self._find_function_name)
 
     @property
     def operation_name(self) -> str:
@@ -41,6 +66,8 @@ class MachineToolOperationMap(ABC):
 class TurningMachineToolMap(MachineToolOperationMap):
     """Класс для токарных операций."""
 
+    groups = (1, 9)
+
     def __init__(self, find_function: str, name: str = "Токарная"):
         super().__init__(find_function, name)
 
@@ -57,6 +84,8 @@ class TurningMachineToolMap(MachineToolOperationMap):
 class BoringMachineToolMap(MachineToolOperationMap):
     """Класс для расточных операций."""
 
+    groups = (2,)
+
     def __init__(self, find_function: str, name: str = "Расточная"):
         super().__init__(find_function, name)
 
@@ -71,6 +100,8 @@ class BoringMachineToolMap(MachineToolOperationMap):
 class DrillingMachineToolMap(MachineToolOperationMap):
     """Класс для сверлильных операций."""
 
+    groups = (2,)
+
     def __init__(self, find_function: str, name: str = "Сверлильная"):
         super().__init__(find_function, name)
 
@@ -85,6 +116,8 @@ class DrillingMachineToolMap(MachineToolOperationMap):
 class GrindingMachineToolMap(MachineToolOperationMap):
     """Класс для шлифовальных операций."""
 
+    groups = (3,)
+
     def __init__(self, find_function: str, name: str = "Шлифовальная"):
         super().__init__(find_function, name)
 
@@ -99,6 +132,8 @@ class GrindingMachineToolMap(MachineToolOperationMap):
 class GearCuttingMachineToolMap(MachineToolOperationMap):
     """Класс для зубообрабатывающих операций."""
 
+    groups = (5,)
+
     def __init__(self, find_function: str, name: str = "Зубообрабатывающая"):
         super().__init__(find_function, name)
 
@@ -113,6 +148,8 @@ class GearCuttingMachineToolMap(MachineToolOperationMap):
 class ThreadCuttingMachineToolMap(MachineToolOperationMap):
     """Класс для резьбообрабатывающих операций."""
 
+    groups = (5,)
+
     def __init__(self, find_function: str, name: str = "Резьбообрабатывающая"):
         super().__init__(find_function, name)
 
@@ -127,6 +164,8 @@ class ThreadCuttingMachineToolMap(MachineToolOperationMap):
 class MillingMachineToolMap(MachineToolOperationMap):
     """Класс для фрезерных операций."""
 
+    groups = (6,)
+
     def __init__(self, find_function: str, name: str = "Фрезерная"):
         super().__init__(find_function, name)
 
@@ -141,6 +180,8 @@ class MillingMachineToolMap(MachineToolOperationMap):
 class PlaningMachineToolMap(MachineToolOperationMap):
     """Класс для строгальных операций."""
 
+    groups = (7,)
+
     def __init__(self, find_function: str, name: str = "Строгальная"):
         super().__init__(find_function, name)
 
@@ -155,6 +196,8 @@ class PlaningMachineToolMap(MachineToolOperationMap):
 class SlottingMachineToolMap(MachineToolOperationMap):
     """Класс для долбежных операций."""
 
+    groups = (7,)
+
     def __init__(self, find_function: str, name: str = "Долбежная"):
         super().__init__(find_function, name)
 
@@ -169,6 +212,8 @@ class SlottingMachineToolMap(MachineToolOperationMap):
 class BroachingMachineToolMap(MachineToolOperationMap):
     """Класс для протяжных операций."""
 
+    groups = (7,)
+
     def __init__(self, find_function: str, name: str = "Протяжная"):
         super().__init__(find_function, name)
 
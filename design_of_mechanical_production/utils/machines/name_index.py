@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Поисковый индекс моделей станков для автодополнения.
+"""
+import heapq
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Максимальная длина n-грамм индекса (более длинные запросы проверяются по пересечению триграмм)
+MAX_NGRAM = 3
+# Количество подсказок по умолчанию
+DEFAULT_LIMIT = 50
+
+
+class MachineNameIndex:
+    """
+    Индекс моделей станков для поиска по подстроке без учета регистра.
+
+    Для каждой n-граммы (n = 1..3) названий в нижнем регистре хранится список позиций моделей, поэтому запрос
+    длиной до трех символов - одно обращение к словарю, а длинный запрос проверяется только на моделях,
+    содержащих все его триграммы. Результаты ранжируются: точное совпадение, совпадение с начала названия,
+    затем по положению совпадения и длине названия.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Args:
+            names: Модели станков (повторы пропускаются, порядок сохраняется)
+        """
+        self.names: List[str] = list(dict.fromkeys(names))
+        self._lowered: List[str] = [name.lower() for name in self.names]
+        self._names_set = frozenset(self.names)
+        self._ngrams: Dict[str, List[int]] = {}
+        # Списки позиций коротких запросов, упорядоченные по релевантности (заполняются при первом запросе)
+        self._ranked: Dict[str, List[int]] = {}
+        for position, name in enumerate(self._lowered):
+            grams = {name[i : i + n] for n in range(1, MAX_NGRAM + 1) for i in range(len(name) - n + 1)}
+            for gram in grams:
+                self._ngrams.setdefault(gram, []).append(position)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names_set
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        """
+        Позиции моделей, содержащих запрос (в нижнем регистре).
+        """
+        if len(query) <= MAX_NGRAM:
+            return self._ngrams.get(query, ())
+        postings = sorted(
+            (self._ngrams.get(query[i : i + MAX_NGRAM], ()) for i in range(len(query) - MAX_NGRAM + 1)), key=len
+        )
+        if not postings[0]:
+            return ()
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [position for position in candidates if query in self._lowered[position]]
+
+    def _rank(self, query: str, position: int) -> Tuple[int, int, int, int]:
+        """
+        Ключ ранжирования результата (меньше - выше).
+        """
+        name = self._lowered[position]
+        offset = name.find(query)
+        return (0 if name == query else 1 if offset == 0 else 2, offset, len(name), position)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+        """
+        Ищет модели, содержащие запрос (без учета регистра).
+
+        Args:
+            query: Запрос. Пустой запрос - первые модели в порядке каталога
+            limit: Максимальное количество результатов
+
+        Returns:
+            List[str]: Модели станков, упорядоченные по релевантности
+        """
+        query = query.lower()
+        if not query:
+            return self.names[:limit]
+        if len(query) <= MAX_NGRAM:
+            # Короткий запрос совпадает с n-граммой индекса: результаты ранжируются один раз
+            ranked = self._ranked.get(query)
+            if ranked is None:
+                ranked = self._ranked[query] = sorted(self._candidates(query), key=lambda p: self._rank(query, p))
+            best = ranked[:limit]
+        else:
+            best = heapq.nsmallest(limit, self._candidates(query), key=lambda p: self._rank(query, p))
+        return [self.names[position] for position in best]
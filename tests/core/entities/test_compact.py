@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для компактных (__slots__) вариантов сущностей расчета.
+"""
+import pickle
+import unittest
+from dataclasses import replace
+from decimal import Decimal
+
+from design_of_mechanical_production.core.entities import (
+    Equipment,
+    Operation,
+    Process,
+    SlottedMachineInfo,
+    SlottedOperation,
+    SlottedScaledOperation,
+)
+
+EQUIPMENT_DATA = dict(
+    name="Токарный станок",
+    model="16К20",
+    length=Decimal("2.5"),
+    width=Decimal("1.2"),
+    height=Decimal("1.5"),
+    automation="ЧПУ",
+    weight=Decimal("3000"),
+    power_consumption=Decimal("11"),
+)
+
+
+class TestCompactEntities(unittest.TestCase):
+    """Тесты для компактных вариантов сущностей расчета."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        self.equipment = Equipment(**EQUIPMENT_DATA)
+        self.operation = SlottedOperation(number="005", name="Токарная", time=Decimal("120"), equipment=self.equipment)
+
+    def test_01_no_instance_dict(self) -> None:
+        """Тест отсутствия __dict__ у компактных объектов."""
+        machine_info = SlottedMachineInfo(model=self.equipment, calculated_count=Decimal("1.5"))
+        scaled = SlottedScaledOperation(base=self.operation, time=Decimal("1200"))
+
+        for item in (self.operation, machine_info, scaled):
+            with self.subTest(item=type(item).__name__):
+                self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.operation.comment = "нет такого поля"
+
+    def test_02_same_behaviour(self) -> None:
+        """Тест совпадения полей и расчета с обычными классами."""
+        operation = Operation(number="005", name="Токарная", time=Decimal("120"), equipment=Equipment(**EQUIPMENT_DATA))
+        for item in (operation, self.operation):
+            item.accept_count(Decimal("1.5"))
+            item.calculate_percentage(Decimal("480"))
+
+        self.assertEqual(self.equipment.area, Decimal("3.00"))
+        self.assertEqual(self.operation.load_factor, operation.load_factor)
+        self.assertEqual(self.operation.percentage, Decimal("25"))
+        self.assertEqual(repr(self.operation).replace("Slotted", ""), repr(operation))
+        with self.assertRaises(ValueError):
+            SlottedOperation(number="010", name="Токарная", time=Decimal("0"), equipment=self.equipment)
+        with self.assertRaises(ValueError):
+            SlottedMachineInfo(model="16К20", calculated_count=Decimal("-1"))
+
+    def test_03_copy_and_pickle(self) -> None:
+        """Тест копирования и передачи компактных операций в другие процессы."""
+        self.operation.accept_count(Decimal("2"))
+        restored = pickle.loads(pickle.dumps(self.operation))
+        self.assertEqual(restored, self.operation)
+        self.assertEqual(restored.accepted_equipment_count, 2)
+        self.assertIsNot(restored, self.operation)
+
+        copied = replace(self.operation, time=Decimal("60"))
+        self.assertIsInstance(copied, SlottedOperation)
+        self.assertEqual((copied.time, copied.accepted_equipment_count), (Decimal("60"), 2))
+
+    def test_04_process_scale(self) -> None:
+        """Тест масштабирования процесса из компактных операций."""
+        process = Process.from_operations([self.operation])
+        process.calculate_required_machines()
+        program = process.scale(Decimal("100"))
+
+        self.assertIsInstance(program.operations[0], SlottedScaledOperation)
+        self.assertIs(program.operations[0].equipment, self.equipment)
+        self.assertEqual(program.operations[0].time, Decimal("12000"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@
 """
 import unittest
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from design_of_mechanical_production.core.entities import Process
 from design_of_mechanical_production.core.interfaces import IOperation
@@ -113,9 +113,55 @@ class TestProcess(unittest.TestCase):
         # Проверяем результаты
         self.assertEqual(len(machines), 1)
         self.assertEqual(
-            machines["Станок1"].calculated_count, Decimal("0.4545454545454545454545454545")
+            machines[equipment_mock].calculated_count, Decimal("0.4545454545454545454545454545")
         )  # 120 / (2000 * 1.1 * 1.2)
 
+    def test_10_batch_update(self):
+        """Тест отложенного пересчета: несколько изменений коэффициентов - один пересчет."""
+        listener = MagicMock()
+        self.process.subscribe(listener)
+
+        with patch.object(self.process, '_calculate_required_machines') as mock_calculate:
+            with self.process.batch_update():
+                self.process.fund_of_working = Decimal("4000")
+                self.process.compliance_coefficient = Decimal("1.1")
+                self.process.progressivity_coefficient = Decimal("1.2")
+                mock_calculate.assert_not_called()
+            mock_calculate.assert_called_once()
+
+            # то же через update
+            self.process.update(compliance_coefficient=Decimal("1.2"), progressivity_coefficient=Decimal("1.3"))
+            self.assertEqual(mock_calculate.call_count, 2)
+
+        self.assertEqual(listener.call_count, 2)
+        listener.assert_called_with(self.process)
+        self.assertEqual(self.process.revision, 2)
+
+    def test_11_unchanged_value_does_not_recalculate(self):
+        """Тест: установка прежнего значения коэффициента не вызывает пересчет."""
+        with patch.object(self.process, '_calculate_required_machines') as mock_calculate:
+            self.process.calculate_required_machines()
+            self.process.compliance_coefficient = self.process.compliance_coefficient
+            self.process.update(progressivity_coefficient=self.process.progressivity_coefficient)
+            mock_calculate.assert_called_once()
+
+        self.assertEqual(self.process.revision, 1)
+
+    def test_12_from_operations(self):
+        """Тест создания процесса из набора операций: доли операций рассчитываются один раз."""
+        process = Process.from_operations(iter([self.operation1, self.operation2]), vectorized=True)
+
+        self.assertEqual(process.operations, [self.operation1, self.operation2])
+        self.assertTrue(process.vectorized)
+        self.operation1.calculate_percentage.assert_called_once_with(Decimal("300"))
+        self.operation2.calculate_percentage.assert_called_once_with(Decimal("300"))
+
+        new_operation = MagicMock(spec=IOperation)
+        new_operation.time = Decimal("200")
+        process.extend([new_operation])
+        self.assertEqual(self.operation1.calculate_percentage.call_count, 2)
+        new_operation.calculate_percentage.assert_called_once_with(Decimal("500"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для таблицы операций (столбцовое хранение) и процесса на ее основе.
+"""
+import random
+import unittest
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest.mock import MagicMock
+
+from design_of_mechanical_production.core.entities import (
+    DecimalProcessBackend,
+    Operation,
+    OperationView,
+    Process,
+    ProcessTable,
+    TableProcessBackend,
+    VectorizedProcessBackend,
+    select_backend,
+)
+
+TOLERANCE = Decimal("1e-9")
+
+
+class TestProcessTable(unittest.TestCase):
+    """Тесты для таблицы операций."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных: одинаковые операции в списке объектов и в таблице."""
+        rnd = random.Random(2025)
+        equipments = [MagicMock(model=f"model_{index}") for index in range(5)]
+        self.rows = [
+            (f"{index:03d}", f"Операция {index % 3}", Decimal(rnd.randint(1, 2_000_000)) / Decimal(100), equipment)
+            for index, equipment in enumerate(rnd.choices(equipments, k=200))
+        ]
+        self.table = ProcessTable.from_rows(self.rows)
+        self.reference = Process.from_operations(
+            [Operation(number=number, name=name, time=time, equipment=eq) for number, name, time, eq in self.rows]
+        )
+        self.process = Process.from_operations(self.table)
+
+    def assertAlmostEqualDecimal(self, first: Decimal, second: Decimal) -> None:
+        """Проверяет совпадение значений с точностью float64."""
+        self.assertLess(abs(first - second), TOLERANCE * max(1, abs(second)))
+
+    def test_01_columns(self) -> None:
+        """Тест хранения: справочники наименований и оборудования, строки по идентификаторам."""
+        self.assertIs(self.process.operations, self.table)
+        self.assertEqual(len(self.table), 200)
+        self.assertEqual(len(self.table.names), 3)
+        self.assertEqual(len(self.table.equipments), 5)
+        self.assertEqual(self.table.times.itemsize, 8)
+
+        with self.assertRaises(ValueError):
+            self.table.append_row("999", "Операция", Decimal("0"), self.rows[0][3])
+
+    def test_02_views(self) -> None:
+        """Тест операций-представлений: создаются при обращении и читают (изменяют) строку таблицы."""
+        operation = self.table[-1]
+        number, name, time, equipment = self.rows[-1]
+
+        self.assertIsInstance(operation, OperationView)
+        self.assertFalse(hasattr(operation, '__dict__'))
+        self.assertEqual((operation.number, operation.name, operation.time), (number, name, time))
+        self.assertIs(operation.equipment, equipment)
+        self.assertEqual(len(self.table[10:20]), 10)
+        with self.assertRaises(IndexError):
+            self.table[200]
+
+        operation.assign_equipment_count(Decimal("1.5"), 2)
+        self.assertEqual(self.table.accepted[-1], 2)
+        self.assertEqual(self.table[-1].load_factor, Decimal("0.75"))
+
+    def test_03_aggregates_match_reference(self) -> None:
+        """Тест совпадения итогов и расчета по таблице с эталонным расчетом в Decimal."""
+        self.process.calculate_required_machines()
+        self.reference.calculate_required_machines()
+
+        self.assertAlmostEqualDecimal(self.process.total_time, self.reference.total_time)
+        self.assertAlmostEqualDecimal(self.process.calculated_machines_count, self.reference.calculated_machines_count)
+        self.assertAlmostEqualDecimal(self.process.average_load_factor, self.reference.average_load_factor)
+        self.assertEqual(self.process.accepted_machines_count, self.reference.accepted_machines_count)
+        self.assertAlmostEqualDecimal(self.process.operations[7].percentage, self.reference.operations[7].percentage)
+        self.assertEqual(self.process.machines.keys(), self.reference.machines.keys())
+        for model, machine in self.reference.machines.items():
+            self.assertAlmostEqualDecimal(self.process.machines[model].calculated_count, machine.calculated_count)
+
+    def test_04_scale(self) -> None:
+        """Тест таблицы на производственную программу: номера и справочники скопированы, время масштабировано."""
+        program = self.process.scale(Decimal("1000"))
+        program.calculate_required_machines()
+        reference = self.reference.scale(Decimal("1000"))
+        reference.calculate_required_machines()
+
+        self.assertIsInstance(program.operations, ProcessTable)
+        self.assertEqual(program.operations.numbers, self.table.numbers)
+        self.assertIs(program.operations[0].equipment, self.table[0].equipment)
+        self.assertEqual(program.operations[0].time, self.table[0].time * 1000)
+        self.assertEqual(program.operations[0].percentage, self.table[0].percentage)
+        self.assertEqual(program.accepted_machines_count, reference.accepted_machines_count)
+        self.assertEqual(self.table.calculated[0], 0.0)
+
+    @unittest.skipUnless(find_spec('numpy'), "нет numpy")
+    def test_05_vectorized(self) -> None:
+        """Тест расчета таблицы через numpy: результат совпадает с расчетом без numpy."""
+        self.process.calculate_required_machines()
+        expected = list(self.table.calculated), list(self.table.accepted)
+
+        self.process.vectorized = True
+        self.process.calculate_required_machines()
+        self.assertEqual((list(self.table.calculated), list(self.table.accepted)), expected)
+
+    def test_06_append_to_scaled_table(self) -> None:
+        """Тест добавления операций в таблицу на программу: исходная таблица не изменяется."""
+        program = self.table.scale(Decimal("10"))
+        equipment = MagicMock(model="model_new")
+
+        program.append_row("999", "Новая операция", Decimal("1"), equipment)
+
+        self.assertEqual(len(program), 201)
+        self.assertEqual(len(self.table), 200)
+        self.assertEqual(len(self.table.numbers), len(self.table.times))
+        self.assertEqual(len(self.table.name_ids), len(self.table.model_ids))
+        self.assertEqual(len(self.table.names), 3)
+        self.assertEqual(len(self.table.equipments), 5)
+        self.assertNotIn("model_new", self.table._model_index)
+        self.assertEqual(program[-1].name, "Новая операция")
+
+    def test_07_coefficients_through_views(self) -> None:
+        """Тест: коэффициенты, установленные через операцию-представление, записываются в таблицу."""
+        machines = DecimalProcessBackend().calculate_required_machines(
+            self.table, Decimal("4000"), Decimal("1.1"), Decimal("1.2")
+        )
+
+        self.assertEqual(self.table[3].fund_of_working, Decimal("4000"))
+        self.assertEqual(self.table.compliance_coefficient, Decimal("1.1"))
+        self.assertEqual(self.table.progressivity_coefficient, Decimal("1.2"))
+        self.reference.update(Decimal("4000"), Decimal("1.1"), Decimal("1.2"))
+        self.assertEqual(
+            self.table.accepted.tolist(), [op.accepted_equipment_count for op in self.reference.operations]
+        )
+        for model, machine in self.reference.machines.items():
+            self.assertAlmostEqualDecimal(machines[model].calculated_count, machine.calculated_count)
+
+    def test_08_select_backend(self) -> None:
+        """Тест выбора способа расчета по хранению операций."""
+        self.assertIsInstance(self.process.backend, TableProcessBackend)
+        self.assertIsInstance(self.reference.backend, DecimalProcessBackend)
+        self.assertNotIsInstance(self.reference.backend, VectorizedProcessBackend)
+        self.assertIsInstance(select_backend([], vectorized=True), VectorizedProcessBackend)
+        self.assertTrue(select_backend(self.table, vectorized=True).vectorized)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты эквивалентности векторизованного расчета количества станков расчету в Decimal.
+"""
+import random
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from design_of_mechanical_production.core.entities import Operation, Process
+from design_of_mechanical_production.core.entities.vectorized import calculate_required_machines_vectorized
+
+TOLERANCE = 1e-9
+
+
+class TestVectorized(unittest.TestCase):
+    """Тесты для векторизованного расчета."""
+
+    @staticmethod
+    def _create_process(vectorized: bool) -> Process:
+        """Создает техпроцесс из 500 операций на 7 моделях станков (одинаковый для обоих вариантов расчета)."""
+        rnd = random.Random(2025)
+        equipments = [MagicMock(model=f"model_{index}") for index in range(7)]
+        operations = [
+            Operation(
+                number=f"{index:03d}",
+                name="Операция",
+                time=Decimal(rnd.randint(1, 2_000_000)) / Decimal(100),
+                equipment=rnd.choice(equipments),
+            )
+            for index in range(500)
+        ]
+        # время, при котором расчетное количество - целое число (проверка округления вверх)
+        operations[0].time = Decimal("4080") * Decimal("2")
+        return Process(operations=operations, vectorized=vectorized)
+
+    def test_01_engine(self) -> None:
+        """Тест расчета на столбцах времени и идентификаторов моделей."""
+        result = calculate_required_machines_vectorized(
+            times=[4080, 6120, 2040],
+            model_ids=[0, 1, 0],
+            fund_of_working=4080,
+            compliance_coefficient=1,
+            progressivity_coefficient=1,
+        )
+
+        self.assertEqual(result.calculated.tolist(), [1.0, 1.5, 0.5])
+        self.assertEqual(result.accepted.tolist(), [1, 2, 1])
+        self.assertEqual(result.load_factor.tolist(), [1.0, 0.75, 0.5])
+        self.assertEqual(result.model_calculated.tolist(), [1.5, 1.5])
+
+    def test_02_equivalence_with_decimal(self) -> None:
+        """Тест эквивалентности векторизованного расчета и расчета в Decimal."""
+        reference = self._create_process(vectorized=False)
+        vectorized = self._create_process(vectorized=True)
+        for process in (reference, vectorized):
+            process._compliance_coefficient = Decimal("1.1")
+            process._progressivity_coefficient = Decimal("0.95")
+            process.calculate_required_machines()
+
+        for expected, actual in zip(reference.operations, vectorized.operations):
+            self.assertAlmostEqual(
+                float(actual.calculated_equipment_count), float(expected.calculated_equipment_count), delta=TOLERANCE
+            )
+            self.assertEqual(actual.accepted_equipment_count, expected.accepted_equipment_count)
+            self.assertAlmostEqual(float(actual.load_factor), float(expected.load_factor), delta=TOLERANCE)
+
+        self.assertEqual(
+            [equipment.model for equipment in vectorized.machines],
+            [equipment.model for equipment in reference.machines],
+        )
+        for actual, expected in zip(vectorized.machines.values(), reference.machines.values()):
+            self.assertEqual(actual.model.model, expected.model.model)
+            self.assertAlmostEqual(float(actual.calculated_count), float(expected.calculated_count), delta=TOLERANCE)
+        self.assertEqual(vectorized.accepted_machines_count, reference.accepted_machines_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
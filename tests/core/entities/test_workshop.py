@@ -6,10 +6,11 @@
 """
 import copy
 import unittest
+from dataclasses import replace
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from design_of_mechanical_production.core.entities import Operation, Process, Workshop, WorkshopZone
+from design_of_mechanical_production.core.entities import Operation, Process, ScaledOperation, Workshop, WorkshopZone
 
 
 class TestWorkshop(unittest.TestCase):
@@ -53,6 +54,12 @@ class TestWorkshop(unittest.TestCase):
         self.operation2.load_factor = Decimal("0.875")
         self.operation2.percentage = None
 
+        for operation in (self.operation1, self.operation2):
+            # Операция на программу создается так же, как Operation.scale
+            operation.scale.side_effect = lambda factor, base=operation: ScaledOperation(
+                base=base, time=base.time * factor, _percentage=base.percentage
+            )
+
         self.process = Process(operations=[self.operation1, self.operation2])
         self.process.calculate_required_machines()
 
@@ -95,11 +102,10 @@ class TestWorkshop(unittest.TestCase):
         self.assertIn('test_zone', self.workshop.zones)
         self.assertEqual(self.workshop.zones['test_zone'], test_zone)
 
-    @patch('design_of_mechanical_production.core.entities.workshop.get_setting')
-    def test_04_calculate_total_area(self, mock_get_setting):
+    def test_04_calculate_total_area(self):
         """Тест расчета общей площади цеха."""
-        # Настраиваем мок для настроек
-        mock_get_setting.side_effect = lambda x: {'workshop_span': 8, 'workshop_nam': 2}[x]
+        # Задаем настройки цеха
+        self.workshop.settings = replace(self.workshop.settings, workshop_span=Decimal("8"), workshop_nam=Decimal("2"))
 
         # Устанавливаем длину цеха
         self.workshop.length = Decimal("30")
@@ -128,11 +134,10 @@ class TestWorkshop(unittest.TestCase):
         self.workshop.length = test_length
         self.assertEqual(self.workshop.length, test_length)
 
-    @patch('design_of_mechanical_production.core.entities.workshop.get_setting')
-    def test_07_default_calculate_length(self, mock_get_setting):
+    def test_07_default_calculate_length(self):
         """Тест расчета длины цеха по умолчанию."""
-        # Настраиваем мок для настроек
-        mock_get_setting.side_effect = lambda x: {'workshop_span': 8, 'workshop_nam': 2}[x]
+        # Задаем настройки цеха
+        self.workshop.settings = replace(self.workshop.settings, workshop_span=Decimal("8"), workshop_nam=Decimal("2"))
 
         # Настраиваем мок для зоны
         main_zone = MagicMock(spec=WorkshopZone)
@@ -145,6 +150,48 @@ class TestWorkshop(unittest.TestCase):
         # Проверяем, что длина рассчитана корректно
         self.assertEqual(self.workshop.length, Decimal("66.0"))
 
+    def test_08_process_for_program_shares_operation_data(self):
+        """Тест процесса на программу: оборудование и операции на деталь не копируются и не изменяются."""
+        program_operations = self.workshop.process_for_program.operations
+
+        self.assertEqual([operation.time for operation in program_operations], [Decimal("20000"), Decimal("80000")])
+        self.assertIs(program_operations[0].base, self.operation1)
+        self.assertIs(program_operations[0].equipment, self.operation1.equipment)
+        self.assertEqual(self.operation1.time, Decimal("20"))
+
+        # повторный пересчет не накапливает масштабирование
+        self.workshop.production_volume = 10
+        self.workshop.recalculate_process_for_program()
+        self.assertEqual(self.workshop.process.operations[1].time, Decimal("800"))
+        self.assertEqual(self.workshop.process.accepted_machines_count, 2)
+
+    def test_09_area_cache(self):
+        """Тест кэширования площадей цеха и их сброса при изменении зон, длины и настроек."""
+        zone = WorkshopZone(name="Основная зона")
+        zone.add_machine("16К20", MagicMock(model=MagicMock(length=Decimal("2"), width=Decimal("1")), accepted_count=2))
+        self.workshop.add_zone('main_zone', zone)
+        self.workshop.length = Decimal("12")
+
+        for _ in range(3):
+            required_area = self.workshop.required_area
+            total_area = self.workshop.total_area
+        self.assertEqual(required_area, zone.area)
+        self.assertEqual((self.workshop.cache_stats.hits, self.workshop.cache_stats.misses), (4, 2))
+
+        zone.add_machine("1К62", MagicMock(model=MagicMock(length=Decimal("3"), width=Decimal("1")), accepted_count=1))
+        self.assertEqual(self.workshop.required_area, zone.area)
+        self.assertEqual(self.workshop.required_area_main_zone, zone.area)
+        self.assertEqual(self.workshop.required_area_additional_zones, Decimal("0"))
+
+        self.workshop.length = Decimal("24")
+        self.assertEqual(self.workshop.total_area, total_area * 2)
+
+        settings = self.workshop.settings
+        self.workshop.settings = replace(settings, workshop_nam=settings.workshop_nam * 2)
+        misses = self.workshop.cache_stats.misses
+        self.assertEqual(self.workshop.total_area, total_area * 4)
+        self.assertEqual(self.workshop.cache_stats.misses, misses + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
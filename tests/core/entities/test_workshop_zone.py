@@ -77,6 +77,23 @@ class TestWorkshopZone(unittest.TestCase):
         expected_area = (Decimal('2.0') * Decimal('1.0') + Decimal('1.5')) * 3
         self.assertEqual(self.workshop_zone.area, expected_area)
 
+    def test_06_area_cache(self):
+        """Тест кэширования площади зоны и ее сброса при изменении состава зоны."""
+        self.workshop_zone.add_machine("Станок 1", self.machine_mock)
+        area = self.workshop_zone.area
+        self.assertEqual(self.workshop_zone.area, area)
+        self.assertEqual((self.workshop_zone.cache_stats.hits, self.workshop_zone.cache_stats.misses), (1, 1))
+
+        revision = self.workshop_zone.revision
+        self.workshop_zone.add_machine("Станок 2", self.machine_mock)
+        self.assertGreater(self.workshop_zone.revision, revision)
+        self.assertEqual(self.workshop_zone.area, area * 2)
+
+        # изменение данных станка извне требует явного сброса
+        self.machine_mock.accepted_count = 1
+        self.workshop_zone.invalidate_cache()
+        self.assertEqual(self.workshop_zone.area, area * 2 / 3)
+
 
 class TestSpecificWorkshopZone(unittest.TestCase):
     """Тесты для класса SpecificWorkshopZone."""
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для кэша оборудования в EquipmentFactory.
+"""
+import unittest
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from design_of_mechanical_production.core.entities import Equipment, MachineInfo, Operation, Process
+from design_of_mechanical_production.core.factories import EQUIPMENT_REGISTRY, EquipmentFactory, EquipmentRegistry
+
+
+def build_equipment(model: str, length: str = "2.5") -> Equipment:
+    """Создает оборудование модели."""
+    return Equipment(
+        name=None,
+        model=model,
+        length=Decimal(length),
+        width=Decimal("1.2"),
+        height=Decimal("1.5"),
+        automation="ЧПУ",
+        weight=Decimal("3000"),
+        power_consumption=Decimal("11"),
+    )
+
+
+class TestEquipmentFactory(unittest.TestCase):
+    """Тесты для фабрики оборудования."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+
+        patcher = patch(
+            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory._load_equipments"
+        )
+        self.addCleanup(patcher.stop)
+        self.mock_load_equipments = patcher.start()
+        self.mock_load_equipments.side_effect = lambda models: {model: MagicMock(model=model) for model in models}
+
+        self.factory = EquipmentFactory()
+
+    def test_01_create_equipments_loads_distinct_models_once(self) -> None:
+        """Тест пакетной загрузки различных моделей за один запрос."""
+        equipments = self.factory.create_equipments(["1325Ф30", "24К40СФ4", "1325Ф30"])
+
+        self.assertEqual(list(equipments), ["1325Ф30", "24К40СФ4"])
+        self.mock_load_equipments.assert_called_once_with(["1325Ф30", "24К40СФ4"])
+
+    def test_02_cached_models_are_not_reloaded(self) -> None:
+        """Тест повторного запроса: загружаются только отсутствующие в кэше модели."""
+        first = self.factory.create_equipment("1325Ф30")
+        equipments = EquipmentFactory().create_equipments(["1325Ф30", "6720ВФ2Ф2"])
+
+        self.assertIs(equipments["1325Ф30"], first)
+        self.assertEqual(self.mock_load_equipments.call_count, 2)
+        self.mock_load_equipments.assert_called_with(["6720ВФ2Ф2"])
+
+    def test_03_invalidate_cache(self) -> None:
+        """Тест явной инвалидации кэша."""
+        self.factory.create_equipments(["1325Ф30", "24К40СФ4"])
+
+        EquipmentFactory.invalidate_cache(["1325Ф30"])
+        self.factory.create_equipments(["1325Ф30", "24К40СФ4"])
+        self.mock_load_equipments.assert_called_with(["1325Ф30"])
+
+        EquipmentFactory.invalidate_cache()
+        self.factory.create_equipments(["1325Ф30", "24К40СФ4"])
+        self.mock_load_equipments.assert_called_with(["1325Ф30", "24К40СФ4"])
+
+
+class TestEquipmentRegistry(unittest.TestCase):
+    """Тесты для реестра оборудования (один объект на модель)."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        self.registry = EquipmentRegistry()
+
+    def test_01_intern(self) -> None:
+        """Тест регистрации: одинаковые данные модели - один объект, измененные данные заменяют объект."""
+        first = self.registry.intern(build_equipment("1325Ф30"))
+
+        self.assertIs(self.registry.intern(build_equipment("1325Ф30")), first)
+        changed = self.registry.intern(build_equipment("1325Ф30", length="3.0"))
+        self.assertIsNot(changed, first)
+        self.assertIs(self.registry.get("1325Ф30"), changed)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_02_equipment_is_immutable_and_hashable(self) -> None:
+        """Тест неизменяемости и хешируемости оборудования."""
+        equipment = build_equipment("1325Ф30")
+
+        with self.assertRaises(FrozenInstanceError):
+            equipment.length = Decimal("3.0")
+        self.assertEqual(len({equipment, build_equipment("1325Ф30")}), 1)
+
+    def test_03_factory_reload_keeps_identity(self) -> None:
+        """Тест повторной загрузки модели после сброса кэша фабрики: возвращается прежний объект."""
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+        self.addCleanup(EQUIPMENT_REGISTRY.clear)
+        with patch.object(EquipmentFactory, '_load_equipments') as load_equipments:
+            load_equipments.side_effect = lambda models: {model: build_equipment(model) for model in models}
+            first = EquipmentFactory().create_equipment("1325Ф30")
+            EquipmentFactory.invalidate_cache()
+            second = EquipmentFactory().create_equipment("1325Ф30")
+
+        self.assertIs(second, first)
+        self.assertIs(EQUIPMENT_REGISTRY.get("1325Ф30"), first)
+
+    def test_04_process_groups_by_equipment(self) -> None:
+        """Тест группировки операций процесса по оборудованию (в том числе равных объектов одной модели)."""
+        equipment = build_equipment("1325Ф30")
+        operations = [
+            Operation(number="005", name="Фрезерная", time=Decimal("2040"), equipment=equipment),
+            Operation(number="010", name="Токарная", time=Decimal("4080"), equipment=build_equipment("16К20")),
+            Operation(number="015", name="Фрезерная", time=Decimal("2040"), equipment=equipment),
+            Operation(number="020", name="Фрезерная", time=Decimal("4080"), equipment=build_equipment("1325Ф30")),
+        ]
+        process = Process.from_operations(
+            operations,
+            _compliance_coefficient=Decimal("1"),
+            _progressivity_coefficient=Decimal("1"),
+            _fund_of_working=Decimal("4080"),
+        )
+        process.calculate_required_machines()
+
+        self.assertEqual(list(process.machines), [equipment, build_equipment("16К20")])
+        self.assertEqual(process.machines[equipment], MachineInfo(model=equipment, calculated_count=Decimal("2")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для расчета цеха в фоновом потоке.
+"""
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from design_of_mechanical_production.core.entities import Workshop
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.core.services.calculation_task import (
+    STAGE_OPERATIONS,
+    STAGE_REPORT,
+    STAGE_ZONES,
+    CalculationCancelled,
+    CalculationTask,
+    calculate_workshop,
+)
+
+
+class TestCalculationTask(unittest.TestCase):
+    """Тесты для расчета цеха в фоновом потоке."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+
+        patcher = patch(
+            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory._load_equipments"
+        )
+        self.addCleanup(patcher.stop)
+        self.mock_load_equipments = patcher.start()
+        mock_equipment = MagicMock()
+        mock_equipment.model = "DMG CTX beta 2000"
+        self.mock_load_equipments.side_effect = lambda models: {model: mock_equipment for model in models}
+
+        self.parameters_data = {'name': "Цех №1", 'production_volume': 1000.0, 'mass_detail': 10.5}
+        self.process_data = [
+            {'number': "005", 'name': "Операция 1", 'time': 10.5, 'machine': "DMG CTX beta 2000"},
+            {'number': "010", 'name': "Операция 2", 'time': 15.3, 'machine': "DMG CTX beta 2000"},
+        ]
+
+    def test_01_progress_stages(self) -> None:
+        """Тест уведомлений о ходе расчета и формирования отчета."""
+        report_generator = MagicMock()
+        report_generator.generate_report.return_value = "Отчет"
+        progress = []
+
+        result = calculate_workshop(
+            self.parameters_data, self.process_data, on_progress=progress.append, report_generator=report_generator
+        )
+
+        self.assertIsInstance(result.workshop, Workshop)
+        self.assertEqual(result.report, "Отчет")
+        self.assertEqual([item.stage for item in progress], [STAGE_OPERATIONS, STAGE_ZONES, STAGE_REPORT])
+        self.assertEqual([(item.step, item.total) for item in progress], [(1, 3), (2, 3), (3, 3)])
+
+    def test_02_cancel_between_stages(self) -> None:
+        """Тест отмены расчета на границе этапов."""
+        progress = []
+
+        with self.assertRaises(CalculationCancelled):
+            calculate_workshop(
+                self.parameters_data,
+                self.process_data,
+                on_progress=progress.append,
+                is_cancelled=lambda: bool(progress),
+            )
+        self.assertEqual([item.stage for item in progress], [STAGE_OPERATIONS])
+
+    def test_03_task_done(self) -> None:
+        """Тест расчета в фоновом потоке: результат передается через dispatch."""
+        done = threading.Event()
+        results, threads = [], []
+
+        def dispatch(function) -> None:
+            threads.append(threading.current_thread())
+            function()
+
+        task = CalculationTask(
+            self.parameters_data,
+            self.process_data,
+            on_done=lambda result: (results.append(result), done.set()),
+            dispatch=dispatch,
+        ).start()
+        task.join(timeout=10)
+
+        self.assertTrue(done.is_set())
+        self.assertIsInstance(results[0].workshop, Workshop)
+        self.assertFalse(task.running)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_04_task_error_and_cancel(self) -> None:
+        """Тест передачи ошибки и отсутствия уведомлений после отмены."""
+        errors = []
+        task = CalculationTask(self.parameters_data, [], on_error=errors.append).start()
+        task.join(timeout=10)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+        callback = MagicMock()
+        task = CalculationTask(
+            self.parameters_data, self.process_data, on_progress=callback, on_done=callback, on_error=callback
+        )
+        task.cancel()
+        task.start().join(timeout=10)
+        self.assertTrue(task.cancelled)
+        callback.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,12 @@ import unittest
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from design_of_mechanical_production.core.entities import Operation
-from design_of_mechanical_production.core.services.operation_creator import create_operations_from_data
+from design_of_mechanical_production.core.entities import Operation, ProcessTable
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.core.services.operation_creator import (
+    create_operations_from_data,
+    create_process_table_from_data,
+)
 
 
 class TestOperationCreator(unittest.TestCase):
@@ -14,16 +18,20 @@ class TestOperationCreator(unittest.TestCase):
 
     def setUp(self) -> None:
         """Подготовка тестовых данных."""
+        # Сбрасываем кэш оборудования, чтобы каждый тест обращался к источнику данных
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+
         patcher = patch(
-            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory.create_equipment"
+            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory._load_equipments"
         )
         self.addCleanup(patcher.stop)
-        self.mock_create_equipment = patcher.start()
+        self.mock_load_equipments = patcher.start()
 
-        # Настраиваем мок для create_equipment
+        # Настраиваем мок для _load_equipments
         mock_equipment = MagicMock()
         mock_equipment.model = "DMG CTX beta 2000"
-        self.mock_create_equipment.return_value = mock_equipment
+        self.mock_load_equipments.side_effect = lambda models: {model: mock_equipment for model in models}
 
         self.valid_process_data = [
             {'number': "005", 'name': "Операция 1", 'time': 10.5, 'machine': "DMG CTX beta 2000"},
@@ -56,9 +64,8 @@ class TestOperationCreator(unittest.TestCase):
         self.assertEqual(operations[1].time, Decimal("15.3"))
         self.assertEqual(operations[1].equipment.model, "DMG CTX beta 2000")
 
-        # Проверка вызовов create_equipment
-        self.assertEqual(self.mock_create_equipment.call_count, 2)
-        self.mock_create_equipment.assert_any_call("DMG CTX beta 2000")
+        # Проверка загрузки оборудования: все различные станки маршрута одним пакетом
+        self.mock_load_equipments.assert_called_once_with(["DMG CTX beta 2000"])
 
     def test_02_create_operations_with_single_operation(self) -> None:
         """Тест создания одной операции."""
@@ -76,8 +83,8 @@ class TestOperationCreator(unittest.TestCase):
         self.assertEqual(operations[0].time, Decimal("10.5"))
         self.assertEqual(operations[0].equipment.model, "DMG CTX beta 2000")
 
-        # Проверка вызова create_equipment
-        self.mock_create_equipment.assert_called_once_with("DMG CTX beta 2000")
+        # Проверка загрузки оборудования
+        self.mock_load_equipments.assert_called_once_with(["DMG CTX beta 2000"])
 
     def test_03_create_operations_with_empty_data(self) -> None:
         """Тест создания операций с пустым списком данных."""
@@ -87,14 +94,14 @@ class TestOperationCreator(unittest.TestCase):
         # Проверка
         self.assertIsInstance(operations, list)
         self.assertEqual(len(operations), 0)
-        self.mock_create_equipment.assert_not_called()
+        self.mock_load_equipments.assert_not_called()
 
     def test_04_create_operations_with_invalid_machine(self) -> None:
         """Тест создания операций с несуществующей моделью станка."""
         invalid_data = [{'number': "005", 'name': "Операция 1", 'time': 10.5, 'machine': "Несуществующий станок"}]
 
         # Настраиваем мок для выброса исключения
-        self.mock_create_equipment.side_effect = ValueError("Станок не найден")
+        self.mock_load_equipments.side_effect = ValueError("Станок не найден")
 
         # Проверка
         with self.assertRaises(ValueError):
@@ -108,6 +115,17 @@ class TestOperationCreator(unittest.TestCase):
         with self.assertRaises(ValueError):
             create_operations_from_data(invalid_data)
 
+    def test_06_create_process_table(self) -> None:
+        """Тест создания таблицы операций (столбцовое хранение)."""
+        table = create_process_table_from_data(self.valid_process_data)
+
+        self.assertIsInstance(table, ProcessTable)
+        self.assertEqual([operation.number for operation in table], ["005", "010"])
+        self.assertEqual(table[1].name, "Операция 2")
+        self.assertEqual(table[1].time, Decimal("15.3"))
+        self.assertEqual(table.equipments, [table[0].equipment])
+        self.mock_load_equipments.assert_called_once_with(["DMG CTX beta 2000"])
+
 
 if __name__ == '__main__':
     unittest.main()
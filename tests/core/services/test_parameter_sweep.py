@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для многовариантного расчета цеха.
+"""
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from design_of_mechanical_production.core.entities import Equipment
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.core.services import create_workshop_from_data
+from design_of_mechanical_production.core.services.parameter_sweep import (
+    SWEEP_METRICS,
+    Scenario,
+    run_sweep,
+    scenario_grid,
+)
+
+
+class TestParameterSweep(unittest.TestCase):
+    """Тесты для многовариантного расчета."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+
+        patcher = patch(
+            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory._load_equipments"
+        )
+        self.addCleanup(patcher.stop)
+        self.mock_load_equipments = patcher.start()
+        self.mock_load_equipments.side_effect = lambda models: {
+            model: Equipment(
+                name=None,
+                model=model,
+                length=Decimal("3.2"),
+                width=Decimal("1.8"),
+                height=Decimal("2"),
+                automation="ЧПУ",
+                weight=Decimal("4500"),
+                power_consumption=Decimal("15"),
+            )
+            for model in models
+        }
+
+        self.parameters_data = {'name': "Цех №1", 'production_volume': 20000, 'mass_detail': 10.5}
+        self.process_data = [
+            {'number': "005", 'name': "Токарная", 'time': 10.5, 'machine': "16К20Ф3"},
+            {'number': "010", 'name': "Фрезерная", 'time': 15.3, 'machine': "6Р13Ф3"},
+            {'number': "015", 'name': "Токарная", 'time': 4.2, 'machine': "16К20Ф3"},
+        ]
+
+    def test_01_scenario_grid(self) -> None:
+        """Тест формирования сетки вариантов."""
+        scenarios = scenario_grid(kp=[1.3, 1.4, 1.5], production_volume=[5000, 50000])
+
+        self.assertEqual(len(scenarios), 6)
+        self.assertEqual(scenarios[0], Scenario(kp=Decimal("1.3"), production_volume=Decimal("5000")))
+        with self.assertRaises(ValueError):
+            scenario_grid(volume=[5000])
+
+    def test_02_run_sweep(self) -> None:
+        """Тест расчета сетки: оборудование загружается один раз, результаты совпадают с отдельным расчетом."""
+        # первый вариант - с исходными параметрами и настройками
+        scenarios = [Scenario()] + scenario_grid(kp=[1, 1.5], production_volume=[5000, 20000])
+
+        result = run_sweep(self.parameters_data, self.process_data, scenarios)
+
+        self.assertEqual(len(result), 5)
+        self.assertTrue(set(SWEEP_METRICS) <= set(result.columns))
+        self.mock_load_equipments.assert_called_once_with(["16К20Ф3", "6Р13Ф3"])
+
+        # вариант с исходными параметрами совпадает с обычным расчетом
+        workshop = create_workshop_from_data(self.parameters_data, self.process_data)
+        row = result.iloc[0]
+        self.assertAlmostEqual(row['total_area'], float(workshop.total_area))
+        self.assertEqual(row['total_machines_count'], workshop.total_machines_count)
+
+        # с ростом объема производства площадь не уменьшается
+        for kp in (1, 1.5):
+            areas = result[result['kp'] == kp].sort_values('production_volume')['total_area'].tolist()
+            self.assertLessEqual(areas[0], areas[1])
+
+    def test_03_run_sweep_vectorized(self) -> None:
+        """Тест многовариантного расчета с векторизованным расчетом количества станков."""
+        scenarios = scenario_grid(kv=[1, 1.1], production_volume=[5000, 20000])
+
+        reference = run_sweep(self.parameters_data, self.process_data, scenarios)
+        vectorized = run_sweep(self.parameters_data, self.process_data, scenarios, vectorized=True)
+
+        self.assertEqual(reference['total_machines_count'].tolist(), vectorized['total_machines_count'].tolist())
+        for expected, actual in zip(reference['total_area'], vectorized['total_area']):
+            self.assertAlmostEqual(expected, actual, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,14 @@ import unittest
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from design_of_mechanical_production.core.entities import Workshop
-from design_of_mechanical_production.core.services.workshop_creator import create_workshop_from_data
+from design_of_mechanical_production.core.entities import Equipment, Workshop
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.core.services.workshop_creator import (
+    STAGE_OPERATIONS,
+    STAGE_ZONES,
+    CalculationCancelled,
+    create_workshop_from_data,
+)
 
 
 class TestWorkshopCreator(unittest.TestCase):
@@ -14,16 +20,20 @@ class TestWorkshopCreator(unittest.TestCase):
 
     def setUp(self) -> None:
         """Подготовка тестовых данных."""
+        # Сбрасываем кэш оборудования, чтобы каждый тест обращался к источнику данных
+        EquipmentFactory.invalidate_cache()
+        self.addCleanup(EquipmentFactory.invalidate_cache)
+
         patcher = patch(
-            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory.create_equipment"
+            "design_of_mechanical_production.core.factories.equipment_factory.EquipmentFactory._load_equipments"
         )
         self.addCleanup(patcher.stop)
-        self.mock_create_equipment = patcher.start()
+        self.mock_load_equipments = patcher.start()
 
-        # Настраиваем мок для create_equipment
+        # Настраиваем мок для _load_equipments
         mock_equipment = MagicMock()
         mock_equipment.model = "DMG CTX beta 2000"
-        self.mock_create_equipment.return_value = mock_equipment
+        self.mock_load_equipments.side_effect = lambda models: {model: mock_equipment for model in models}
 
         self.valid_parameters_data = {'name': "Цех №1", 'production_volume': 1000.0, 'mass_detail': 10.5}
         self.valid_process_data = [
@@ -57,9 +67,8 @@ class TestWorkshopCreator(unittest.TestCase):
         self.assertEqual(workshop.process.operations[0].number, "005")
         self.assertEqual(workshop.process.operations[1].number, "010")
 
-        # Проверка вызовов create_equipment
-        self.assertEqual(self.mock_create_equipment.call_count, 2)
-        self.mock_create_equipment.assert_any_call("DMG CTX beta 2000")
+        # Проверка загрузки оборудования: все различные станки маршрута одним пакетом
+        self.mock_load_equipments.assert_called_once_with(["DMG CTX beta 2000"])
 
     def test_02_create_workshop_with_empty_process_data(self) -> None:
         """Тест создания цеха с пустым списком операций."""
@@ -102,12 +111,64 @@ class TestWorkshopCreator(unittest.TestCase):
         ]
 
         # Настраиваем мок для выброса исключения
-        self.mock_create_equipment.side_effect = ValueError("Станок не найден")
+        self.mock_load_equipments.side_effect = ValueError("Станок не найден")
 
         # Проверка
         with self.assertRaises(ValueError):
             create_workshop_from_data(self.valid_parameters_data, invalid_process_data)
 
+    def test_07_update_matches_new_workshop(self) -> None:
+        """Тест изменения параметров цеха: результат совпадает с цехом, рассчитанным заново."""
+        self.mock_load_equipments.side_effect = lambda models: {
+            model: Equipment(
+                name=None,
+                model=model,
+                length=Decimal("3.2"),
+                width=Decimal("1.8"),
+                height=Decimal("2"),
+                automation="ЧПУ",
+                weight=Decimal("4500"),
+                power_consumption=Decimal("15"),
+            )
+            for model in models
+        }
+        workshop = create_workshop_from_data(self.valid_parameters_data, self.valid_process_data)
+
+        with patch.object(
+            workshop.process, '_calculate_required_machines', wraps=workshop.process._calculate_required_machines
+        ) as mock_calculate:
+            workshop.update(compliance_coefficient=Decimal("1.2"), progressivity_coefficient=Decimal("1.1"))
+        mock_calculate.assert_called_once()
+
+        workshop.update(production_volume=Decimal("20000"))
+
+        expected = create_workshop_from_data(
+            dict(self.valid_parameters_data, production_volume=20000), self.valid_process_data
+        )
+        expected.update(compliance_coefficient=Decimal("1.2"), progressivity_coefficient=Decimal("1.1"))
+        self.assertEqual(workshop.process.compliance_coefficient, Decimal("1.2"))
+        self.assertEqual(workshop.total_machines_count, expected.total_machines_count)
+        for name, zone in expected.zones.items():
+            self.assertEqual(workshop.zones[name].area, zone.area, name)
+        self.assertEqual(workshop.length, expected.length)
+        self.assertEqual(workshop.total_area, expected.total_area)
+
+    def test_08_progress_and_cancel_hooks(self) -> None:
+        """Тест уведомлений об этапах расчета и отмены на границе этапов."""
+        stages = []
+        create_workshop_from_data(self.valid_parameters_data, self.valid_process_data, on_progress=stages.append)
+        self.assertEqual(stages, [STAGE_OPERATIONS, STAGE_ZONES])
+
+        stages.clear()
+        with self.assertRaises(CalculationCancelled):
+            create_workshop_from_data(
+                self.valid_parameters_data,
+                self.valid_process_data,
+                on_progress=stages.append,
+                is_cancelled=lambda: bool(stages),
+            )
+        self.assertEqual(stages, [STAGE_OPERATIONS])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для чтения начальных данных из колоночных форматов.
+"""
+import math
+import tempfile
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+
+import pandas as pd
+
+from design_of_mechanical_production.data.input import (
+    ColumnarReader,
+    ExcelReader,
+    convert_workbook,
+    create_data_reader,
+)
+
+
+class TestColumnarReader(unittest.TestCase):
+    """Тесты для класса ColumnarReader и преобразования книг Excel."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовой книги начальных данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.workbook = self.root / "initial_data.xlsx"
+        parameters = pd.DataFrame({'name': ['Цех'], 'production_volume': [10000], 'mass_detail': [112.8]})
+        process = pd.DataFrame(
+            {
+                'number': ["005", "010", None],
+                'name': ["Токарная с ЧПУ", "Расточная с ЧПУ", "Фрезерная с ЧПУ"],
+                'time': [11.6712, 20.8216, 1.8592],
+                'machine': ["1325Ф30", "24К40СФ4", "6720ВФ2Ф2"],
+            }
+        )
+        with pd.ExcelWriter(self.workbook, engine='openpyxl') as writer:
+            parameters.to_excel(writer, sheet_name='Parameters', index=False)
+            process.to_excel(writer, sheet_name='Process', index=False)
+        self.excel_reader = ExcelReader(self.workbook, engine='openpyxl')
+
+    def _assert_same_as_excel(self, reader: ColumnarReader) -> None:
+        """Проверяет, что данные совпадают с чтением книги Excel."""
+        self.assertEqual(reader.read_parameters_data(), self.excel_reader.read_parameters_data())
+        self.assertEqual(
+            [_comparable(row) for row in reader.read_process_data()],
+            [_comparable(row) for row in self.excel_reader.read_process_data()],
+        )
+
+    def test_01_csv(self) -> None:
+        """Тест преобразования в CSV: номера операций остаются строками ('005')."""
+        dataset = convert_workbook(self.workbook, fmt='csv')
+        self.assertEqual(dataset, self.root / "initial_data")
+        self.assertTrue((dataset / "Process.csv").is_file())
+
+        self._assert_same_as_excel(ColumnarReader(dataset))
+        self._assert_same_as_excel(ColumnarReader(dataset / "Process.csv"))
+        self.assertEqual(ColumnarReader(dataset).read_process_data()[0]['number'], "005")
+
+    @unittest.skipUnless(find_spec('pyarrow') or find_spec('fastparquet'), "нет движка Parquet")
+    def test_02_parquet(self) -> None:
+        """Тест преобразования в Parquet."""
+        self._assert_same_as_excel(ColumnarReader(convert_workbook(self.workbook, self.root / "pq")))
+
+    def test_03_create_data_reader(self) -> None:
+        """Тест выбора объекта чтения по пути."""
+        self.assertIsInstance(create_data_reader(self.workbook), ExcelReader)
+        self.assertIsInstance(create_data_reader(self.root / "initial_data"), ColumnarReader)
+
+    def test_04_missing_table(self) -> None:
+        """Тест: отсутствие таблицы набора данных."""
+        with self.assertRaisesRegex(Exception, "технологическом процессе"):
+            ColumnarReader(self.root).read_process_data()
+
+
+def _comparable(row):
+    """Заменяет NaN на None (NaN не равен самому себе)."""
+    return {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in row.items()}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для чтения начальных данных из Excel.
+"""
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from design_of_mechanical_production.data.input import ExcelReader
+
+
+class TestExcelReader(unittest.TestCase):
+    """Тесты для класса ExcelReader."""
+
+    def setUp(self) -> None:
+        """Подготовка тестового файла начальных данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.filepath = Path(temp_dir.name) / "initial_data.xlsx"
+        parameters = pd.DataFrame({'name': ['Цех'], 'production_volume': [10000], 'mass_detail': [112.8]})
+        process = pd.DataFrame(
+            {
+                'number': ["005", "010", None, "020"],
+                'name': ["Токарная с ЧПУ", "Расточная с ЧПУ", "Токарная с ЧПУ", "Фрезерная с ЧПУ"],
+                'time': [11.6712, 20.8216, 5.6484, 1.8592],
+                'machine': ["1325Ф30", "24К40СФ4", "1325Ф30", None],
+            }
+        )
+        with pd.ExcelWriter(self.filepath, engine='openpyxl') as writer:
+            parameters.to_excel(writer, sheet_name='Parameters', index=False)
+            process.to_excel(writer, sheet_name='Process', index=False)
+
+    def test_01_workbook_is_read_once(self) -> None:
+        """Тест: книга открывается один раз, данные совпадают с чтением листов по отдельности."""
+        reader = ExcelReader(self.filepath, engine='openpyxl')
+        with patch('pandas.ExcelFile', wraps=pd.ExcelFile) as m:
+            parameters_data = reader.read_parameters_data()
+            process_data = reader.read_process_data()
+        m.assert_called_once()
+
+        self.assertEqual(parameters_data, {'name': 'Цех', 'production_volume': 10000, 'mass_detail': 112.8})
+        expected = pd.read_excel(self.filepath, sheet_name='Process', dtype={'number': str}).to_dict('records')
+        self.assertEqual(len(process_data), len(expected))
+        for row, expected_row in zip(process_data, expected):
+            self.assertEqual(_comparable(row), _comparable(expected_row))
+
+    def test_02_iter_process_rows(self) -> None:
+        """Тест построчного чтения технологического процесса."""
+        reader = ExcelReader(self.filepath, engine='openpyxl')
+        rows = list(reader.iter_process_rows())
+        self.assertEqual([_comparable(row) for row in rows], [_comparable(row) for row in reader.read_process_data()])
+
+    def test_03_iter_process_rows_matches_pandas(self) -> None:
+        """Тест: построчное чтение дает те же значения и типы, что и чтение листа через pandas."""
+        process = pd.DataFrame(
+            {
+                'number': [5, 10.5, None, "020"],
+                'name': ["Токарная с ЧПУ", "Расточная с ЧПУ", None, "Фрезерная с ЧПУ"],
+                'time': [20, 11.5, 5, 1],
+                'machine': ["1325Ф30", "24К40СФ4", "1325Ф30", "6Р13Ф3"],
+                'count': [1, 2, 3, 4],
+                'area': [10, None, 30, 40],
+                'note': [None, None, None, None],
+            }
+        )
+        with pd.ExcelWriter(self.filepath, engine='openpyxl') as writer:
+            process.to_excel(writer, sheet_name='Process', index=False)
+
+        reader = ExcelReader(self.filepath, engine='openpyxl')
+        rows = [_typed(row) for row in reader.iter_process_rows()]
+        self.assertEqual(rows, [_typed(row) for row in reader.read_process_data()])
+        self.assertEqual(rows[0]['time'], (float, 20.0))
+        self.assertEqual(rows[0]['count'], (int, 1))
+
+    def test_04_missing_sheet(self) -> None:
+        """Тест: ошибка чтения листа выдается при обращении к этому листу."""
+        with pd.ExcelWriter(self.filepath, engine='openpyxl') as writer:
+            pd.DataFrame({'name': ['Цех'], 'production_volume': [1], 'mass_detail': [1.0]}).to_excel(
+                writer, sheet_name='Parameters', index=False
+            )
+        reader = ExcelReader(self.filepath, engine='openpyxl')
+        self.assertEqual(reader.read_parameters_data()['name'], 'Цех')
+        with self.assertRaisesRegex(Exception, "технологическом процессе"):
+            reader.read_process_data()
+
+
+def _comparable(row):
+    """Заменяет NaN на None (NaN не равен самому себе)."""
+    return {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in row.items()}
+
+
+def _typed(row):
+    """Сопоставляет значениям их типы (20 и 20.0 считаются равными при обычном сравнении)."""
+    return {key: (type(value), value) for key, value in _comparable(row).items()}
+
+
+if __name__ == '__main__':
+    unittest.main()
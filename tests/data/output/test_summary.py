@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для сводного режима текстового отчета.
+"""
+import csv
+import tempfile
+import unittest
+from decimal import Decimal
+from importlib.util import find_spec
+from pathlib import Path
+
+from benchmarks.pipeline import _workshop, synthetic_machine_catalog, synthetic_route
+from design_of_mechanical_production.core.services import create_operations_from_data, create_process_from_data
+from design_of_mechanical_production.data.input.columnar_reader import read_table
+from design_of_mechanical_production.data.output import ReportSummary, TextReportGenerator, write_operations_table
+from design_of_mechanical_production.data.output.summary import (
+    OPERATIONS_TABLE_COLUMNS,
+    group_operations,
+    select_operations,
+)
+
+
+def build_workshop(size: int):
+    """Рассчитывает цех по синтетическому маршруту из size операций на трех моделях станков."""
+    route = synthetic_route(size, models_count=3)
+    with synthetic_machine_catalog():
+        return _workshop(create_process_from_data(create_operations_from_data(route)))
+
+
+class TestReportSummary(unittest.TestCase):
+    """Тесты для сводного отчета."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Расчет цехов по маршрутам разной длины."""
+        cls.small = build_workshop(100)
+        cls.large = build_workshop(1000)
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.summary = ReportSummary(top=3)
+        self.generator = TextReportGenerator(summary=self.summary)
+
+    def test_01_group_operations(self) -> None:
+        """Тест группировки операций по виду операции и модели станка."""
+        operations = self.large.process.operations
+        groups = group_operations(operations, Decimal("10"))
+
+        self.assertLessEqual(len(groups), 15)
+        self.assertEqual(sum(group.count for group in groups), len(operations))
+        self.assertEqual(sum(group.time for group in groups), sum(operation.time for operation in operations))
+        self.assertEqual(
+            sum(group.accepted_equipment_count for group in groups), self.large.process.accepted_machines_count
+        )
+
+    def test_02_select_operations(self) -> None:
+        """Тест отбора операций с наибольшей трудоемкостью (в порядке маршрута)."""
+        operations = self.large.process.operations
+        selected = select_operations(operations, 3)
+
+        self.assertEqual(len(selected), 3)
+        self.assertEqual(
+            sorted((operation.time for operation in selected), reverse=True),
+            sorted((operation.time for operation in operations), reverse=True)[:3],
+        )
+        indexes = [operations.index(operation) for operation in selected]
+        self.assertEqual(indexes, sorted(indexes))
+
+    def test_03_report_size_independent_of_route_length(self) -> None:
+        """Тест объема сводного отчета: не зависит от длины маршрута."""
+        small = self.generator.generate_report(self.small).splitlines()
+        large = self.generator.generate_report(self.large).splitlines()
+        full = TextReportGenerator().generate_report(self.large).splitlines()
+
+        self.assertEqual(len(small), len(large))
+        self.assertLess(len(large), len(full) / 10)
+        self.assertIn("Подробный расчет приведен для 3 из 1000 операций с наибольшей трудоемкостью", "\n".join(large))
+
+    def test_04_export_operations_table(self) -> None:
+        """Тест сохранения расчета по каждой операции в таблицу операций рядом с отчетом."""
+        report_path = self.root / "report.txt"
+
+        self.assertTrue(self.generator.export_report(self.large, report_path))
+
+        table_path = self.root / "report_operations.csv"
+        self.assertEqual(self.summary.table_path(report_path), table_path)
+        with open(table_path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        operations = self.large.process.operations
+        self.assertEqual(tuple(rows[0]), OPERATIONS_TABLE_COLUMNS)
+        self.assertEqual(len(rows), len(operations))
+        self.assertEqual(rows[0]['number'], operations[0].number)
+        self.assertEqual(Decimal(rows[0]['time']), operations[0].time)
+        self.assertEqual(int(rows[0]['accepted_equipment_count']), operations[0].accepted_equipment_count)
+
+    def test_05_invalid_summary(self) -> None:
+        """Тест проверки параметров сводного отчета."""
+        with self.assertRaises(ValueError):
+            ReportSummary(key='area')
+        with self.assertRaises(ValueError):
+            ReportSummary(top=-1)
+        with self.assertRaises(ValueError):
+            ReportSummary(table_format='xlsx')
+
+    @unittest.skipUnless(find_spec('pyarrow'), "нет pyarrow")
+    def test_06_parquet_operations_table(self) -> None:
+        """Тест таблицы операций в формате Parquet: текстовые колонки сохраняются, числа - как float64."""
+        operations = self.small.process.operations
+        table_path = self.root / "operations.parquet"
+
+        write_operations_table(operations, Decimal("10"), table_path)
+
+        df = read_table(table_path)
+        self.assertEqual(list(df.columns), list(OPERATIONS_TABLE_COLUMNS))
+        self.assertEqual(df['number'].tolist(), [operation.number for operation in operations])
+        self.assertEqual(
+            df['accepted_equipment_count'].tolist()[:3], [op.accepted_equipment_count for op in operations[:3]]
+        )
+        self.assertAlmostEqual(df['time'].iloc[0], float(operations[0].time))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для генератора текстового отчета.
+"""
+import io
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.pipeline import _process, _workshop, synthetic_machine_catalog
+from design_of_mechanical_production.data.output import TextReportGenerator
+from design_of_mechanical_production.data.output.formatters import TableFormatter
+from design_of_mechanical_production.data.output.text_report import wrap_lines
+
+
+class TestTextReportGenerator(unittest.TestCase):
+    """Тесты для класса TextReportGenerator."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Расчет цеха по синтетическому маршруту."""
+        with synthetic_machine_catalog():
+            cls.workshop = _workshop(_process(50))
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.generator = TextReportGenerator()
+        self.report = self.generator.generate_report(self.workshop)
+
+    def test_01_sections(self) -> None:
+        """Тест сборки отчета из разделов."""
+        sections = [list(section) for section in self.generator.iter_sections(self.workshop)]
+
+        self.assertEqual(len(sections), 5)
+        self.assertEqual(sections[0][0], f"Отчет по цеху: {self.workshop.name}")
+        self.assertEqual(sections[4][0], "5. Окончательная компоновка цеха. ")
+        self.assertEqual("\n".join(line for section in sections for line in section), self.report)
+
+    def test_02_write_report_matches_save_report(self) -> None:
+        """Тест совпадения потоковой записи с сохранением готового текста."""
+        self.assertTrue(self.generator.save_report(self.report, self.root / "saved.txt"))
+        self.assertTrue(self.generator.export_report(self.workshop, self.root / "exported.txt"))
+        self.assertEqual(
+            (self.root / "exported.txt").read_bytes(),
+            (self.root / "saved.txt").read_bytes(),
+        )
+
+        stream = io.StringIO()
+        self.generator.write_report(self.workshop, stream, width=None)
+        self.assertEqual(stream.getvalue(), self.report)
+
+    def test_03_export_error(self) -> None:
+        """Тест ошибки при сохранении отчета в несуществующий каталог."""
+        with patch('builtins.print'):
+            self.assertFalse(self.generator.export_report(self.workshop, self.root / "missing" / "report.txt"))
+
+    def test_04_table_formatter_iter_format(self) -> None:
+        """Тест построчного форматирования таблицы из генератора строк."""
+        formatter = TableFormatter()
+        rows = [("1", "2"), ("3", "4")]
+
+        lines = formatter.iter_format(["a", "b"], iter(rows), ("-", "5"))
+
+        self.assertEqual(list(lines), formatter.format(["a", "b"], rows, ("-", "5")))
+        self.assertEqual(len(formatter.format(["a", "b"], rows, ("-", "5"))), 8)
+
+    def test_05_wrap_lines(self) -> None:
+        """Тест переноса строк (короткие строки без изменений, как в textwrap)."""
+        lines = ["короткая строка", "строка с пробелом в конце ", "табуляция\t(2)", "слово " * 30, "   "]
+
+        expected = []
+        for line in lines:
+            expected.extend(textwrap.wrap(line, width=40) if line.strip() else [""])
+
+        self.assertEqual(list(wrap_lines(lines, width=40)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для менеджера событий таблицы.
+"""
+import unittest
+from importlib.util import find_spec
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+def make_row(number: str = "", time: str = "", machine: str = ""):
+    """Создает строку из простых объектов с полем text."""
+    return [
+        SimpleNamespace(text=number),
+        SimpleNamespace(text="Токарная"),
+        SimpleNamespace(text=time),
+        SimpleNamespace(text=machine),
+    ]
+
+
+@unittest.skipUnless(find_spec('kivy') and find_spec('kivymd'), "нет Kivy (пакет gui импортирует окна)")
+class TestTableEventManager(unittest.TestCase):
+    """Тесты для менеджера событий таблицы."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        from design_of_mechanical_production.gui.components.event_manager import TableEventManagerImpl
+
+        self.table = MagicMock()
+        self.table.table_rows = []
+        self.table.row_factory.create_row.side_effect = make_row
+        self.manager = TableEventManagerImpl(self.table)
+        for index in range(5):
+            self.manager.add_row(make_row(f"{index:03}", "1", "16К20"))
+        self.manager.add_empty_row()
+
+    def test_01_changes_are_coalesced(self) -> None:
+        """Тест обработки нескольких изменений строки один раз."""
+        row = self.table.table_rows[2]
+        self.manager.on_row_changed = MagicMock()
+
+        for value in ["0", "01", "010"]:
+            row[0].text = value
+            self.manager.on_row_text_changed(row, value)
+        self.manager._flush_changes()
+
+        self.manager.on_row_changed.assert_called_once_with(2, ["010", "Токарная", "1", "16К20"])
+
+    def test_02_row_index_after_remove(self) -> None:
+        """Тест индексов строк после удаления строки и изменения таблицы в обход менеджера."""
+        rows = self.table.table_rows
+        last_row = rows[4]
+        for widget in (rows[1][0], rows[1][2], rows[1][3]):
+            widget.text = ""
+        self.manager.on_row_text_changed(rows[1], "")
+        self.manager._flush_changes()
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(self.manager._row_index(last_row), 3)
+
+        self.table.table_rows = [last_row]
+        self.assertEqual(self.manager._row_index(last_row), 0)
+
+    def test_03_empty_row_added(self) -> None:
+        """Тест добавления пустой строки при заполнении последней строки."""
+        row = self.table.table_rows[-1]
+        row[0].text = "030"
+        self.manager.on_row_text_changed(row, "030")
+        self.manager._flush_changes()
+
+        self.assertEqual(len(self.table.table_rows), 7)
+        self.assertEqual(self.table.row_factory.create_row.call_count, 2)
+
+    def test_04_empty_row_after_removing_last_row(self) -> None:
+        """Тест пустой строки в конце таблицы после удаления последней строки."""
+        rows = self.table.table_rows
+        self.manager.on_row_text_changed(rows[-1], "")
+        self.manager._flush_changes()
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual([widget.text for widget in rows[-1]], ["", "Токарная", "", ""])
+
+        self.manager.remove_row(len(rows) - 1)
+        last_row = rows[-1]
+        for widget in (last_row[0], last_row[2], last_row[3]):
+            widget.text = ""
+        self.manager.on_row_text_changed(last_row, "")
+        self.manager._flush_changes()
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1][0].text, "")
+        self.assertEqual(rows[-2][0].text, "003")
+
+
+if __name__ == '__main__':
+    unittest.main()
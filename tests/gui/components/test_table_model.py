@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для данных таблицы технологического процесса.
+"""
+import unittest
+from importlib.util import find_spec
+
+
+@unittest.skipUnless(find_spec('kivy') and find_spec('kivymd'), "нет Kivy (пакет gui импортирует окна)")
+class TestProcessTableModel(unittest.TestCase):
+    """Тесты для данных таблицы технологического процесса."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        from design_of_mechanical_production.gui.components.table_model import ProcessTableModel
+
+        self.model = ProcessTableModel([["005", "Токарная", "1.5", "16К20"]])
+
+    def test_01_trailing_empty_row(self) -> None:
+        """Тест пустой строки в конце таблицы."""
+        self.assertEqual(self.model.rows, [["005", "Токарная", "1.5", "16К20"], ["", "", "", ""]])
+
+        self.assertTrue(self.model.update_cell(1, 0, "010"))
+        self.assertEqual(len(self.model), 3)
+        self.assertFalse(self.model.update_cell(1, 2, "2"))
+
+    def test_02_remove_empty_row(self) -> None:
+        """Тест удаления строки, у которой очищены номер, время и станок."""
+        self.assertFalse(self.model.update_cell(0, 0, ""))
+        self.assertFalse(self.model.update_cell(0, 2, ""))
+        self.assertTrue(self.model.update_cell(0, 3, ""))
+        self.assertEqual(self.model.rows, [["", "", "", ""]])
+
+    def test_03_process_data(self) -> None:
+        """Тест данных технологического процесса."""
+        self.model.set_rows([["005", "Токарная", "1.5", "16К20"], ["010", "Фрезерная", "2", "6Р12"]])
+
+        self.assertEqual(
+            self.model.process_data(),
+            [
+                {'number': "005", 'name': "Токарная", 'time': 1.5, 'machine': "16К20"},
+                {'number': "010", 'name': "Фрезерная", 'time': 2.0, 'machine': "6Р12"},
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
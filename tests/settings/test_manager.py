@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для менеджера конфигурации.
+"""
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from design_of_mechanical_production.settings.manager import ConfigManager, YamlConfigRepository, is_affected
+
+
+class TestConfigManager(unittest.TestCase):
+    """Тесты для менеджера конфигурации."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "config.yaml"
+        self.repository = YamlConfigRepository(str(self.path))
+        self.manager = ConfigManager(self.repository, {'kv': "1.0", 'specific_areas': {'tool_storage': "0.3"}})
+        self.listener = MagicMock()
+        self.manager.subscribe(self.listener)
+
+        patcher = patch('builtins.print')
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_01_transaction_writes_once(self) -> None:
+        """Тест записи файла и уведомления подписчиков один раз за транзакцию."""
+        self.manager.config  # файл создается при первом обращении
+        with patch.object(self.repository, 'save', wraps=self.repository.save) as save:
+            with self.manager.transaction():
+                self.manager.set_setting('kv', Decimal("1.1"))
+                self.manager.set_setting('specific_areas.tool_storage', "0.4")
+                with self.manager.transaction():
+                    self.manager.set_setting('kp', "1.5")
+                save.assert_not_called()
+
+        save.assert_called_once()
+        self.listener.assert_called_once_with(frozenset({'kv', 'kp', 'specific_areas.tool_storage'}))
+        self.assertEqual(self.manager.revision, 1)
+        saved = YamlConfigRepository(str(self.path)).load()
+        self.assertEqual(str(saved['kv']), "1.1")
+        self.assertEqual(str(saved['specific_areas']['tool_storage']), "0.4")
+        self.assertFalse(self.path.with_name(self.path.name + '.tmp').exists())
+
+    def test_02_transaction_rollback(self) -> None:
+        """Тест отмены изменений при исключении в транзакции."""
+        with self.assertRaises(RuntimeError):
+            with self.manager.transaction():
+                self.manager.set_setting('kv', "2.0")
+                raise RuntimeError()
+
+        self.assertEqual(self.manager.get_setting('kv'), "1.0")
+        self.assertEqual(self.manager.revision, 0)
+
+    def test_03_failed_setting_rolls_back_transaction(self) -> None:
+        """Тест отмены транзакции при ошибке изменения настройки."""
+        with self.assertRaises(ValueError):
+            with self.manager.transaction():
+                self.manager.set_setting('specific_areas.tool_storage', "0.4")
+                self.manager.set_setting('kv.nested', "2.0")
+
+        self.assertEqual(self.manager.get_setting('specific_areas.tool_storage'), "0.3")
+        self.assertEqual(self.manager.revision, 0)
+        self.assertFalse(self.path.exists() and 'nested' in self.path.read_text(encoding='utf-8'))
+
+    def test_04_failed_save_rolls_back_transaction(self) -> None:
+        """Тест отмены транзакции при ошибке записи файла настроек."""
+        self.manager.config
+        with patch.object(self.repository, 'save', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                with self.manager.transaction():
+                    self.manager.set_setting('kv', "2.0")
+
+        self.assertEqual(self.manager.get_setting('kv'), "1.0")
+        self.assertEqual(self.manager.revision, 0)
+
+    def test_05_unchanged_value(self) -> None:
+        """Тест пропуска записи, если значение не изменилось."""
+        self.manager.set_setting('kv', "1.0")
+
+        self.listener.assert_not_called()
+        self.assertEqual(self.manager.revision, 0)
+
+    def test_06_is_affected(self) -> None:
+        """Тест проверки зависимости от измененных ключей (с учетом вложенности)."""
+        self.assertTrue(is_affected({'specific_areas'}, ['specific_areas.tool_storage']))
+        self.assertTrue(is_affected({'specific_areas.tool_storage'}, ['kv', 'specific_areas']))
+        self.assertFalse(is_affected({'specific_areas.tool_storage'}, ['specific_areas.sanitary_zone']))
+        self.assertFalse(is_affected({'kv'}, ['kvx']))
+
+
+if __name__ == '__main__':
+    unittest.main()
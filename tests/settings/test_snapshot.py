@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для снимка расчетных настроек.
+"""
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from design_of_mechanical_production.core.entities import Process, Workshop
+from design_of_mechanical_production.settings import DEFAULT_CONFIG, SettingsSnapshot, settings_snapshot
+from design_of_mechanical_production.settings.manager import config_manager
+
+
+def get_default(key_path: str):
+    """Возвращает значение настройки по умолчанию."""
+    value = DEFAULT_CONFIG
+    for key in key_path.split('.'):
+        value = value[key]
+    return value
+
+
+class TestSettingsSnapshot(unittest.TestCase):
+    """Тесты для снимка расчетных настроек."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        self.snapshot = SettingsSnapshot.from_settings(get_default)
+
+    def test_01_values_are_decimal(self) -> None:
+        """Тест преобразования значений в Decimal."""
+        self.assertEqual(self.snapshot.fund_of_working, Decimal("4080"))
+        self.assertEqual(self.snapshot.kp, Decimal("1.45"))
+        self.assertEqual(self.snapshot.sanitary_zone, Decimal("8.0"))
+
+    def test_02_immutable(self) -> None:
+        """Тест неизменяемости снимка (поля фиксированы, без __dict__) и передачи в другие процессы."""
+        with self.assertRaises(FrozenInstanceError):
+            self.snapshot.kv = Decimal("1.1")
+        self.assertFalse(hasattr(self.snapshot, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(self.snapshot)), self.snapshot)
+
+    def test_03_snapshot_reset_by_changed_keys(self) -> None:
+        """Тест повторного использования снимка до изменения расчетных настроек."""
+        snapshot = settings_snapshot()
+        config_manager._notify(frozenset({'report_path'}))
+        self.assertIs(settings_snapshot(), snapshot)
+
+        config_manager._notify(frozenset({'specific_areas'}))
+        self.assertIsNot(settings_snapshot(), snapshot)
+        self.assertEqual(settings_snapshot(), snapshot)
+
+    def test_04_workshop_uses_snapshot(self) -> None:
+        """Тест расчета цеха по переданному снимку настроек."""
+        snapshot = SettingsSnapshot.from_settings(
+            lambda key: {'workshop_span': "6", 'workshop_nam': "2"}.get(key, get_default(key))
+        )
+        workshop = Workshop(
+            name="Цех",
+            production_volume=Decimal("10"),
+            mass_detail=Decimal("1"),
+            process_for_one_detail=MagicMock(spec=Process),
+            settings=snapshot,
+        )
+        workshop.length = Decimal("30")
+
+        self.assertEqual(workshop.width, Decimal("12"))
+        self.assertEqual(workshop.total_area, Decimal("360"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для пакетного расчета цехов.
+"""
+import csv
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from design_of_mechanical_production.batch import collect_input_files, main, run_batch
+from design_of_mechanical_production.data.output import ReportSummary
+
+
+class TestBatch(unittest.TestCase):
+    """Тесты для пакетного режима."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.input_dir = self.root / "input"
+        self.input_dir.mkdir()
+        for name in ("b.xlsx", "a.xlsx", "~$a.xlsx", "notes.txt"):
+            (self.input_dir / name).touch()
+
+    def test_01_collect_from_directory_and_glob(self) -> None:
+        """Тест сбора файлов из каталога и по шаблону."""
+        expected = [self.input_dir / "a.xlsx", self.input_dir / "b.xlsx"]
+        self.assertEqual(collect_input_files(self.input_dir), expected)
+        self.assertEqual(collect_input_files(str(self.input_dir / "*.xlsx")), expected)
+
+    def test_02_collect_from_manifest(self) -> None:
+        """Тест сбора файлов по манифесту."""
+        manifest = self.root / "manifest.txt"
+        manifest.write_text("# варианты\ninput/b.xlsx\n\ninput/a.xlsx\ninput/b.xlsx\n", encoding="utf-8")
+
+        self.assertEqual(collect_input_files(manifest), [self.input_dir / "b.xlsx", self.input_dir / "a.xlsx"])
+
+    @patch("design_of_mechanical_production.batch.TextReportGenerator")
+    @patch("design_of_mechanical_production.batch.create_workshop_from_data")
+    @patch("design_of_mechanical_production.batch.create_data_reader")
+    def test_03_run_batch_continues_after_failure(self, mock_reader, mock_create_workshop, mock_report) -> None:
+        """Тест пакетного расчета: ошибка в одном файле не прерывает расчет, сводная таблица сохраняется."""
+        workshop = MagicMock(total_machines_count=10, total_area=Decimal("864"))
+        workshop.name = "Цех"
+        mock_create_workshop.side_effect = [ValueError("нет данных"), workshop]
+        mock_report.return_value.export_report.return_value = True
+        output_dir = self.root / "output"
+
+        results = run_batch(self.input_dir, output_dir, workers=1)
+
+        self.assertEqual([result.ok for result in results], [False, True])
+        self.assertEqual(results[0].error, "ValueError: нет данных")
+        self.assertEqual(results[1].report_file, str(output_dir / "b_report.txt"))
+        with open(output_dir / "summary.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["status"] for row in rows], ["error", "ok"])
+        self.assertEqual(rows[1]["total_area"], "864")
+
+    @patch("builtins.print")
+    @patch("design_of_mechanical_production.batch.run_batch", return_value=[])
+    def test_04_summary_option(self, mock_run_batch, mock_print) -> None:
+        """Тест передачи параметров сводного отчета из командной строки."""
+        self.assertEqual(main([str(self.input_dir), "--summary", "5"]), 0)
+
+        self.assertEqual(mock_run_batch.call_args.kwargs["summary"], ReportSummary(top=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
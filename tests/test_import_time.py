@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для бенчмарка времени импорта.
+"""
+import unittest
+
+from benchmarks.import_time import ImportMeasurement, load_budgets, measure, parse_importtime
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       700 |      25000 |     yaml
+import time:       300 |      26000 |   design_of_mechanical_production.settings
+import time:       200 |      26200 | design_of_mechanical_production
+Traceback (most recent call last):
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """Тесты для бенчмарка времени импорта."""
+
+    def test_01_parse_importtime(self) -> None:
+        """Тест разбора вывода -X importtime."""
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(
+            [record.module for record in records][-2:],
+            ["design_of_mechanical_production.settings", "design_of_mechanical_production"],
+        )
+        self.assertEqual([record.depth for record in records], [1, 2, 1, 0])
+        self.assertEqual(records[1].cumulative_us, 25000)
+
+    def test_02_violations(self) -> None:
+        """Тест проверки бюджета."""
+        measurement = ImportMeasurement("pkg", 120.0, loaded=["pkg", "pandas"])
+        self.assertEqual(measurement.violations(100, ["pandas", "kivy"]), ["загружен pandas", "120.0 мс > 100 мс"])
+        self.assertEqual(measurement.violations(200, ["kivy"]), [])
+
+    def test_03_core_does_not_load_heavy_dependencies(self) -> None:
+        """Тест: импорт расчетного ядра не загружает тяжелые зависимости (бюджет времени не проверяется)."""
+        module = "design_of_mechanical_production.core"
+        measurement = measure(module, repeat=1)
+
+        self.assertIsNone(measurement.error)
+        self.assertIn(module, measurement.loaded)
+        forbidden = load_budgets()[module]["forbidden"]
+        self.assertEqual([name for name in forbidden if name in measurement.loaded], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
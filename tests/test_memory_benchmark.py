@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для бенчмарка памяти.
+"""
+import unittest
+
+from benchmarks.memory import VARIANTS, run_memory_benchmark
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    """Тесты для бенчмарка памяти."""
+
+    def test_01_compact_entities_use_less_memory(self) -> None:
+        """Тест замера памяти: компактные сущности и таблица операций занимают меньше памяти."""
+        results = {result.variant: result for result in run_memory_benchmark(sizes=[1000])}
+
+        self.assertEqual(set(results), {variant.name for variant in VARIANTS})
+        self.assertGreater(results['slots'].operations_bytes, 0)
+        self.assertLess(results['slots'].operations_bytes, results['dataclass'].operations_bytes)
+        self.assertLess(results['slots'].route_bytes, results['dataclass'].route_bytes)
+        self.assertLess(results['table'].route_bytes, results['slots'].route_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
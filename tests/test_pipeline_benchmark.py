@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для бенчмарка расчетного конвейера.
+"""
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks.pipeline import (
+    CASES,
+    BenchmarkResult,
+    compare_with_baseline,
+    run_benchmarks,
+    save_baseline,
+    synthetic_machine_catalog,
+    synthetic_route,
+)
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.utils.machines.catalog import get_machine_catalog
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+    """Тесты для бенчмарка расчетного конвейера."""
+
+    def test_01_synthetic_route(self) -> None:
+        """Тест синтетического маршрута: формат данных и воспроизводимость."""
+        route = synthetic_route(100, models_count=5)
+
+        self.assertEqual(len(route), 100)
+        self.assertEqual(set(route[0]), {'number', 'name', 'time', 'machine'})
+        self.assertEqual(len({row['machine'] for row in route}), 5)
+        self.assertEqual(route, synthetic_route(100, models_count=5))
+
+    def test_02_synthetic_catalog(self) -> None:
+        """Тест синтетического каталога: оборудование создает EquipmentFactory, после блока каталог отключается."""
+        with synthetic_machine_catalog() as catalog:
+            self.assertIs(get_machine_catalog(), catalog)
+            equipment = EquipmentFactory().create_equipments(["МОДЕЛЬ-001"])["МОДЕЛЬ-001"]
+
+        self.assertEqual(equipment.model, "МОДЕЛЬ-001")
+        self.assertGreater(equipment.length, 0)
+        self.assertEqual(equipment.height, Decimal("1.8"))
+        self.assertIsNot(get_machine_catalog(), catalog)
+        self.assertNotIn("МОДЕЛЬ-001", EquipmentFactory._cache)
+
+    def test_03_run_all_cases(self) -> None:
+        """Тест выполнения всех сценариев на маленьком маршруте."""
+        results = run_benchmarks(sizes=[10], repeat=1)
+
+        self.assertEqual([result.case for result in results], [case.name for case in CASES])
+        self.assertTrue(all(result.best > 0 for result in results))
+
+    def test_04_compare_with_baseline(self) -> None:
+        """Тест сравнения с базовыми результатами."""
+        baseline = [BenchmarkResult('create_process', 10, 1.0, 1.0, 1, 1)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'baseline.json'
+            save_baseline(baseline, path)
+
+            slower = [BenchmarkResult('create_process', 10, 1.5, 1.5, 1, 1)]
+            faster = [BenchmarkResult('create_process', 10, 0.9, 0.9, 1, 1)]
+            self.assertEqual(compare_with_baseline(slower, path, threshold=1.25), {'create_process[10]': 1.5})
+            self.assertEqual(compare_with_baseline(faster, path, threshold=1.25), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
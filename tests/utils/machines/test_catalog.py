@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для подключаемого каталога станков.
+"""
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from design_of_mechanical_production.core.factories import EquipmentFactory
+from design_of_mechanical_production.utils.machines.catalog import (
+    CatalogMachineFinder,
+    InMemoryMachineCatalog,
+    MachineRecord,
+    get_machine_catalog,
+    set_machine_catalog,
+)
+from design_of_mechanical_production.utils.machines.catalog_snapshot import SQLiteMachineCatalog, create_snapshot
+from design_of_mechanical_production.utils.machines.machine_map import MachineToolOperationMapCache
+
+RECORDS = [
+    MachineRecord("16К20", 1, 6, 'no', Decimal("2505"), Decimal("1190"), Decimal("1500"), "Ручная", Decimal("2835")),
+    MachineRecord("16К20Ф3", 1, 6, 'cnc', Decimal("3360"), Decimal("1710"), Decimal("1750"), "ЧПУ", Decimal("4000")),
+    MachineRecord("2Н135", 2, 1, 'no', Decimal("1030"), Decimal("825"), Decimal("2535"), "Ручная", Decimal("1200")),
+    MachineRecord("2А622Ф4", 2, 6, 'cnc', Decimal("5100"), Decimal("3800"), Decimal("3200"), "ЧПУ", Decimal("18000")),
+    MachineRecord("6Р12", 6, 1, 'ic', Decimal("2305"), Decimal("1950"), Decimal("2020"), "Цикловое", Decimal("3120")),
+]
+
+
+class TestMachineCatalog(unittest.TestCase):
+    """Тесты для каталога станков в памяти и снимка SQLite."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+
+        self.memory = InMemoryMachineCatalog(RECORDS)
+        self.snapshot = SQLiteMachineCatalog(create_snapshot(self.temp_dir / "catalog.sqlite", RECORDS))
+        self.addCleanup(self.snapshot.close)
+        self.addCleanup(set_machine_catalog, None)
+
+    def test_01_find_machines(self) -> None:
+        """Тест поиска станков по модели."""
+        for catalog in (self.memory, self.snapshot):
+            found = catalog.find_machines(["2Н135", "НЕТ-В-КАТАЛОГЕ", "16К20"])
+            self.assertEqual(list(found), ["2Н135", "16К20"])
+            self.assertEqual(found["16К20"], RECORDS[0])
+
+    def test_02_names(self) -> None:
+        """Тест поиска моделей по группе, подгруппе и типу управления (порядок каталога)."""
+        for catalog in (self.memory, self.snapshot):
+            self.assertEqual(catalog.names(), [record.name for record in RECORDS])
+            self.assertEqual(catalog.names(group=2), ["2Н135", "2А622Ф4"])
+            self.assertEqual(catalog.names(group=2, subgroups=[6, 7]), ["2А622Ф4"])
+            self.assertEqual(catalog.names(software_control=('no', 'ic')), ["16К20", "2Н135", "6Р12"])
+            self.assertEqual(catalog.names(group=1, subgroups=6, software_control='cnc'), ["16К20Ф3"])
+
+    def test_03_finder(self) -> None:
+        """Тест поисковика станков по операциям поверх каталога."""
+        finder = CatalogMachineFinder(self.snapshot)
+
+        self.assertEqual(finder.get_cnc_names(group=1), ["16К20Ф3"])
+        self.assertEqual(finder.get_no_cnc_names(), ["16К20", "2Н135", "6Р12"])
+        self.assertEqual(finder.get_names_by_condition(group=2, software_control=None), ["2Н135", "2А622Ф4"])
+
+    def test_04_equipment_factory(self) -> None:
+        """Тест создания оборудования по подключенному каталогу."""
+        set_machine_catalog(self.memory)
+        self.assertIs(get_machine_catalog(), self.memory)
+
+        equipment = EquipmentFactory().create_equipment("16К20Ф3")
+
+        self.assertEqual(equipment.length, Decimal("3.36"))
+        self.assertEqual(equipment.width, Decimal("1.71"))
+        self.assertEqual(equipment.automation, "ЧПУ")
+        self.assertEqual(equipment.power_consumption, None)
+        with self.assertRaises(SystemExit):
+            EquipmentFactory().create_equipment("НЕТ-В-КАТАЛОГЕ")
+
+    def test_05_operation_map(self) -> None:
+        """Тест построения карты операций по подключенному каталогу (без базы machine_tools)."""
+        set_machine_catalog(self.snapshot)
+
+        operation_map = MachineToolOperationMapCache(self.temp_dir / "map.json").get_map()
+
+        self.assertEqual(operation_map["Токарная"], ["16К20"])
+        self.assertEqual(operation_map["Токарная с ЧПУ"], ["16К20Ф3"])
+        self.assertEqual(operation_map["Расточная с ЧПУ"], ["2А622Ф4"])
+        self.assertEqual(operation_map["Сверлильная"], ["2Н135"])
+        self.assertEqual(operation_map["Фрезерная"], ["6Р12"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для дискового кэша карты операций.
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from design_of_mechanical_production.utils.machines.machine_map import (
+    LazyMachineToolOperationMap,
+    MachineToolOperationMapCache,
+    MachineToolOperationMapFactory,
+)
+from design_of_mechanical_production.utils.machines.machine_tool_operation_map import (
+    CNCMillingMachineToolMap,
+    CNCMultiPurposeMachineToolMap,
+    ConventionalTurningMachineToolMap,
+)
+
+
+class TestMachineToolOperationMapCache(unittest.TestCase):
+    """Тесты для кэша карты операций."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_path = Path(temp_dir.name) / "map.json"
+
+        # Каталог станков: {группа: [(имя, с ЧПУ)]}
+        self.catalog = {
+            1: [("16К20", False), ("16К20Ф3", True)],
+            6: [("6Р12", False), ("6Р13Ф3", True)],
+        }
+
+        self.finder = MagicMock()
+        self.finder.__enter__.return_value = self.finder
+        self.finder.all.side_effect = lambda: [name for items in self.catalog.values() for name, _ in items]
+        self.finder.get_names_by_condition.side_effect = lambda group=None, **kwargs: [
+            name for name, _ in self.catalog.get(group, [])
+        ]
+        self.finder.get_cnc_names.side_effect = self._names(cnc=True)
+        self.finder.get_no_cnc_names.side_effect = self._names(cnc=False)
+
+        patcher = patch(
+            "design_of_mechanical_production.utils.machines.finder.MachineFinderForOperations",
+            return_value=self.finder,
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def _names(self, cnc: bool):
+        """Функция поиска имен станков по группе для поддельного поисковика."""
+
+        def find(group=None, subgroups=None):
+            groups = [group] if group else list(self.catalog)
+            return [name for g in groups for name, is_cnc in self.catalog.get(g, []) if is_cnc == cnc]
+
+        return find
+
+    def _cache(self) -> MachineToolOperationMapCache:
+        """Кэш с сокращенным набором видов операций."""
+        factory = MachineToolOperationMapFactory.__new__(MachineToolOperationMapFactory)
+        factory.operation_getters = (
+            ConventionalTurningMachineToolMap(),
+            CNCMillingMachineToolMap(),
+            CNCMultiPurposeMachineToolMap(),
+        )
+        return MachineToolOperationMapCache(file_path=self.file_path, factory=factory)
+
+    def test_01_build_and_reuse(self) -> None:
+        """Тест первичной сборки карты и повторного использования кэша при неизменном каталоге."""
+        expected = {
+            "Токарная": ["16К20"],
+            "Фрезерная с ЧПУ": ["6Р13Ф3"],
+            "Многоцелевая с ЧПУ": ["16К20Ф3", "6Р13Ф3"],
+        }
+        self.assertEqual(self._cache().get_map(), expected)
+        self.assertTrue(self.file_path.exists())
+
+        self.finder.reset_mock()
+        cache = self._cache()
+        self.assertEqual(cache.get_map(), expected)
+        # Запуск с готовым кэшем не читает каталог (карта сверяется при промахе поиска)
+        self.finder.all.assert_not_called()
+        self.assertFalse(cache.validated)
+
+        self.assertEqual(cache.get_map(validate=True), expected)
+        self.assertTrue(cache.validated)
+        self.finder.get_cnc_names.assert_not_called()
+        self.finder.get_no_cnc_names.assert_not_called()
+
+    def test_02_partial_rebuild(self) -> None:
+        """Тест пересборки только тех видов операций, группы станков которых изменились."""
+        self._cache().get_map()
+        self.catalog[6].append(("6Т83Ф3", True))
+        self.finder.get_cnc_names.reset_mock()
+        self.finder.get_no_cnc_names.reset_mock()
+
+        result = self._cache().get_map(validate=True)
+
+        self.assertEqual(result["Фрезерная с ЧПУ"], ["6Р13Ф3", "6Т83Ф3"])
+        self.assertEqual(result["Многоцелевая с ЧПУ"], ["16К20Ф3", "6Р13Ф3", "6Т83Ф3"])
+        # токарная операция (группы 1 и 9) не пересобиралась
+        self.finder.get_no_cnc_names.assert_not_called()
+
+    def test_03_lazy_map(self) -> None:
+        """Тест отложенной сборки карты и ее инвалидации."""
+        cache = self._cache()
+        operation_map = LazyMachineToolOperationMap(cache)
+        self.finder.all.assert_not_called()
+
+        self.assertIn("Токарная", operation_map)
+        self.assertEqual(len(operation_map), 3)
+        self.assertEqual(self.finder.all.call_count, 1)
+
+        operation_map.invalidate(clear_disk_cache=True)
+        self.assertFalse(self.file_path.exists())
+        self.assertEqual(operation_map["Токарная"], ["16К20"])
+        self.assertEqual(self.finder.all.call_count, 2)
+
+    def test_04_validate_on_miss(self) -> None:
+        """Тест сверки карты из кэша с каталогом при промахе поиска станка."""
+        self._cache().get_map()
+        self.catalog[6].append(("6Т83Ф3", True))
+        operation_map = LazyMachineToolOperationMap(self._cache(), background_validation=False)
+
+        self.assertTrue(operation_map.has_machine("Фрезерная с ЧПУ", "6Р13Ф3"))
+        self.finder.all.reset_mock()
+        self.assertTrue(operation_map.has_machine("Фрезерная с ЧПУ", "6Т83Ф3"))
+        self.assertEqual(self.finder.all.call_count, 1)
+
+        # Проверенная карта повторно не сверяется
+        self.assertFalse(operation_map.has_machine("Фрезерная с ЧПУ", "16К20"))
+        self.assertEqual(self.finder.all.call_count, 1)
+
+    def test_05_snapshot_stamp(self) -> None:
+        """Тест проверки кэша по метке файла снимка каталога (без чтения каталога)."""
+        snapshot = self.file_path.with_name("catalog.sqlite")
+        snapshot.write_bytes(b"1")
+        catalog = MagicMock(path=snapshot)
+        with patch(
+            "design_of_mechanical_production.utils.machines.machine_map.get_machine_catalog", return_value=catalog
+        ):
+            self._cache().get_map()
+            self.finder.all.reset_mock()
+
+            cache = self._cache()
+            cache.get_map()
+            self.finder.all.assert_not_called()
+            self.assertTrue(cache.validated)
+
+            snapshot.write_bytes(b"22")
+            self._cache().get_map()
+            self.assertEqual(self.finder.all.call_count, 1)
+
+    def test_06_background_validation(self) -> None:
+        """Тест фоновой сверки карты из кэша с каталогом после запуска (удаленный станок больше не предлагается)."""
+        self._cache().get_map()
+        self.catalog[6].remove(("6Р13Ф3", True))
+        self.finder.all.reset_mock()
+        operation_map = LazyMachineToolOperationMap(self._cache())
+
+        self.assertIn("Фрезерная с ЧПУ", operation_map)
+        operation_map.wait_validation(timeout=5)
+
+        self.assertEqual(self.finder.all.call_count, 1)
+        self.assertNotIn("Фрезерная с ЧПУ", operation_map)
+        self.assertFalse(operation_map.has_machine("Многоцелевая с ЧПУ", "6Р13Ф3"))
+        self.assertEqual(self.finder.all.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Тесты для поискового индекса моделей станков.
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from design_of_mechanical_production.utils.machines.machine_map import LazyMachineToolOperationMap
+from design_of_mechanical_production.utils.machines.name_index import MachineNameIndex
+
+NAMES = ["16К20", "16К20Ф3", "16К20Ф3С32", "1А616", "2Н135", "16к20т1", "16К20"]
+
+
+class TestMachineNameIndex(unittest.TestCase):
+    """Тесты для поискового индекса моделей станков."""
+
+    def setUp(self) -> None:
+        """Подготовка тестовых данных."""
+        self.index = MachineNameIndex(NAMES)
+
+    def test_01_search_matches_substring_scan(self) -> None:
+        """Тест совпадения результатов с полным перебором (без учета регистра, повторы пропущены)."""
+        for query in ["", "1", "6к", "20Ф", "К20Ф3С", "16к20", "616", "Ф4", "16К20Ф3С32Х"]:
+            expected = {name for name in dict.fromkeys(NAMES) if query.lower() in name.lower()}
+            self.assertEqual(set(self.index.search(query, limit=100)), expected, query)
+
+    def test_02_ranking(self) -> None:
+        """Тест ранжирования: точное совпадение, начало названия, положение совпадения, длина."""
+        self.assertEqual(self.index.search("16к20"), ["16К20", "16К20Ф3", "16к20т1", "16К20Ф3С32"])
+        self.assertEqual(self.index.search("20"), ["16К20", "16К20Ф3", "16к20т1", "16К20Ф3С32"])
+        self.assertEqual(self.index.search("6", limit=3), ["16К20", "16К20Ф3", "16к20т1"])
+
+    def test_03_contains(self) -> None:
+        """Тест проверки принадлежности модели (с учетом регистра)."""
+        self.assertIn("16К20Ф3", self.index)
+        self.assertNotIn("16к20ф3", self.index)
+        self.assertEqual(len(self.index), 6)
+
+    def test_04_shared_index(self) -> None:
+        """Тест общего индекса для вида операции в карте операций."""
+        cache = MagicMock()
+        cache.get_map.return_value = {"Токарная": NAMES}
+        operation_map = LazyMachineToolOperationMap(cache)
+
+        index = operation_map.name_index("Токарная")
+
+        self.assertIs(operation_map.name_index("Токарная"), index)
+        operation_map.invalidate()
+        self.assertIsNot(operation_map.name_index("Токарная"), index)
+
+
+if __name__ == '__main__':
+    unittest.main()